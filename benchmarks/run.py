@@ -0,0 +1,323 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+"""
+Benchmarks of loading, parsing, validating and printing the example APIs
+in ``tests/data``.  Runs offline, reporting the time per call and the
+peak memory allocated by one call of each benchmark.
+
+Usage::
+
+    $ python benchmarks/run.py                       # run all
+    $ python benchmarks/run.py -k github             # run matching names
+    $ python benchmarks/run.py --save baseline.json  # store results
+    $ python benchmarks/run.py --compare benchmarks/baseline.json
+
+With ``--compare``, exits with status 1 if any benchmark got slower, or
+allocated more memory, than the baseline by more than ``--threshold``
+(``--fast-threshold`` for benchmarks taking less than a millisecond,
+whose timings are noisier).  Times are compared relative to a reference
+workload timed in the same run, which takes out most of the difference
+between machines and between busy and idle ones.  Still, save the
+baseline on the machine you compare on, before making your change: the
+committed ``baseline.json`` only shows the expected magnitudes.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:  # NOCOV
+    tracemalloc = None
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import ramlfications  # NOQA
+from ramlfications import tree, utils  # NOQA
+from ramlfications.config import setup_config  # NOQA
+from ramlfications.errors import InvalidRAMLError  # NOQA
+from ramlfications.generate import generate  # NOQA
+from ramlfications.parser import parse_raml  # NOQA
+
+DATA = os.path.join(os.path.dirname(HERE), "tests", "data")
+EXAMPLES = os.path.join(DATA, "examples")
+JSONREF = os.path.join(DATA, "jsonref")
+UPDATE = os.path.join(DATA, "update")
+
+SPECS = {
+    "github": ("github.raml", "github-config.ini"),
+    "twitter": ("twitter.raml", "twitter-config.ini"),
+    "complete": ("complete-valid-example.raml", "test-config.ini"),
+}
+
+JSONREF_SPECS = {
+    "internal": "jsonref_internal_fragment.raml",
+    "multiref": "jsonref_multiref_internal_fragment.raml",
+    "includes": "jsonref_relative_local_includes.raml",
+    "recursive": "jsonref_recursive.raml",
+}
+
+# name -> function returning the callable to measure
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    def decorator(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+def _spec(name):
+    raml_file, config_file = SPECS[name]
+    return (os.path.join(EXAMPLES, raml_file),
+            os.path.join(EXAMPLES, config_file))
+
+
+def _validate(loaded, config):
+    # collecting the errors of an invalid API is part of the work
+    try:
+        parse_raml(loaded, config)
+    except InvalidRAMLError:
+        pass
+
+
+def _register_specs():
+    for name in SPECS:
+        raml_file, config_file = _spec(name)
+
+        @benchmark("load.{0}".format(name))
+        def load(raml_file=raml_file):
+            return lambda: ramlfications.load(raml_file)
+
+        @benchmark("parse.{0}".format(name))
+        def parse(raml_file=raml_file, config_file=config_file):
+            loaded = ramlfications.load(raml_file)
+            config = setup_config(config_file)
+            return lambda: parse_raml(loaded, config)
+
+        @benchmark("validate.{0}".format(name))
+        def validate(raml_file=raml_file, config_file=config_file):
+            loaded = ramlfications.load(raml_file)
+            config = setup_config(config_file)
+            config["validate"] = True
+            return lambda: _validate(loaded, config)
+
+        @benchmark("tree.{0}".format(name))
+        def tree_(raml_file=raml_file, config_file=config_file):
+            api = ramlfications.parse(raml_file, config_file)
+            resources = tree._get_tree(api)
+            return lambda: tree._print_tree(api, resources, "light", 3,
+                                            io.StringIO())
+
+    for name, raml_file in JSONREF_SPECS.items():
+        @benchmark("load.jsonref.{0}".format(name))
+        def load_jsonref(raml_file=os.path.join(JSONREF, raml_file)):
+            return lambda: ramlfications.load(raml_file)
+
+
+_register_specs()
+
+# shapes of generated APIs, see ramlfications.generate
+GENERATED = {
+    "wide": dict(resources=100, depth=1, methods=3, traits=4, params=4),
+    "deep": dict(resources=5, depth=12, methods=2, traits=2, params=2),
+    "traits": dict(resources=20, depth=2, methods=3, traits=40,
+                   resource_types=20, params=8),
+}
+
+
+def _register_generated():
+    for name, shape in GENERATED.items():
+        raml = generate(includes=0, **shape)["api.raml"]
+
+        @benchmark("parse.generated.{0}".format(name))
+        def parse(raml=raml):
+            loaded = ramlfications.loads(raml)
+            config = setup_config()
+            return lambda: parse_raml(loaded, config)
+
+
+_register_generated()
+
+
+@benchmark("utils.load_schema.json")
+def load_schema_json():
+    with open(os.path.join(JSONREF, "jsonref_example.json")) as f:
+        data = f.read()
+    return lambda: utils.load_schema(data)
+
+
+@benchmark("utils.load_schema.xml")
+def load_schema_xml():
+    data = "<widgets>" + "<widget><id>1</id></widget>" * 100 + "</widgets>"
+    return lambda: utils.load_schema(data)
+
+
+@benchmark("utils.get_data_union")
+def get_data_union():
+    loaded = ramlfications.load(_spec("github")[0])
+    types = dict(list(t.items())[0] for t in loaded["resourceTypes"])
+    child, parent = types["item"], types["collection"]
+    return lambda: utils._get_data_union(child, parent)
+
+
+@benchmark("utils.parse_iana")
+def parse_iana():
+    with open(os.path.join(UPDATE, "iana_mime_media_types.xml"), "rb") as f:
+        data = f.read()
+    return lambda: utils._parse_xml_stream(io.BytesIO(data))
+
+
+def reference():
+    """
+    Pure Python work independent of ``ramlfications``, timed in every run
+    so that timings of different runs can be compared as ratios to it.
+    """
+    data = [{"name": str(i), "tags": [i, -i]} for i in range(2000)]
+
+    def work():
+        names = {}
+        for item in data:
+            names.setdefault(item["name"][-1], []).append(sum(item["tags"]))
+        return sorted(data, key=lambda item: item["name"])
+    return work
+
+
+def measure(func, repeat, min_time=0.2):
+    """Returns best seconds per call, and peak bytes allocated by a call."""
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    best = min(timer.repeat(repeat, number)) / number
+
+    peak = None
+    if tracemalloc is not None:
+        tracemalloc.start()
+        try:
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return best, peak
+
+
+def _relative(time, reference):
+    # baselines saved without a reference time compare absolute times
+    return time / reference if reference else time
+
+
+def compare(results, baseline, threshold, fast_threshold=None,
+            reference=None, base_reference=None):
+    """
+    Returns names of benchmarks that regressed beyond ``threshold``, or
+    ``fast_threshold`` for benchmarks taking less than a millisecond.
+    Times are compared relative to the ``reference`` times of each run.
+    """
+    if fast_threshold is None:
+        fast_threshold = threshold
+    if not (reference and base_reference):
+        reference = base_reference = None
+    regressions = []
+    for name, result in sorted(results.items()):
+        base = baseline.get(name)
+        if base is None:
+            continue
+        allowed = threshold if base["time"] >= 1e-3 else fast_threshold
+        slower = (_relative(result["time"], reference) >
+                  _relative(base["time"], base_reference) * (1 + allowed))
+        bigger = (result["peak"] is not None and base["peak"] and
+                  result["peak"] > base["peak"] * (1 + threshold))
+        if slower or bigger:
+            regressions.append(name)
+    return regressions
+
+
+def _format(result, base=None, reference=None, base_reference=None):
+    line = "{0:>12.1f} us {1:>12}".format(
+        result["time"] * 1e6,
+        "-" if result["peak"] is None else "{0:,} B".format(result["peak"]))
+    if base:
+        if not (reference and base_reference):
+            reference = base_reference = None
+        line += "  {0:>+7.1%} time".format(
+            _relative(result["time"], reference) /
+            _relative(base["time"], base_reference) - 1)
+        if result["peak"] is not None and base["peak"]:
+            line += " {0:>+7.1%} memory".format(
+                result["peak"] / base["peak"] - 1)
+    return line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-k", dest="match", default="",
+                        help="Only run benchmarks whose name contains this.")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="Timing runs per benchmark, best one counts.")
+    parser.add_argument("--save", metavar="PATH",
+                        help="Write results to a JSON file.")
+    parser.add_argument("--compare", metavar="PATH",
+                        help="Compare results with a saved JSON file.")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed slowdown vs. the baseline (0.25 = 25%%)")
+    parser.add_argument("--fast-threshold", type=float, default=0.75,
+                        help="Allowed slowdown of benchmarks taking less "
+                             "than a millisecond.")
+    args = parser.parse_args(argv)
+
+    baseline, base_reference = {}, None
+    if args.compare:
+        with open(args.compare) as f:
+            data = json.load(f)
+        baseline = data["benchmarks"]
+        base_reference = data.get("reference")
+
+    ref_time = measure(reference(), args.repeat)[0]
+    print("{0:<32}{1:>12.1f} us".format("(reference)", ref_time * 1e6))
+
+    results = {}
+    for name in sorted(BENCHMARKS):
+        if args.match not in name:
+            continue
+        func = BENCHMARKS[name]()
+        best, peak = measure(func, args.repeat)
+        results[name] = {"time": best, "peak": peak}
+        print("{0:<32}{1}".format(name, _format(
+            results[name], baseline.get(name), ref_time, base_reference)))
+
+    if args.save:
+        data = {
+            "ramlfications": ramlfications.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "reference": ref_time,
+            "benchmarks": results,
+        }
+        with open(args.save, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    if args.compare:
+        regressions = compare(results, baseline, args.threshold,
+                              args.fast_threshold, ref_time, base_reference)
+        if regressions:
+            print("\nRegressed by more than {0:.0%} ({1:.0%} under 1 ms): "
+                  "{2}".format(args.threshold, args.fast_threshold,
+                               ", ".join(regressions)))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
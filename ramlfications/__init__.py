@@ -12,39 +12,53 @@ __uri__ = "https://ramlfications.readthedocs.org"
 __description__ = "A Python RAML parser"
 
 
-from ramlfications.config import setup_config
+import gc
+
+from ramlfications.changes import diff  # NOQA
+from ramlfications.config import load_config, setup_config  # NOQA
 from ramlfications.parser import parse_raml
+from ramlfications import serialize
+from ramlfications.stats import ParseStats  # NOQA
 
 from ramlfications._helpers import load_file, load_string
 
 
-def load(raml_file):
+def load(raml_file, flatten_refs=False, ref_cache=None):
     """
     Module helper function to load a RAML File using \
     :py:class:`.loader.RAMLLoader`.
 
     :param str raml_file: String path to RAML file
+    :param bool flatten_refs: Resolve ``$ref`` s in included JSON schemas \
+        into plain ``dict`` s rather than lazy proxies.
+    :param RefCache ref_cache: Fetches and caches remote ``$ref`` targets \
+        of included JSON schemas (see :py:class:`.refcache.RefCache`).
     :return: loaded RAML
     :rtype: dict
     :raises LoadRAMLError: If error occurred trying to load the RAML file
     """
-    return load_file(raml_file)
+    return load_file(raml_file, flatten_refs, ref_cache)
 
 
-def loads(raml_string):
+def loads(raml_string, flatten_refs=False, ref_cache=None):
     """
     Module helper function to load a RAML File using \
     :py:class:`.loader.RAMLLoader`.
 
     :param str raml_string: String of RAML data
+    :param bool flatten_refs: Resolve ``$ref`` s in included JSON schemas \
+        into plain ``dict`` s rather than lazy proxies.
+    :param RefCache ref_cache: Fetches and caches remote ``$ref`` targets \
+        of included JSON schemas (see :py:class:`.refcache.RefCache`).
     :return: loaded RAML
     :rtype: dict
     :raises LoadRAMLError: If error occurred trying to load the RAML file
     """
-    return load_string(raml_string)
+    return load_string(raml_string, flatten_refs, ref_cache)
 
 
-def parse(raml, config_file=None):
+def parse(raml, config_file=None, flatten_refs=False, ref_cache=None,
+          stats=None):
     """
     Module helper function to parse a RAML File.  First loads the RAML file
     with :py:class:`.loader.RAMLLoader` then parses with
@@ -54,6 +68,13 @@ def parse(raml, config_file=None):
     :param raml: Either string path to the RAML file, a file object, or \
         a string representation of RAML.
     :param str config_file:  String path to desired config file, if any.
+    :param bool flatten_refs: Resolve ``$ref`` s in included JSON schemas \
+        into plain ``dict`` s rather than lazy proxies.
+    :param RefCache ref_cache: Fetches and caches remote ``$ref`` targets \
+        of included JSON schemas (see :py:class:`.refcache.RefCache`).
+    :param ParseStats stats: Records the time spent in each phase of \
+        loading & parsing, and the number of objects created, if given; \
+        filled in even when parsing fails.
     :return: parsed API
     :rtype: RAMLRoot
     :raises LoadRAMLError: If error occurred trying to load the RAML file
@@ -65,12 +86,12 @@ def parse(raml, config_file=None):
     :raises InvalidParameterError: Named parameter is invalid \
         according to RAML `specification <http://raml.org/spec.html>`_.
     """
-    loader = load(raml)
-    config = setup_config(config_file)
-    return parse_raml(loader, config)
+    loader = load_file(raml, flatten_refs, ref_cache, stats)
+    config = load_config(config_file)
+    return parse_raml(loader, config, stats)
 
 
-def validate(raml, config_file=None):
+def validate(raml, config_file=None, max_errors=None, stats=None):
     """
     Module helper function to validate a RAML File.  First loads \
     the RAML file \
@@ -80,6 +101,10 @@ def validate(raml, config_file=None):
     :param str raml: Either string path to the RAML file, a file object, \or
         a string representation of RAML.
     :param str config_file:  String path to desired config file, if any.
+    :param int max_errors: Stop parsing as soon as this many validation \
+        errors have been found, if any.  Defaults to collecting all errors.
+    :param ParseStats stats: Records the time spent in each phase, if \
+        given; filled in even when validation fails.
     :return: No return value if successful
     :raises LoadRAMLError: If error occurred trying to load the RAML file
         (see :py:class:`.loader.RAMLLoader`)
@@ -92,7 +117,88 @@ def validate(raml, config_file=None):
     :raises InvalidRAMLError: RAML file is invalid according to RAML \
         `specification <http://raml.org/spec.html>`_.
     """
-    loader = load(raml)
-    config = setup_config(config_file)
-    config["validate"] = True
-    parse_raml(loader, config)
+    loader = load_file(raml, stats=stats)
+    config = dict(load_config(config_file), validate=True,
+                  max_errors=max_errors)
+    parse_raml(loader, config, stats)
+
+
+def load_parsed(fileobj):
+    """
+    Module helper function to load an API that was parsed and then
+    serialized with :py:meth:`.raml.RootNode.dump`.
+
+    .. warning::
+        The file is unpickled, which can run arbitrary code.  Only load
+        files you serialized yourself, or got from a source you trust.
+
+    :param fileobj: File object opened in binary mode
+    :return: parsed API
+    :rtype: RootNode
+    :raises LoadRAMLError: If the file object does not contain a parsed API \
+        serialized by this version of ``ramlfications``.
+    """
+    return serialize.load(fileobj)
+
+
+def _warm(root):
+    """
+    Computes what a parsed API otherwise computes and keeps on first
+    use: its fingerprints and its route & resource indexes.
+    """
+    from ramlfications.fingerprint import fingerprint
+    fingerprint(root)
+    root._route_index()
+    root._resource_index()
+
+
+def preload(specs, config_file=None):
+    """
+    Module helper function to parse RAML files in the master process of a
+    prefork server (e.g. ``gunicorn`` with ``preload_app``), so that its
+    workers share the parsed APIs rather than each holding a copy.
+
+    ``$ref`` s of JSON schemas are resolved while loading (see
+    ``flatten_refs`` of :py:func:`parse`).  Equal parameters, bodies,
+    responses and schemas are shared between the APIs, and their strings
+    are interned (as in :py:class:`.registry.SpecRegistry`).  The indexes
+    built on first use, and the fingerprints, are built now rather than
+    in each worker.
+
+    What is left over from loading is collected, and the APIs are moved
+    out of the garbage collector's reach with :py:func:`gc.freeze`
+    (Python 3.7+), so that collections in the workers do not write to
+    the pages holding them.  Reference counts are still written to as
+    the workers use the APIs.
+
+    :param specs: Paths of the RAML files
+    :param str config_file: String path to desired config file, if any.
+    :return: parsed APIs, in the order of ``specs``
+    :rtype: ``list`` of :py:class:`.raml.RootNode`
+    :raises LoadRAMLError: If error occurred trying to load a RAML file
+    :raises InvalidRAMLError: If a RAML file is invalid according to RAML \
+        `specification <http://raml.org/spec.html>`_.
+    """
+    from ramlfications.registry import _Interner
+
+    enabled = gc.isenabled()
+    # no collections in between, which would leave freed gaps among
+    # the pages of the APIs
+    gc.disable()
+    try:
+        interner = _Interner()
+        roots = []
+        for raml_file in specs:
+            # no lazy jsonref proxies for the workers to resolve
+            root = parse(raml_file, config_file, flatten_refs=True)
+            interner.add(root)
+            _warm(root)
+            roots.append(root)
+        del interner
+        gc.collect()
+        if hasattr(gc, "freeze"):
+            gc.freeze()
+    finally:
+        if enabled:
+            gc.enable()
+    return roots
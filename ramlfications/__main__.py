@@ -4,14 +4,21 @@
 
 from __future__ import absolute_import, division, print_function
 
+import os
+import py_compile
+
 import click
 
 from .tree import tree as ttree
 from .errors import InvalidRAMLError
+from .generate import write as gwrite
+from .memory import peak_memory
+from .serialize import dumps_module
+from .stats import ParseStats
 from .utils import update_mime_types as umt
 from ._helpers import load_file
 
-from ramlfications import validate as vvalidate
+from ramlfications import diff as ddiff, parse as pparse, validate as vvalidate
 
 
 @click.group()
@@ -24,10 +31,21 @@ def main():
 @click.argument("ramlfile", type=click.Path(exists=True))
 @click.option("--config", "-c", type=click.Path(exists=True),
               help="Additionally supported items beyond RAML spec.")
-def validate(ramlfile, config):
+@click.option("--fail-fast", default=False, is_flag=True,
+              help="Stop at the first validation error.")
+@click.option("--timings", default=False, is_flag=True,
+              help="Print the time spent in each phase of parsing.")
+@click.option("--daemon", "socket_path", type=click.Path(exists=True),
+              help="Have the daemon listening on this socket validate.")
+def validate(ramlfile, config, fail_fast, timings, socket_path):
     """Validate a given RAML file."""
+    max_errors = 1 if fail_fast else None
+    if socket_path is not None:
+        return _validate_with_daemon(ramlfile, config, max_errors,
+                                     socket_path)
+    stats = ParseStats() if timings else None
     try:
-        vvalidate(ramlfile, config)
+        vvalidate(ramlfile, config, max_errors=max_errors, stats=stats)
         click.secho("Success! Valid RAML file: {0}".format(ramlfile),
                     fg="green")
 
@@ -35,6 +53,51 @@ def validate(ramlfile, config):
         msg = "Error validating file {0}: \n{1}".format(ramlfile, e)
         click.secho(msg, fg="red", err=True)
         raise SystemExit(1)
+    finally:
+        if stats is not None:
+            click.echo(stats.format(), err=True)
+
+
+def _validate_with_daemon(ramlfile, config, max_errors, socket_path):
+    import socket
+    from .daemon import request
+    try:
+        result = request(socket_path, ramlfile, config, max_errors)
+    except socket.error as e:
+        msg = "No validation daemon at {0}: {1}".format(
+            click.format_filename(socket_path), e)
+        click.secho(msg, fg="red", err=True)
+        raise SystemExit(2)
+    if result["valid"]:
+        click.secho("Success! Valid RAML file: {0}".format(ramlfile),
+                    fg="green")
+        return
+    errors = "".join("\n\t" + e for e in result["errors"])
+    msg = "Error validating file {0}: \n{1}".format(ramlfile, errors)
+    click.secho(msg, fg="red", err=True)
+    raise SystemExit(1)
+
+
+@main.command(help="Validate RAML files sent to a local socket.")
+@click.option("--socket", "socket_path", required=True, type=click.Path(),
+              help="Path of the Unix socket to listen on.")
+@click.option("-c", "--config", type=click.Path(exists=True),
+              help="Additionally supported items beyond RAML spec.")
+def serve(socket_path, config):
+    """Validate RAML files for ``validate --daemon`` clients."""
+    from .daemon import ValidationServer
+    try:
+        server = ValidationServer(socket_path, config)
+    except IOError as e:
+        click.secho(str(e), fg="red", err=True)
+        raise SystemExit(1)
+    click.echo("Validating RAML files sent to {0}".format(socket_path))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
 
 
 @main.command(help="Visualize the RAML file as a tree.")
@@ -50,16 +113,143 @@ def validate(ramlfile, config):
               help="Validate RAML file")
 @click.option("-c", "--config", type=click.Path(exists=True),
               help="Additionally supported items beyond RAML spec.")
-def tree(ramlfile, color, output, verbose, validate, config):
+@click.option("--timings", default=False, is_flag=True,
+              help="Print the time spent in each phase of parsing.")
+def tree(ramlfile, color, output, verbose, validate, config, timings):
     """Pretty-print a tree of the RAML-defined API."""
+    stats = ParseStats() if timings else None
     try:
-        load_obj = load_file(ramlfile)
-        ttree(load_obj, color, output, verbose, validate, config)
+        load_obj = load_file(ramlfile, stats=stats)
+        ttree(load_obj, color, output, verbose, validate, config, stats)
     except InvalidRAMLError as e:
         msg = '"{0}" is not a valid RAML file: {1}'.format(
             click.format_filename(ramlfile), e)
         click.secho(msg, fg="red", err=True)
         raise SystemExit(1)
+    finally:
+        if stats is not None:
+            click.echo(stats.format(), err=True)
+
+
+@main.command(help="Serve the RAML file's examples from a mock server.")
+@click.argument("ramlfile", type=click.Path(exists=True))
+@click.option("-c", "--config", type=click.Path(exists=True),
+              help="Additionally supported items beyond RAML spec.")
+@click.option("-H", "--host", default="127.0.0.1",
+              help="Address to listen on.")
+@click.option("-p", "--port", default=8080, type=int,
+              help="Port to listen on.")
+@click.option("-v", "--verbose", default=False, is_flag=True,
+              help="Log each request.")
+def mock(ramlfile, config, host, port, verbose):
+    """Serve example responses of a RAML-defined API."""
+    try:
+        api = pparse(ramlfile, config)
+    except InvalidRAMLError as e:
+        msg = '"{0}" is not a valid RAML file: {1}'.format(
+            click.format_filename(ramlfile), e)
+        click.secho(msg, fg="red", err=True)
+        raise SystemExit(1)
+
+    from .mockserver import MockServer  # pulls in the HTTP server modules
+    server = MockServer(api, host, port, verbose)
+    click.echo("Serving {0} at {1}".format(ramlfile, server.url))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+@main.command(help="Report the memory retained by the parsed RAML file.")
+@click.argument("ramlfile", type=click.Path(exists=True))
+@click.option("-c", "--config", type=click.Path(exists=True),
+              help="Additionally supported items beyond RAML spec.")
+@click.option("-n", "--top", default=None, type=int,
+              help="Only list the largest N classes.")
+def memory(ramlfile, config, top):
+    """Break down the memory of a parsed API by class."""
+    try:
+        api, peak = peak_memory(pparse, ramlfile, config)
+    except InvalidRAMLError as e:
+        msg = '"{0}" is not a valid RAML file: {1}'.format(
+            click.format_filename(ramlfile), e)
+        click.secho(msg, fg="red", err=True)
+        raise SystemExit(1)
+    click.echo(api.memory_report(peak).format(top))
+
+
+@main.command(help="Compare the APIs of two RAML files.")
+@click.argument("old", type=click.Path(exists=True))
+@click.argument("new", type=click.Path(exists=True))
+@click.option("-c", "--config", type=click.Path(exists=True),
+              help="Additionally supported items beyond RAML spec.")
+def diff(old, new, config):
+    """List what was added, removed and changed from OLD to NEW."""
+    apis = []
+    for ramlfile in (old, new):
+        try:
+            apis.append(pparse(ramlfile, config))
+        except InvalidRAMLError as e:
+            msg = '"{0}" is not a valid RAML file: {1}'.format(
+                click.format_filename(ramlfile), e)
+            click.secho(msg, fg="red", err=True)
+            raise SystemExit(1)
+    changes = ddiff(*apis)
+    for change in changes:
+        click.echo(str(change))
+    if changes:
+        raise SystemExit(1)
+
+
+@main.command(name="compile",
+              help="Compile a RAML file into an importable Python module.")
+@click.argument("ramlfile", type=click.Path(exists=True))
+@click.option("-o", "--output", type=click.Path(dir_okay=False),
+              help="Python file to write, along with its bytecode; "
+                   "defaults to printing the module.")
+@click.option("-c", "--config", type=click.Path(exists=True),
+              help="Additionally supported items beyond RAML spec.")
+def compile_module(ramlfile, output, config):
+    """Write a module whose ``api`` is the parsed RAML file."""
+    try:
+        api = pparse(ramlfile, config)
+    except InvalidRAMLError as e:
+        msg = '"{0}" is not a valid RAML file: {1}'.format(
+            click.format_filename(ramlfile), e)
+        click.secho(msg, fg="red", err=True)
+        raise SystemExit(1)
+
+    source = dumps_module(api, os.path.basename(ramlfile))
+    if not output:
+        click.echo(source, nl=False)
+        return
+    with open(output, "w") as f:
+        f.write(source)
+    # so that importing the module does not compile it, e.g. from a
+    # read-only file system
+    py_compile.compile(output, doraise=True)
+    click.echo("Compiled {0} into {1}".format(ramlfile, output))
+
+
+@main.command(help="Generate a synthetic RAML file for scaling tests.")
+@click.argument("directory", type=click.Path(file_okay=False))
+@click.option("--resources", default=10, help="Top-level resources.")
+@click.option("--depth", default=2, help="Nesting depth of resources.")
+@click.option("--methods", default=2, help="HTTP methods per resource.")
+@click.option("--traits", default=2, help="Number of traits.")
+@click.option("--resource-types", default=2, help="Number of resource types.")
+@click.option("--security-schemes", default=1,
+              help="Number of security schemes.")
+@click.option("--schemas", default=2, help="Number of JSON schemas.")
+@click.option("--includes", default=1,
+              help="JSON schemas to include from separate files.")
+@click.option("--params", default=2, help="Parameters per method.")
+@click.option("--seed", default=0, help="Seed for random choices.")
+def generate(directory, **kwargs):
+    """Write a generated RAML file and its includes into a directory."""
+    click.echo(gwrite(directory, **kwargs))
 
 
 @main.command(help="Update RAMLfications' supported MIME types from IANA.")
@@ -9,20 +9,64 @@ import os
 
 import six
 
+from .config import load_config
 from .errors import LoadRAMLError
-from .loader import RAMLLoader
+from .loader import RAMLLoader, _file_identity
+from .parser import parse_raml
 
 
-def load_file(raml_file):
+def load_file(raml_file, flatten_refs=False, ref_cache=None, stats=None):
     try:
         with _get_raml_object(raml_file) as raml:
-            return RAMLLoader().load(raml)
+            return RAMLLoader(flatten_refs, ref_cache, stats).load(raml)
     except IOError as e:
         raise LoadRAMLError(e)
 
 
-def load_string(raml_str):
-    return RAMLLoader().load(raml_str)
+def load_string(raml_str, flatten_refs=False, ref_cache=None, stats=None):
+    return RAMLLoader(flatten_refs, ref_cache, stats).load(raml_str)
+
+
+def _changed(files):
+    """
+    Whether any of ``files``, as returned by :py:func:`_parse_tracked`,
+    changed since.
+    """
+    return any(_file_identity(f) != i for f, i in files.items())
+
+
+def _parse_tracked(raml_file, config_file=None, max_errors=None,
+                   ref_cache=None, include_cache=None):
+    """
+    Parses and validates a RAML file, noting the files read to do so.
+
+    :returns: ``(files, root, error)``: the modification time & size \
+        of the RAML file, the config file and the included and \
+        ``$ref`` d files, taken before reading them; the parsed API, or \
+        ``None``; and the exception that stopped parsing, or ``None``.
+    """
+    files = [raml_file] + ([config_file] if config_file else [])
+    # identities before reading, so that a change made while parsing is
+    # seen as a change afterwards
+    identities = dict((f, _file_identity(f)) for f in files)
+    loader = RAMLLoader(ref_cache=ref_cache, include_cache=include_cache)
+    root = error = None
+    try:
+        try:
+            with _get_raml_object(raml_file) as raml:
+                loaded = loader.load(raml)
+        except IOError as e:
+            raise LoadRAMLError(e)
+        config = dict(load_config(config_file), validate=True,
+                      max_errors=max_errors)
+        root = parse_raml(loaded, config)
+    except Exception as e:
+        # e.g. YAML syntax errors: whatever went wrong is the caller's
+        # to report
+        error = e
+    for include in loader.includes:
+        identities.setdefault(include, _file_identity(include))
+    return identities, root, error
 
 
 def _get_raml_object(raml_file):
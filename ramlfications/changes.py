@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+__all__ = ["Change", "diff"]
+
+import attr
+
+from .fingerprint import hash_value, semantic_fields
+
+PARAM_KINDS = [
+    ("uri_params", "uri_param"),
+    ("base_uri_params", "base_uri_param"),
+    ("query_params", "query_param"),
+    ("form_params", "form_param"),
+    ("headers", "header"),
+]
+
+# Definitions of the root, compared by name: (attribute, kind, key)
+DEFINITIONS = [
+    ("traits", "trait", lambda t: t.name),
+    ("resource_types", "resource_type",
+     lambda r: "{0} {1}".format(r.name, r.method.upper())
+     if r.method else r.name),
+    ("security_schemes", "security_scheme", lambda s: s.name),
+]
+
+# Compared item by item rather than as attributes of their owner
+ROOT_COLLECTIONS = frozenset([k for k, _ in PARAM_KINDS] + [
+    k for k, _, _ in DEFINITIONS] + ["resources"])
+NODE_COLLECTIONS = frozenset([k for k, _ in PARAM_KINDS] + [
+    "body", "responses"
+])
+RESPONSE_COLLECTIONS = frozenset(["headers", "body"])
+
+SYMBOLS = {"added": "+", "removed": "-", "changed": "~"}
+
+
+@attr.s
+class Change(object):
+    """
+    One difference between two parsed APIs.
+
+    :param str change: ``added``, ``removed`` or ``changed``
+    :param str kind: What changed: ``root``, ``trait``, \
+        ``resource_type``, ``security_scheme``, ``resource``, ``method``, \
+        ``uri_param``, ``base_uri_param``, ``query_param``, ``form_param``, \
+        ``header``, ``body``, ``response``, ``response_header`` or \
+        ``response_body``
+    :param str path: Path of the resource, or ``None`` for the API root
+    :param str method: HTTP method of the resource, or ``None``
+    :param str name: Name of the trait, security scheme, parameter or \
+        header, name and method of the resource type (e.g. \
+        ``"collection GET"``), MIME type of the body, or response code; \
+        response headers & bodies are prefixed with the response code, \
+        e.g. ``"200 application/json"``.
+    :param list fields: Names of the changed attributes, if ``changed``
+    """
+    change = attr.ib()
+    kind   = attr.ib()
+    path   = attr.ib(default=None)
+    method = attr.ib(default=None)
+    name   = attr.ib(default=None)
+    fields = attr.ib(default=None)
+
+    def __str__(self):
+        parts = [SYMBOLS[self.change], self.kind]
+        if self.method:
+            parts.append(self.method.upper())
+        if self.path:
+            parts.append(self.path)
+        if self.name is not None:
+            parts.append(str(self.name))
+        text = " ".join(parts)
+        if self.fields:
+            text += " ({0})".format(", ".join(self.fields))
+        return text
+
+
+def _changed_fields(old, new, skip=()):
+    return [name for name in semantic_fields(old) if name not in skip and
+            hash_value(getattr(old, name)) != hash_value(getattr(new, name))]
+
+
+def _index(items, key):
+    return dict((key(i), i) for i in items or [])
+
+
+def _compare(changes, kind, old_items, new_items, key, path=None,
+             method=None, prefix="", nested=None, skip=()):
+    """
+    Matches ``old_items`` to ``new_items`` by ``key``, recording added,
+    removed and changed ones; unchanged ones are skipped by fingerprint.
+    """
+    old_index = _index(old_items, key)
+    new_index = _index(new_items, key)
+    for name in sorted(set(old_index) | set(new_index), key=str):
+        label = prefix + str(name) if prefix else name
+        old, new = old_index.get(name), new_index.get(name)
+        if new is None:
+            changes.append(Change("removed", kind, path, method, label))
+        elif old is None:
+            changes.append(Change("added", kind, path, method, label))
+        elif old.fingerprint != new.fingerprint:
+            fields = _changed_fields(old, new, skip)
+            if fields:
+                changes.append(Change("changed", kind, path, method, label,
+                                      fields))
+            if nested is not None:
+                nested(old, new)
+
+
+def _compare_params(changes, old, new, path=None, method=None):
+    for attribute, kind in PARAM_KINDS:
+        _compare(changes, kind, getattr(old, attribute, None),
+                 getattr(new, attribute, None), lambda p: p.name,
+                 path, method)
+
+
+def _compare_node(changes, old, new):
+    path, method = new.path, new.method
+    fields = _changed_fields(old, new, NODE_COLLECTIONS)
+    if fields:
+        changes.append(Change("changed", "method", path, method,
+                              fields=fields))
+    _compare_params(changes, old, new, path, method)
+    _compare(changes, "body", old.body, new.body, lambda b: b.mime_type,
+             path, method)
+
+    def response(old_resp, new_resp):
+        prefix = "{0} ".format(new_resp.code)
+        _compare(changes, "response_header", old_resp.headers,
+                 new_resp.headers, lambda h: h.name, path, method, prefix)
+        _compare(changes, "response_body", old_resp.body, new_resp.body,
+                 lambda b: b.mime_type, path, method, prefix)
+
+    _compare(changes, "response", old.responses, new.responses,
+             lambda r: r.code, path, method, nested=response,
+             skip=RESPONSE_COLLECTIONS)
+
+
+def diff(old, new):
+    """
+    Compare two parsed APIs.
+
+    Resources are matched by path and method through dictionaries, and
+    matching objects with the same :py:attr:`fingerprint` are not
+    compared any further; APIs with the same fingerprint are not walked
+    at all.
+
+    :param RootNode old: The API before
+    :param RootNode new: The API after
+    :returns: ``list`` of :py:class:`Change` s, sorted by resource path; \
+        empty if the APIs are the same.
+    """
+    changes = []
+    if old.fingerprint == new.fingerprint:
+        return changes
+
+    fields = _changed_fields(old, new, ROOT_COLLECTIONS)
+    if fields:
+        changes.append(Change("changed", "root", fields=fields))
+    _compare_params(changes, old, new)
+    for attribute, kind, key in DEFINITIONS:
+        _compare(changes, kind, getattr(old, attribute),
+                 getattr(new, attribute), key)
+
+    old_nodes = _index(old.resources, lambda r: (r.path, r.method))
+    new_nodes = _index(new.resources, lambda r: (r.path, r.method))
+    old_paths = set(path for path, _ in old_nodes)
+    new_paths = set(path for path, _ in new_nodes)
+
+    for path in sorted(old_paths - new_paths):
+        changes.append(Change("removed", "resource", path))
+    for path in sorted(new_paths - old_paths):
+        changes.append(Change("added", "resource", path))
+
+    for key in sorted(set(old_nodes) | set(new_nodes),
+                      key=lambda k: (k[0], k[1] or "")):
+        path, method = key
+        if path not in old_paths or path not in new_paths:
+            continue
+        old_node, new_node = old_nodes.get(key), new_nodes.get(key)
+        if new_node is None:
+            changes.append(Change("removed", "method", path, method))
+        elif old_node is None:
+            changes.append(Change("added", "method", path, method))
+        elif old_node.fingerprint != new_node.fingerprint:
+            _compare_node(changes, old_node, new_node)
+
+    return sorted(changes, key=lambda c: (c.path or "", c.method or ""))
@@ -5,10 +5,10 @@ from __future__ import absolute_import, division, print_function
 
 import json
 import os
+import sys
 
 from six import iterkeys
 from six.moves import configparser
-from six.moves import BaseHTTPServer as httpserver  # NOQA
 
 
 def _load_media_types():
@@ -19,6 +19,34 @@ def _load_media_types():
     with open(media_types_file, "r") as f:
         return json.load(f)
 
+
+def _load_resp_codes():
+    from six.moves import BaseHTTPServer as httpserver  # NOQA
+    return list(iterkeys(httpserver.BaseHTTPRequestHandler.responses))
+
+
+# Loaded on first use rather than on import
+_LAZY = {
+    "MEDIA_TYPES": _load_media_types,
+    "HTTP_RESP_CODES": _load_resp_codes,
+}
+
+
+def _lazy(name):
+    value = globals().get(name)
+    if value is None:
+        value = globals()[name] = _LAZY[name]()
+    return value
+
+
+def __getattr__(name):
+    """Module attributes loaded on first use (Python 3.7+, PEP 562)."""
+    if name in _LAZY:
+        return _lazy(name)
+    msg = "module {0!r} has no attribute {1!r}".format(__name__, name)
+    raise AttributeError(msg)
+
+
 HTTP_METHODS = [
     "get", "post", "put", "delete", "patch", "head",
     "options", "trace", "connect"
@@ -27,7 +55,6 @@ HTTP_OPTIONAL = [m + "?" for m in HTTP_METHODS].extend(HTTP_METHODS)
 
 RAML_VERSIONS = ["0.8"]
 PROTOCOLS = ["HTTP", "HTTPS"]
-MEDIA_TYPES = _load_media_types()
 AUTH_SCHEMES = [
     "oauth_1_0", "oauth_2_0",
     "basic", "basic_auth", "basicAuth", "basicAuthentication",
@@ -35,7 +62,6 @@ AUTH_SCHEMES = [
     "digest", "digest_auth", "digestAuth", "digestAuthentication",
     "digest_authentication", "http_digest"
 ]
-HTTP_RESP_CODES = list(iterkeys(httpserver.BaseHTTPRequestHandler.responses))
 PRIM_TYPES = ["string", "integer", "number", "boolean", "date", "file"]
 
 CONFIG_VARS = [
@@ -43,6 +69,10 @@ CONFIG_VARS = [
     "prim_types", "raml_versions"
 ]
 
+if sys.version_info < (3, 7):  # NOCOV
+    MEDIA_TYPES = _load_media_types()
+    HTTP_RESP_CODES = _load_resp_codes()
+
 
 def _clean(a_list):
     return sorted(list(set(a_list)))
@@ -69,17 +99,32 @@ def add_custom_config(user_config, parser_config):
     return pc
 
 
-def setup_config(config_file=None):
+class FrozenConfig(dict):
     """
-    Setup configuration for valid RAML parsing.
-
-    :param file config_file: ``.ini`` file to be parsed (optional)
-    :returns: ConfigParser instance
+    Configuration that can not be changed once built, so that one copy
+    can be shared by any number of parses and threads.  Lists of the
+    configuration are tuples.  Make a changed copy with e.g.
+    ``dict(config, validate=False)``.
     """
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("'FrozenConfig' object is immutable")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = \
+        setdefault = update = _immutable
+
+    def __reduce__(self):
+        return FrozenConfig, (dict(self),)
+
+
+# path -> ((mtime, size), FrozenConfig)
+_CONFIGS = {}
+
+
+def _build_config(config_file):
     parser_config = {
         "auth_schemes": AUTH_SCHEMES,
-        "resp_codes": HTTP_RESP_CODES,
-        "media_types": MEDIA_TYPES,
+        "resp_codes": _lazy("HTTP_RESP_CODES"),
+        "media_types": _lazy("MEDIA_TYPES"),
         "protocols": PROTOCOLS,
         "http_methods": HTTP_METHODS,
         "raml_versions": RAML_VERSIONS,
@@ -88,13 +133,53 @@ def setup_config(config_file=None):
     }
 
     if config_file:
-        if not os.path.isfile(config_file):
-            msg = "No such file or directory: '{0}'".format(config_file)
-            raise IOError(msg)
         user_config = configparser.RawConfigParser()
         user_config.read(config_file)
         parser_config = add_custom_config(user_config, parser_config)
 
     optional = [m + "?" for m in parser_config["http_methods"]]
     parser_config["http_optional"] = optional + parser_config["http_methods"]
-    return parser_config
+    return FrozenConfig(
+        (k, tuple(v) if isinstance(v, list) else v)
+        for k, v in parser_config.items())
+
+
+def load_config(config_file=None):
+    """
+    Setup configuration for valid RAML parsing, shared with earlier
+    calls for the same file as long as the file's modification time and
+    size stay the same.
+
+    :param str config_file: ``.ini`` file to be parsed (optional)
+    :returns: :py:class:`FrozenConfig`
+    :raises IOError: If ``config_file`` does not exist.
+    """
+    path = identity = None
+    if config_file:
+        if not os.path.isfile(config_file):
+            msg = "No such file or directory: '{0}'".format(config_file)
+            raise IOError(msg)
+        path = os.path.abspath(config_file)
+        stat = os.stat(path)
+        identity = (getattr(stat, "st_mtime_ns", stat.st_mtime),
+                    stat.st_size)
+
+    cached = _CONFIGS.get(path)
+    if cached is not None and cached[0] == identity:
+        return cached[1]
+    config = _build_config(path)
+    _CONFIGS[path] = (identity, config)
+    return config
+
+
+def setup_config(config_file=None):
+    """
+    Setup configuration for valid RAML parsing.
+
+    :param file config_file: ``.ini`` file to be parsed (optional)
+    :returns: ``dict`` of the configuration, a copy of \
+        :py:func:`load_config` that may be changed.
+    """
+    config = load_config(config_file)
+    return dict((k, list(v) if isinstance(v, tuple) else v)
+                for k, v in config.items())
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+__all__ = ["ValidationServer", "request"]
+
+import errno
+import json
+import os
+import socket
+
+from six.moves import socketserver
+
+from .errors import InvalidRAMLError
+from .loader import IncludeCache
+from .refcache import RefCache
+from ._helpers import _changed, _parse_tracked
+
+
+def _error_lines(errors):
+    return ["{0}: {1}".format(e.__class__.__name__, e) for e in errors]
+
+
+def _remove_stale_socket(path):
+    """
+    Removes a socket file left behind by a daemon that is not running
+    any more.
+
+    :raises IOError: If a daemon is listening on ``path``.
+    """
+    if not os.path.exists(path):
+        return
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(path)
+    except socket.error as e:
+        if e.errno not in (errno.ECONNREFUSED, errno.ENOENT):
+            raise
+        os.remove(path)
+    else:
+        msg = "A validation daemon is already listening on '{0}'".format(
+            path)
+        raise IOError(msg)
+    finally:
+        client.close()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Answers each line of JSON received with a line of JSON."""
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line.decode("utf-8"))
+                args = (request["path"], request.get("config"),
+                        request.get("max_errors"))
+            except (ValueError, KeyError, TypeError) as e:
+                response = {"error": "Bad request: {0}".format(e)}
+            else:
+                response = self.server.validate(*args)
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class ValidationServer(socketserver.UnixStreamServer):
+    """
+    Validates RAML files for clients connecting to a Unix socket (see
+    :py:func:`request`), keeping the interpreter, configuration, included
+    YAML files (see :py:class:`.loader.IncludeCache`), remote ``$ref``
+    targets (see :py:class:`.refcache.RefCache`) and the results warm
+    between requests.
+
+    A file is only validated again once it, one of the files it
+    includes or its JSON schemas ``$ref``, or the config file changed
+    since it was last validated.
+
+    :param str socket_path: Path of the Unix socket to listen on
+    :param str config_file: Config file for requests that do not name one
+    :raises IOError: If another daemon listens on ``socket_path``.
+    """
+    def __init__(self, socket_path, config_file=None):
+        self.socket_path = socket_path
+        self.config_file = config_file
+        # (path, config file, max errors) -> ({file: identity}, result)
+        self._results = {}
+        self._include_cache = IncludeCache()
+        self._ref_cache = RefCache()
+        _remove_stale_socket(socket_path)
+        socketserver.UnixStreamServer.__init__(self, socket_path, _Handler)
+
+    def server_close(self):
+        socketserver.UnixStreamServer.server_close(self)
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    def validate(self, path, config_file=None, max_errors=None):
+        """
+        Validate the RAML file at ``path``, or return the result of the
+        last validation if none of its files changed since.
+
+        :returns: ``dict`` of the ``path``, whether it is ``valid``, the \
+            ``errors`` found, and whether the result was ``cached``.
+        """
+        path = os.path.abspath(path)
+        config_file = config_file or self.config_file
+        key = (path, config_file, max_errors)
+        cached = self._results.get(key)
+        if cached is not None and not _changed(cached[0]):
+            return dict(cached[1], cached=True)
+
+        files, _, error = _parse_tracked(path, config_file, max_errors,
+                                         self._ref_cache, self._include_cache)
+        if error is None:
+            errors = []
+        elif isinstance(error, InvalidRAMLError):
+            errors = _error_lines(error.errors)
+        else:
+            errors = _error_lines([error])
+        result = {"path": path, "valid": not errors, "errors": errors}
+        self._results[key] = (files, result)
+        return dict(result, cached=False)
+
+
+def request(socket_path, path, config_file=None, max_errors=None,
+            timeout=None):
+    """
+    Have the daemon listening on ``socket_path`` validate a RAML file.
+
+    :param str path: RAML file; relative paths are relative to this \
+        process' working directory.
+    :param str config_file: Config file, if not the daemon's
+    :param int max_errors: Stop at this many errors, if given
+    :param float timeout: Seconds to wait for the daemon, if given
+    :returns: ``dict`` as returned by :py:meth:`ValidationServer.validate`; \
+        if the daemon's reply is empty or not understood, the file is \
+        reported not ``valid``, with the reason as its error.
+    :raises socket.error: If no daemon listens on ``socket_path``.
+    """
+    message = {
+        "path": os.path.abspath(path),
+        "config": os.path.abspath(config_file) if config_file else None,
+        "max_errors": max_errors,
+    }
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.settimeout(timeout)
+        client.connect(socket_path)
+        client.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        response = client.makefile("rb").readline()
+    finally:
+        client.close()
+    reason = "The daemon closed the connection without replying."
+    if response:
+        try:
+            result = json.loads(response.decode("utf-8"))
+        except ValueError:
+            result = None
+        if isinstance(result, dict) and "valid" in result:
+            return result
+        reason = isinstance(result, dict) and result.get("error") or \
+            "Unexpected reply: {0!r}".format(response)
+    return {
+        "path": message["path"], "valid": False, "cached": False,
+        "errors": ["DaemonError: {0}".format(reason)],
+    }
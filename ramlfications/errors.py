@@ -23,6 +23,25 @@ class InvalidRAMLError(Exception):
         return output[:-1]
 
 
+class ErrorList(list):
+    """
+    Collects validation errors found while parsing.  If ``max_errors`` is
+    set, raises :py:class:`InvalidRAMLError` as soon as that many errors
+    have been collected rather than continuing to parse the rest of the
+    RAML file.
+
+    :param int max_errors: Error budget, or ``None`` to collect all errors.
+    """
+    def __init__(self, max_errors=None):
+        super(ErrorList, self).__init__()
+        self.max_errors = max_errors
+
+    def append(self, error):
+        super(ErrorList, self).append(error)
+        if self.max_errors and len(self) >= self.max_errors:
+            raise InvalidRAMLError(list(self))
+
+
 class BaseRAMLError(Exception):
     pass
 
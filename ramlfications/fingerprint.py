@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+__all__ = ["Fingerprinted", "fingerprint", "hash_value"]
+
+import hashlib
+
+import attr
+import six
+
+# Attributes that are not part of what a node or parameter means: raw
+# data, parse bookkeeping, and back references
+IGNORED_ATTRIBUTES = frozenset([
+    "raw", "raml_obj", "config", "errors", "root", "parent"
+])
+
+# class -> names of its attributes that are hashed
+_FIELDS = {}
+
+
+def semantic_fields(obj):
+    """
+    Names of the attributes of an ``attrs`` object that make up its
+    content, i.e. all but raw data, configuration, errors and back
+    references.
+    """
+    cls = type(obj)
+    fields = _FIELDS.get(cls)
+    if fields is None:
+        fields = _FIELDS[cls] = tuple(
+            a.name for a in attr.fields(cls)
+            if a.name not in IGNORED_ATTRIBUTES)
+    return fields
+
+
+def fingerprint(obj, fields=None):
+    """
+    Content hash of a parsed object, computed bottom-up: it covers the
+    object's own attributes and the fingerprints of the objects it holds,
+    so two objects have the same fingerprint if and only if they describe
+    the same thing.  The fingerprint is computed on first use and kept on
+    the object; objects are not expected to change once parsed.
+
+    ``$ref`` s of JSON schemas left as lazy proxies count by their
+    reference and are not fetched.
+
+    :param obj: ``attrs`` object, e.g. a :py:class:`.raml.ResourceNode`
+    :param fields: Names of the attributes to hash, if not \
+        :py:func:`semantic_fields`
+    :returns: ``str`` of 40 hex digits
+    """
+    cached = obj.__dict__.get("_fingerprint")
+    if cached is None:
+        h = hashlib.sha1(type(obj).__name__.encode("utf-8"))
+        for name in fields or semantic_fields(obj):
+            h.update(name.encode("utf-8"))
+            _update(h, getattr(obj, name), set())
+        cached = obj._fingerprint = h.hexdigest()
+    return cached
+
+
+def hash_value(value):
+    """
+    Content hash of an attribute value, e.g. a ``list`` of parameters or
+    a JSON schema, in the same way as :py:func:`fingerprint`.
+    """
+    h = hashlib.sha1()
+    _update(h, value, set())
+    return h.hexdigest()
+
+
+def _update(h, value, stack):
+    cls = type(value)
+    # type() rather than isinstance(), which would resolve proxies
+    if "__reference__" in getattr(cls, "__notproxied__", ()):
+        reference = value.__reference__
+        base_uri = object.__getattribute__(value, "base_uri")
+        h.update(b"$")
+        _update(h, [base_uri, reference], stack)
+    elif isinstance(getattr(cls, "fingerprint", None), property):
+        h.update(b"N" + value.fingerprint.encode("ascii"))
+    elif issubclass(cls, (dict, list, tuple)):
+        if id(value) in stack:
+            # recursive JSON schema
+            h.update(b"R")
+            return
+        stack.add(id(value))
+        if issubclass(cls, dict):
+            h.update(b"{")
+            for key, item in sorted((hash_value(k), v)
+                                    for k, v in value.items()):
+                h.update(key.encode("ascii"))
+                _update(h, item, stack)
+            h.update(b"}")
+        else:
+            h.update(b"[")
+            for item in value:
+                _update(h, item, stack)
+            h.update(b"]")
+        stack.discard(id(value))
+    elif issubclass(cls, six.string_types):
+        data = value.encode("utf-8")
+        h.update("s{0}:".format(len(data)).encode("ascii") + data)
+    else:
+        text = "{0}:{1!r};".format(cls.__name__, value)
+        h.update(text.encode("utf-8"))
+
+
+class Fingerprinted(object):
+    """
+    Adds a :py:attr:`fingerprint` to ``attrs`` classes declared with
+    ``cmp=False``, and compares their objects by it rather than field by
+    field.
+    """
+    @property
+    def fingerprint(self):
+        """Content hash of the object, see :py:func:`fingerprint`."""
+        return fingerprint(self)
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.fingerprint == other.fingerprint
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
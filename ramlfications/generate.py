@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+__all__ = ["generate", "write"]
+
+import io
+import json
+import os
+import random
+
+
+MAIN_FILE = "api.raml"
+
+METHODS = ["get", "post", "put", "delete", "patch"]
+
+PARAM_TYPES = ["string", "integer", "number", "boolean"]
+
+RESPONSE_CODES = {
+    "get": 200, "post": 201, "put": 200, "delete": 204, "patch": 200,
+}
+
+
+class _Writer(object):
+    """Collects indented lines of YAML."""
+    def __init__(self):
+        self.lines = []
+
+    def __call__(self, indent, text):
+        self.lines.append("  " * indent + text)
+
+    def getvalue(self):
+        return "\n".join(self.lines) + "\n"
+
+
+def _schema(rng, index):
+    properties = {}
+    for i in range(rng.randint(1, 5)):
+        properties["field{0}".format(i)] = {"type": rng.choice(
+            ["string", "integer", "number", "boolean"])}
+    return {
+        "$schema": "http://json-schema.org/draft-04/schema#",
+        "title": "Schema{0}".format(index),
+        "type": "object",
+        "properties": properties,
+        "required": sorted(properties)[:1],
+    }
+
+
+def _example(rng, schema):
+    values = {
+        "string": lambda: "value{0}".format(rng.randint(0, 999)),
+        "integer": lambda: rng.randint(0, 999),
+        "number": lambda: round(rng.random() * 100, 2),
+        "boolean": lambda: rng.random() < 0.5,
+    }
+    return dict((k, values[v["type"]]())
+                for k, v in sorted(schema["properties"].items()))
+
+
+def _param(out, indent, rng, name):
+    type_ = rng.choice(PARAM_TYPES)
+    out(indent, "{0}:".format(name))
+    out(indent + 1, "description: The {0} parameter".format(name))
+    out(indent + 1, "type: {0}".format(type_))
+    if type_ == "string":
+        if rng.random() < 0.3:
+            out(indent + 1, "enum: [ {0}a, {0}b, {0}c ]".format(name))
+        else:
+            out(indent + 1, "minLength: 1")
+            out(indent + 1, "maxLength: {0}".format(rng.randint(8, 64)))
+    elif type_ in ("integer", "number"):
+        out(indent + 1, "minimum: 0")
+        out(indent + 1, "maximum: {0}".format(rng.randint(10, 1000)))
+    if rng.random() < 0.3:
+        out(indent + 1, "required: true")
+
+
+def _params(out, indent, rng, key, prefix, count):
+    if not count:
+        return
+    out(indent, key + ":")
+    for i in range(count):
+        _param(out, indent + 1, rng, "{0}{1}".format(prefix, i))
+
+
+def _names(rng, names, most):
+    if not names:
+        return []
+    return sorted(rng.sample(names, rng.randint(0, min(most, len(names)))))
+
+
+def generate(resources=10, depth=2, methods=2, traits=2, resource_types=2,
+             security_schemes=1, schemas=2, includes=1, params=2, seed=0):
+    """
+    Generate a RAML 0.8 API to parse, e.g. to find how parsing time
+    scales with the shape of an API.  The same arguments always generate
+    the same API.
+
+    :param int resources: Number of top-level resources.
+    :param int depth: Nesting depth below each top-level resource; every \
+        other level is a URI parameter (e.g. ``/things/{thingsId}``).
+    :param int methods: HTTP methods per resource.
+    :param int traits: Number of traits, applied at random to methods.
+    :param int resource_types: Number of resource types, assigned at \
+        random to resources.
+    :param int security_schemes: Number of OAuth 2.0 security schemes, \
+        assigned at random to methods.
+    :param int schemas: Number of JSON schemas, used at random for \
+        request & response bodies.
+    :param int includes: Number of the JSON schemas that are \
+        ``!include`` d from separate files rather than inlined.
+    :param int params: Query parameters per method, trait and \
+        resource type, and headers per method.
+    :param int seed: Seed for the random choices.
+    :returns: ``dict`` of file names to their contents; the API is \
+        in ``api.raml``, next to the files it includes.
+    """
+    rng = random.Random(seed)
+    methods = min(methods, len(METHODS))
+    files = {}
+    out = _Writer()
+    out(0, "#%RAML 0.8")
+    out(0, "title: Generated API {0}".format(seed))
+    out(0, "version: v1")
+    out(0, "baseUri: https://api.example.com/{version}")
+    out(0, "protocols: [ HTTPS ]")
+    out(0, "mediaType: application/json")
+
+    scheme_names = ["oauth_{0}".format(i) for i in range(security_schemes)]
+    if scheme_names:
+        out(0, "securitySchemes:")
+    for name in scheme_names:
+        out(1, "- {0}:".format(name))
+        out(3, "description: Generated OAuth 2.0 scheme {0}".format(name))
+        out(3, "type: OAuth 2.0")
+        out(3, "describedBy:")
+        out(4, "headers:")
+        out(5, "Authorization:")
+        out(6, "description: Bearer token")
+        out(6, "type: string")
+        out(4, "responses:")
+        out(5, "401:")
+        out(6, "description: Bad or expired token.")
+        out(3, "settings:")
+        out(4, "authorizationUri: https://auth.example.com/{0}/authorize"
+            .format(name))
+        out(4, "accessTokenUri: https://auth.example.com/{0}/token"
+            .format(name))
+        out(4, "authorizationGrants: [ code, token ]")
+
+    schema_names = ["Schema{0}".format(i) for i in range(schemas)]
+    schema_docs = {}
+    if schema_names:
+        out(0, "schemas:")
+    for i, name in enumerate(schema_names):
+        schema = schema_docs[name] = _schema(rng, i)
+        text = json.dumps(schema, indent=2, sort_keys=True)
+        if i < includes:
+            file_name = "schemas/{0}.json".format(name)
+            files[file_name] = text + "\n"
+            out(1, "- {0}: !include {1}".format(name, file_name))
+        else:
+            out(1, "- {0}: |".format(name))
+            for line in text.splitlines():
+                out(4, line)
+
+    trait_names = ["trait_{0}".format(i) for i in range(traits)]
+    if trait_names:
+        out(0, "traits:")
+    for i, name in enumerate(trait_names):
+        out(1, "- {0}:".format(name))
+        out(3, "usage: Apply to methods that accept {0}".format(name))
+        _params(out, 3, rng, "queryParameters", "t{0}q".format(i), params)
+
+    type_names = ["type_{0}".format(i) for i in range(resource_types)]
+    if type_names:
+        out(0, "resourceTypes:")
+    for i, name in enumerate(type_names):
+        out(1, "- {0}:".format(name))
+        out(3, "description: Generated resource type {0}".format(name))
+        for method in sorted(rng.sample(METHODS, methods)):
+            out(3, "{0}?:".format(method))
+            _params(out, 4, rng, "queryParameters", "r{0}q".format(i),
+                    params)
+            out(4, "responses:")
+            out(5, "500:")
+            out(6, "description: Server error.")
+
+    def resource(indent, path, level, parent_param):
+        out(indent, path + ":")
+        out(indent + 1, "displayName: {0}".format(path.strip("/{}")))
+        out(indent + 1, "description: Generated resource {0}".format(path))
+        if parent_param:
+            out(indent + 1, "uriParameters:")
+            _param(out, indent + 2, rng, parent_param)
+        if type_names and rng.random() < 0.5:
+            out(indent + 1, "type: {0}".format(rng.choice(type_names)))
+        for method in sorted(rng.sample(METHODS, methods)):
+            out(indent + 1, "{0}:".format(method))
+            out(indent + 2, "description: {0} {1}".format(
+                method.upper(), path))
+            applied = _names(rng, trait_names, 2)
+            if applied:
+                out(indent + 2, "is: [ {0} ]".format(", ".join(applied)))
+            secured = _names(rng, scheme_names, 1)
+            if secured:
+                out(indent + 2, "securedBy: [ {0} ]".format(
+                    ", ".join(secured)))
+            _params(out, indent + 2, rng, "headers", "X-Header-", params)
+            if method == "get":
+                _params(out, indent + 2, rng, "queryParameters", "q", params)
+            schema = rng.choice(schema_names) if schema_names else None
+            if schema and method in ("post", "put", "patch"):
+                out(indent + 2, "body:")
+                out(indent + 3, "application/json:")
+                out(indent + 4, "schema: {0}".format(schema))
+            out(indent + 2, "responses:")
+            code = RESPONSE_CODES[method]
+            out(indent + 3, "{0}:".format(code))
+            out(indent + 4, "description: Success.")
+            if schema and code != 204:
+                example = _example(rng, schema_docs[schema])
+                out(indent + 4, "body:")
+                out(indent + 5, "application/json:")
+                out(indent + 6, "schema: {0}".format(schema))
+                out(indent + 6, "example: {0}".format(
+                    json.dumps(example, sort_keys=True)))
+        if level < depth:
+            name = path.strip("/{}")
+            if level % 2:
+                child = "/sub{0}".format(level)
+                param = None
+            else:
+                param = name + "Id"
+                child = "/{" + param + "}"
+            resource(indent + 1, child, level + 1, param)
+
+    for i in range(resources):
+        resource(0, "/resource{0}".format(i), 0, None)
+
+    files[MAIN_FILE] = out.getvalue()
+    return files
+
+
+def write(directory, **kwargs):
+    """
+    Write an API from :py:func:`generate` into ``directory``.
+
+    :param str directory: Directory to write to, created if missing.
+    :param kwargs: Arguments for :py:func:`generate`.
+    :returns: Path to the generated RAML file.
+    """
+    for name, text in generate(**kwargs).items():
+        path = os.path.join(directory, *name.split("/"))
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with io.open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+    return os.path.join(directory, MAIN_FILE)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+__all__ = ["ResourceIndex"]
+
+from six import iterkeys, string_types
+
+
+def _names(assigned):
+    """
+    Names in a list of trait, resource type or security scheme
+    assignments, each either a name or a ``dict`` of the name to its
+    parameters.
+    """
+    for item in assigned or []:
+        if isinstance(item, dict):
+            for name in iterkeys(item):
+                yield name, item[name]
+        elif item is not None:
+            yield item, None
+
+
+def _scopes(params):
+    scopes = (params or {}).get("scopes") if isinstance(params, dict) else None
+    if isinstance(scopes, string_types):
+        return [scopes]
+    return scopes or []
+
+
+class ResourceIndex(object):
+    """
+    Lookups of an API's resources, built in one pass over
+    :py:obj:`.RootNode.resources`.  Lookups returning several resources
+    return them in the order they are defined in.
+
+    :param RootNode root: Parsed API
+    """
+    def __init__(self, root):
+        # (path, method) -> ResourceNode
+        self._resources = {}
+        # path of parent resource, or ``None`` -> [ResourceNode]
+        self._children = {}
+        # name -> [ResourceNode]
+        self._traits = {}
+        self._types = {}
+        self._schemes = {}
+        self._media_types = {}
+        # (scheme name, scope) -> [ResourceNode]
+        self._scopes = {}
+        for node in root.resources or []:
+            self._add(node)
+
+    def _add(self, node):
+        self._resources.setdefault((node.path, node.method), node)
+        parent = node.parent.path if node.parent else None
+        self._children.setdefault(parent, []).append(node)
+
+        traits = set(name for name, _ in _names(node.is_))
+        traits.update(t.name for t in node.traits or [])
+        if node.type:
+            self._types.setdefault(node.type, []).append(node)
+
+        schemes, scopes = set(), set()
+        for name, params in _names(node.secured_by):
+            schemes.add(name)
+            scopes.update((name, scope) for scope in _scopes(params))
+
+        media_types = set(b.mime_type for b in node.body or [])
+        for response in node.responses or []:
+            media_types.update(b.mime_type for b in response.body or [])
+
+        for index, keys in ((self._traits, traits),
+                            (self._schemes, schemes),
+                            (self._scopes, scopes),
+                            (self._media_types, media_types)):
+            for key in keys:
+                index.setdefault(key, []).append(node)
+
+    def resource(self, path, method=None):
+        """
+        :returns: The resource defining ``method`` on ``path``, or ``None``.
+        """
+        if method is not None:
+            method = method.lower()
+        return self._resources.get((path, method))
+
+    def resources_by_trait(self, name):
+        """Resources assigned the trait ``name``."""
+        return list(self._traits.get(name, []))
+
+    def resources_by_type(self, name):
+        """Resources assigned the resource type ``name``."""
+        return list(self._types.get(name, []))
+
+    def resources_secured_by(self, scheme, scope=None):
+        """Resources secured by ``scheme``, with ``scope`` if given."""
+        if scope is None:
+            return list(self._schemes.get(scheme, []))
+        return list(self._scopes.get((scheme, scope), []))
+
+    def resources_by_media_type(self, media_type):
+        """Resources with a request or response body of ``media_type``."""
+        return list(self._media_types.get(media_type, []))
+
+    def children(self, node=None):
+        """
+        Resources nested directly under the path of ``node``, for any of
+        its methods, or the top-level resources if ``node`` is ``None``
+        or the :py:class:`.RootNode`.
+        """
+        return list(self._children.get(getattr(node, "path", None), []))
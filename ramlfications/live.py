@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+__all__ = ["LiveSpec"]
+
+import os
+import threading
+
+from ._helpers import _changed, _parse_tracked
+
+
+class LiveSpec(object):
+    """
+    The parsed API of a RAML file, parsed again in a background thread
+    whenever the file, a file it ``!include`` s, a local file one of its
+    JSON schemas ``$ref`` s, or the config file changes.
+
+    The new API replaces :py:attr:`root` only once it parsed and
+    validated without errors; otherwise the previous one stays, and the
+    error is kept in :py:attr:`error`.  Reading :py:attr:`root` takes no
+    lock, and returns a complete API: hold on to it for as long as one
+    version is needed, e.g. for the duration of a request.
+
+    :param str path: RAML file
+    :param str config_file: Config file, if any
+    :param float interval: Seconds between checks for changed files.  \
+        If ``None``, no thread is started, and changes are only picked \
+        up by calling :py:meth:`check`.
+    :param on_reload: Function called with the new \
+        :py:class:`.raml.RootNode` after each reload.
+    :param on_error: Function called with the exception when parsing \
+        a changed file fails.
+    :raises LoadRAMLError: If the RAML file can not be loaded at first.
+    :raises InvalidRAMLError: If the RAML file is invalid at first.
+
+    ``on_reload`` and ``on_error`` are called from the background thread.
+    Whatever goes wrong there, including in these functions, is passed
+    to ``on_error`` and the thread keeps checking.
+    """
+    def __init__(self, path, config_file=None, interval=1.0,
+                 on_reload=None, on_error=None):
+        self.path = os.path.abspath(path)
+        self.config_file = config_file
+        self.interval = interval
+        self._on_reload = on_reload
+        self._on_error = on_error
+        #: Error of the last parse, if it failed.
+        self.error = None
+        #: Number of times the API was parsed successfully.
+        self.version = 0
+        # one check at a time, from the thread or from callers
+        self._lock = threading.RLock()
+        self._files, root, error = self._parse()
+        if error is not None:
+            raise error
+        #: The current :py:class:`.raml.RootNode`.
+        self.root = root
+        self.version = 1
+
+        self._stop = threading.Event()
+        self._thread = None
+        if interval is not None:
+            self._thread = threading.Thread(target=self._run,
+                                            name="LiveSpec " + self.path)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def files(self):
+        """Paths of the files that were read by the last parse."""
+        return sorted(self._files)
+
+    def changed(self):
+        """Whether any file changed since the last parse."""
+        return _changed(self._files)
+
+    def check(self):
+        """
+        Parse the API again if any file changed since the last parse.
+
+        :returns: ``True`` if a new API replaced :py:attr:`root`.
+        """
+        with self._lock:
+            if not self.changed():
+                return False
+            self._files, root, error = self._parse()
+            self.error = error
+            if error is None:
+                self.root = root
+                self.version += 1
+        if error is not None:
+            if self._on_error is not None:
+                self._on_error(error)
+            return False
+        if self._on_reload is not None:
+            self._on_reload(root)
+        return True
+
+    def close(self):
+        """Stop checking for changes."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while True:
+            self._stop.wait(self.interval)
+            if self._stop.is_set():
+                return
+            try:
+                self.check()
+            except Exception as e:
+                # e.g. a failing callback, or a file that can not be
+                # stat()ed: keep checking rather than go stale for good
+                self.error = e
+                if self._on_error is not None:
+                    try:
+                        self._on_error(e)
+                    except Exception:
+                        pass
+
+    def _parse(self):
+        return _parse_tracked(self.path, self.config_file)
@@ -8,25 +8,140 @@ try:
 except ImportError:  # pragma: no cover
     from ordereddict import OrderedDict
 
+import copy
+import json
 import os
-
-import jsonref
-import yaml
+import threading
 
 from .errors import LoadRAMLError
+from .stats import timed
+
+# Included files kept by an ``IncludeCache``; JSON schemas are left to
+# ``jsonref`` and its ``RefCache``
+CACHED_EXTENSIONS = [".yaml", ".yml", ".raml"]
+
+
+def _file_identity(path):
+    """Modification time & size of a file, or ``None`` if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return getattr(stat, "st_mtime_ns", stat.st_mtime), stat.st_size
+
+
+def _resolve_refs(obj, memo):
+    """
+    Replaces ``jsonref`` proxies in ``obj`` with the plain ``dict`` s and
+    ``list`` s they refer to.  Everything referring to the same target
+    shares one copy, and recursive references become cyclic structures.
+    """
+    from jsonref import JsonRef
+
+    def resolve(obj):
+        while isinstance(obj, JsonRef):
+            obj = obj.__subject__
+        if isinstance(obj, dict):
+            if id(obj) in memo:
+                return memo[id(obj)]
+            resolved = memo[id(obj)] = {}
+            for key, value in obj.items():
+                resolved[key] = resolve(value)
+            return resolved
+        if isinstance(obj, list):
+            if id(obj) in memo:
+                return memo[id(obj)]
+            resolved = memo[id(obj)] = []
+            resolved.extend(resolve(value) for value in obj)
+            return resolved
+        return obj
+    return resolve(obj)
+
+
+class IncludeCache(object):
+    """
+    YAML files loaded by ``!include`` for :py:class:`RAMLLoader`, kept
+    for later loads, e.g. by a long-running process validating the same
+    RAML files over and over.  A file is loaded again once it, or a file
+    it includes, changed (by modification time & size).  Every load gets
+    its own copy of the data.
+    """
+    def __init__(self):
+        # path -> ({path: identity} of it and its includes, data)
+        self._files = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._files)
+
+    def get(self, path):
+        """
+        :returns: ``(data, paths of the files it includes)``, or \
+            ``None`` if ``path`` is not cached or changed.
+        """
+        with self._lock:
+            cached = self._files.get(path)
+        if cached is None:
+            return None
+        files, data = cached
+        if any(_file_identity(f) != i for f, i in files.items()):
+            return None
+        includes = [f for f in files if f != path]
+        return copy.deepcopy(data), includes
+
+    def put(self, path, data, files):
+        """
+        Keep ``data`` loaded from ``path``.
+
+        :param dict files: Identities of ``path`` and the files it \
+            includes, taken before they were read.
+        """
+        data = copy.deepcopy(data)
+        with self._lock:
+            self._files[path] = (files, data)
 
 
 class RAMLLoader(object):
     """
     Extends YAML loader to load RAML files with ``!include`` tags.
+
+    :param bool flatten_refs: Resolve all ``$ref`` s in included JSON \
+        schemas once while loading, returning plain ``dict`` s rather \
+        than lazy ``jsonref`` proxies.
+    :param RefCache ref_cache: Fetches and caches remote ``$ref`` \
+        targets, if given (see :py:class:`.refcache.RefCache`).
+    :param ParseStats stats: Records the time spent loading YAML and \
+        resolving includes, if given (see :py:class:`.stats.ParseStats`).
+    :param IncludeCache include_cache: Keeps included YAML files for \
+        later loads, if given.
+
+    After loading, :py:attr:`includes` lists the paths of the files that
+    were ``!include`` d, directly or from other included files, and of
+    the local files that included JSON schemas ``$ref``.
     """
+    def __init__(self, flatten_refs=False, ref_cache=None, stats=None,
+                 include_cache=None):
+        self.flatten_refs = flatten_refs
+        self.ref_cache = ref_cache
+        self.stats = stats
+        self.include_cache = include_cache
+        self.includes = []
+        # file:// URIs of the local documents $ref'd so far
+        self._ref_documents = set()
+
     def _yaml_include(self, loader, node):
         """
         Adds the ability to follow ``!include`` directives within
         RAML Files.
         """
+        with timed(self.stats, "includes"):
+            return self._include(loader, node)
+
+    def _include(self, loader, node):
         # Get the path out of the yaml file
         file_name = os.path.join(os.path.dirname(loader.name), node.value)
+        path = os.path.abspath(file_name)
+        self.includes.append(path)
         file_ext = os.path.splitext(file_name)[1]
         parsable_ext = [".yaml", ".yml", ".raml", ".json"]
 
@@ -37,9 +152,29 @@ class RAMLLoader(object):
         if file_ext == ".json":
             return self._parse_json(file_name, os.path.dirname(file_name))
 
+        if self.include_cache is not None and file_ext in CACHED_EXTENSIONS:
+            return self._cached_yaml(path)
+        return self._load_yaml(file_name)
+
+    def _load_yaml(self, file_name):
+        import yaml
         with open(file_name) as inputfile:
             return yaml.load(inputfile, self._ordered_loader)
 
+    def _cached_yaml(self, path):
+        cached = self.include_cache.get(path)
+        if cached is not None:
+            data, includes = cached
+            self.includes.extend(includes)
+            return data
+        files = {path: _file_identity(path)}
+        start = len(self.includes)
+        data = self._load_yaml(path)
+        for include in self.includes[start:]:
+            files.setdefault(include, _file_identity(include))
+        self.include_cache.put(path, data, files)
+        return data
+
     def _parse_json(self, jsonfile, base_path):
         """
         Parses JSON as well as resolves any `$ref`s, including references to
@@ -50,14 +185,57 @@ class RAMLLoader(object):
             base_path = base_path + "/"
         base_path = "file://" + base_path
 
+        import jsonref
+        kwargs = {}
+        if self.ref_cache is not None:
+            kwargs["loader"] = self.ref_cache
         with open(jsonfile, "r") as f:
-            schema = jsonref.load(f, base_uri=base_path, jsonschema=True)
+            schema = jsonref.load(f, base_uri=base_path, jsonschema=True,
+                                  **kwargs)
+        self._add_ref_documents(schema, base_path)
+        if self.ref_cache is not None:
+            self.ref_cache.prefetch(schema, base_path)
+        if self.flatten_refs:
+            return _resolve_refs(schema, {})
         return schema
 
-    def _ordered_load(self, stream, loader=yaml.SafeLoader):
+    def _add_ref_documents(self, schema, base_uri):
+        """
+        Adds the local files ``schema`` refers to, directly or through
+        other local files, to :py:attr:`includes`.  ``jsonref`` only
+        reads them once a reference is used.
+        """
+        from six.moves.urllib.parse import urlsplit
+        from six.moves.urllib.request import url2pathname
+        from .refcache import _ref_uris
+        found = set()
+        _ref_uris(schema, base_uri, found)
+        # references within the schema itself
+        found.discard(base_uri)
+        while found - self._ref_documents:
+            uri = min(found - self._ref_documents)
+            self._ref_documents.add(uri)
+            parts = urlsplit(uri)
+            if parts.scheme != "file":
+                continue
+            path = url2pathname(parts.path)
+            self.includes.append(path)
+            try:
+                with open(path) as f:
+                    document = json.load(f)
+            except (IOError, ValueError):
+                # reported by jsonref once the reference is used
+                continue
+            _ref_uris(document, uri, found)
+
+    def _ordered_load(self, stream, loader=None):
         """
         Preserves order set in RAML file.
         """
+        import yaml
+        if loader is None:
+            loader = yaml.SafeLoader
+
         class OrderedLoader(loader):
             pass
 
@@ -83,9 +261,12 @@ class RAMLLoader(object):
         :rtype: ``dict``
 
         """
+        # imported here so that importing ramlfications stays fast
+        import yaml
 
         try:
-            return self._ordered_load(raml, yaml.SafeLoader)
+            with timed(self.stats, "load", exclude="includes"):
+                return self._ordered_load(raml, yaml.SafeLoader)
         except yaml.parser.ParserError as e:
             msg = "Error parsing RAML: {0}".format(e)
             raise LoadRAMLError(msg)
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+__all__ = ["MemoryReport", "memory_report", "peak_memory"]
+
+import gc
+import sys
+import types
+
+try:
+    from enum import Enum
+except ImportError:  # NOCOV
+    Enum = None
+
+try:
+    import tracemalloc
+except ImportError:  # NOCOV
+    tracemalloc = None
+
+# Not owned by any API: code & classes, and singletons
+SKIPPED_TYPES = (
+    type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+    types.MethodType, types.CodeType, types.FrameType, type(None), bool,
+    type(Ellipsis), type(NotImplemented)
+) + ((Enum,) if Enum is not None else ())
+
+
+class MemoryReport(object):
+    """
+    Memory retained by a parsed API, broken down by class.
+
+    An object is *shared* if more than one object of the API refers to
+    it (e.g. parameters inherited by several resources), otherwise it is
+    *unique*.  The size of an object's ``__dict__`` counts towards the
+    object's class.
+
+    :param dict classes: class name -> ``[count, unique bytes, \
+        shared bytes]``
+    :param int peak: Peak bytes allocated while parsing, if measured.
+    """
+    def __init__(self, classes, peak=None):
+        self.classes = classes
+        self.peak = peak
+
+    @property
+    def unique(self):
+        """Bytes of objects referred to once."""
+        return sum(c[1] for c in self.classes.values())
+
+    @property
+    def shared(self):
+        """Bytes of objects referred to more than once."""
+        return sum(c[2] for c in self.classes.values())
+
+    @property
+    def total(self):
+        """Bytes retained by the API."""
+        return self.unique + self.shared
+
+    def format(self, top=None):
+        """
+        Returns a table of the classes, largest first.
+
+        :param int top: Only list this many classes, if given.
+        """
+        rows = sorted(self.classes.items(),
+                      key=lambda item: (-item[1][1] - item[1][2], item[0]))
+        if top is not None:
+            rows = rows[:top]
+        line = "{0:<24}{1:>10}{2:>14}{3:>14}"
+        lines = [line.format("Class", "Count", "Unique (B)", "Shared (B)")]
+        for name, (count, unique, shared) in rows:
+            lines.append(line.format(name, count, unique, shared))
+        count = sum(c[0] for c in self.classes.values())
+        lines.append(line.format("total", count, self.unique, self.shared))
+        if self.peak is not None:
+            lines.append("Peak while parsing: {0} B".format(self.peak))
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.format()
+
+
+def _instance_dict(obj):
+    if not hasattr(type(obj), "__dict__") or issubclass(type(obj), type):
+        return None
+    try:
+        return object.__getattribute__(obj, "__dict__")
+    except (AttributeError, TypeError):
+        return None
+
+
+def _not_owned(root):
+    """
+    Ids of the objects that every API refers to: its configuration, which
+    :py:func:`.config.load_config` shares between parses, and the
+    module-level data of :py:mod:`.config`.
+    """
+    from . import config
+    objects = [v for k, v in vars(config).items() if k.isupper()]
+    api_config = getattr(root, "config", None)
+    if isinstance(api_config, dict):
+        objects.append(api_config)
+        objects.extend(api_config.values())
+    return set(id(o) for o in objects)
+
+
+def memory_report(root, peak=None):
+    """
+    Walk everything reachable from ``root`` and add up the sizes of the
+    objects by class.  Classes, functions, modules and singletons such
+    as ``None`` and enum members are not counted, and neither is the
+    configuration, which is shared by every API.  ``jsonref`` proxies
+    are not resolved.
+
+    :param root: Parsed API, e.g. a :py:class:`.raml.RootNode`
+    :param int peak: Peak bytes allocated while parsing, if measured \
+        (see :py:func:`peak_memory`).
+    :rtype: MemoryReport
+    """
+    refs = {}     # id -> number of references within the API
+    owners = {}   # id of an instance ``__dict__`` -> its instance
+    objects = {}  # id -> object, keeps ids valid while walking
+    skipped = _not_owned(root)
+    stack = [root]
+    refs[id(root)] = 0
+    while stack:
+        obj = stack.pop()
+        objects[id(obj)] = obj
+        instance_dict = _instance_dict(obj)
+        for child in gc.get_referents(obj):
+            # type() rather than isinstance(), which would resolve proxies
+            if issubclass(type(child), SKIPPED_TYPES) or \
+                    id(child) in skipped:
+                continue
+            key = id(child)
+            if key in refs:
+                refs[key] += 1
+                continue
+            refs[key] = 1
+            if child is instance_dict:
+                owners[key] = obj
+            stack.append(child)
+
+    classes = {}
+    for key, obj in objects.items():
+        owner = owners.get(key, obj)
+        name = type(owner).__name__
+        counts = classes.setdefault(name, [0, 0, 0])
+        if owner is obj:
+            counts[0] += 1
+        size = sys.getsizeof(obj)
+        instance_dict = _instance_dict(obj)
+        if instance_dict is not None and id(instance_dict) not in owners:
+            # attributes stored inline rather than in a referenced dict
+            size += sys.getsizeof(instance_dict)
+        counts[2 if refs[key] > 1 else 1] += size
+    return MemoryReport(classes, peak)
+
+
+def peak_memory(func, *args, **kwargs):
+    """
+    Call ``func`` and measure the peak memory it allocates, e.g.
+    ``peak_memory(ramlfications.parse, raml_file)``.
+
+    :returns: ``(result, peak bytes)``; the peak is ``None`` without \
+        ``tracemalloc`` (Python 3.4+).
+    """
+    if tracemalloc is None:  # NOCOV
+        return func(*args, **kwargs), None
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        result = func(*args, **kwargs)
+        return result, tracemalloc.get_traced_memory()[1] - before
+    finally:
+        if not tracing:
+            tracemalloc.stop()
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+__all__ = ["MockServer"]
+
+import json
+
+import six
+from six.moves import BaseHTTPServer, socketserver
+
+from .router import Router
+
+
+NOT_FOUND = (404, (), {}, None)
+
+
+def _serialize(body):
+    """Encode a body's example once, as it appears in the RAML file."""
+    # request bodies keep ``{mime type: spec}``, response bodies the spec
+    raw = body.raw or {}
+    raw = raw.get(body.mime_type, raw)
+    example = raw.get("example") if isinstance(raw, dict) else None
+    if example is None:
+        # an empty dict stands for a missing example
+        example = body.example or None
+    if example is None:
+        return None
+    if not isinstance(example, six.string_types):
+        example = json.dumps(example)
+    if isinstance(example, six.text_type):
+        example = example.encode("utf-8")
+    return example
+
+
+def _pick_response(node):
+    """The lowest 2XX response, or else the lowest response declared."""
+    responses = sorted(node.responses or [], key=lambda r: r.code)
+    for response in responses:
+        if 200 <= response.code < 300:
+            return response
+    return responses[0] if responses else None
+
+
+def _prepare(node):
+    """
+    Returns ``(status, headers, {mime type: body}, default mime type)``
+    for a resource, with each example body already encoded.
+    """
+    response = _pick_response(node)
+    if response is None:
+        return 204, (), {}, None
+
+    headers = []
+    for header in response.headers or []:
+        if header.example is not None:
+            headers.append((header.name, six.text_type(header.example)))
+
+    bodies = {}
+    default = None
+    for body in response.body or []:
+        data = _serialize(body)
+        if data is None or body.mime_type in bodies:
+            continue
+        bodies[body.mime_type] = data
+        if default is None:
+            default = body.mime_type
+    return response.code, tuple(headers), bodies, default
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _dispatch(self):
+        # drain the request body so the connection can be reused
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+        status, headers, bodies, default = self.server.lookup(
+            self.command, self.path)
+        mime_type = default
+        accept = self.headers.get("Accept")
+        if accept and len(bodies) > 1:
+            for media_range in accept.split(","):
+                media_range = media_range.split(";")[0].strip()
+                if media_range in bodies:
+                    mime_type = media_range
+                    break
+
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        data = bodies.get(mime_type, b"")
+        if mime_type is not None:
+            self.send_header("Content-Type", mime_type)
+        if status != 204:
+            self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if data and self.command != "HEAD":
+            self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = _dispatch
+    do_HEAD = do_OPTIONS = do_TRACE = do_CONNECT = _dispatch
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            BaseHTTPServer.BaseHTTPRequestHandler.log_message(
+                self, format, *args)
+
+
+class MockServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """
+    HTTP server that answers requests to each of the API's resources with
+    the example body of the resource's response.
+
+    Requests are dispatched with a :py:class:`.router.Router`, and
+    answered with the resource's lowest ``2XX`` response (or its lowest
+    response, if none are successful), its example headers, and its
+    example body in the media type requested with ``Accept``, or else the
+    first media type declared.  Every response is encoded when the server
+    starts.  Unknown URLs get a ``404``.
+
+    Use ``serve_forever()`` to start serving, and ``shutdown()`` to stop.
+
+    :param RootNode root: Parsed API
+    :param str host: Address to listen on.
+    :param int port: Port to listen on, or ``0`` for any free port.
+    :param bool verbose: Log each request to ``stderr``.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, root, host="127.0.0.1", port=0, verbose=False):
+        self.root = root
+        self.verbose = verbose
+        self._router = Router(root)
+        # id(ResourceNode) -> prepared response
+        self._responses = dict(
+            (id(node), _prepare(node)) for node in root.resources or [])
+        BaseHTTPServer.HTTPServer.__init__(self, (host, port), _Handler)
+
+    @property
+    def url(self):
+        """Base URL the server is listening on."""
+        return "http://{0}:{1}".format(*self.server_address[:2])
+
+    def lookup(self, method, path):
+        """
+        Returns the prepared ``(status, headers, bodies, mime type)`` of
+        the resource matching a request.
+        """
+        match = self._router.match(method, path)
+        if match is None and method == "HEAD":
+            match = self._router.match("GET", path)
+        if match is None:
+            return NOT_FOUND
+        return self._responses[id(match[0])]
@@ -4,8 +4,9 @@
 from __future__ import absolute_import, division, print_function
 
 import attr
-import markdown2 as md
 
+from . import schema as _schema
+from .fingerprint import Fingerprinted, fingerprint
 from .validate import *  # NOQA
 
 HTTP_METHODS = [
@@ -29,6 +30,7 @@ class Content(object):
     """
     def __init__(self, data):
         self.data = data
+        self._html = None
 
     @property
     def raw(self):
@@ -42,14 +44,64 @@ class Content(object):
         """
         Returns parsed Markdown into HTML
         """
-        return md.markdown(self.data)
+        if self._html is None:
+            self._html = _markdown(self.data)
+        return self._html
 
     def __repr__(self):
         return self.raw
 
 
-@attr.s
-class BaseParameter(object):
+def _markdown(text):
+    import markdown2
+    return markdown2.markdown(text)
+
+
+def _cached_content(owner, name, data):
+    """
+    Returns a :py:class:`.Content` of ``data`` that is kept on ``owner``
+    for as long as ``data`` stays the same.
+    """
+    contents = owner.__dict__.setdefault("_contents", {})
+    content = contents.get(name)
+    if content is None or content.data != data:
+        content = contents[name] = Content(data)
+    return content
+
+
+def render_html(contents, processes=1):
+    """
+    Render the Markdown of ``contents`` ahead of time, so that reading
+    their :py:attr:`.Content.html` is a lookup.  The HTML is kept by each
+    :py:class:`.Content`, and so by the parsed API, for as long as the
+    API is.
+
+    :param contents: Iterable of :py:class:`.Content` objects
+    :param int processes: Number of worker processes to render with, \
+        or ``None`` for one per CPU.  Defaults to rendering in this process.
+    :returns: Number of distinct texts rendered, not counting those \
+        already rendered.
+    """
+    contents = [c for c in contents if c and c.data and c._html is None]
+    texts = sorted(set(c.data for c in contents))
+    if processes == 1 or len(texts) < 2:
+        rendered = [_markdown(t) for t in texts]
+    else:
+        from multiprocessing import Pool
+        pool = Pool(processes)
+        try:
+            rendered = pool.map(_markdown, texts)
+        finally:
+            pool.close()
+            pool.join()
+    html = dict(zip(texts, rendered))
+    for content in contents:
+        content._html = html[content.data]
+    return len(texts)
+
+
+@attr.s(cmp=False)
+class BaseParameter(Fingerprinted):
     """
     Base parameter with properties defined by the RAML spec's \
     'Named Parameters' section.
@@ -104,7 +156,7 @@ class BaseParameter(object):
     @property
     def description(self):
         if self.desc:
-            return Content(self.desc)
+            return _cached_content(self, "desc", self.desc)
         return None
 
     def _inherit_type_properties(self, inherited_param):
@@ -118,7 +170,7 @@ class BaseParameter(object):
                         setattr(self, n, attr)
 
 
-@attr.s
+@attr.s(cmp=False)
 class URIParameter(BaseParameter):
     """
     URI parameter with properties defined by the RAML specification's \
@@ -128,7 +180,7 @@ class URIParameter(BaseParameter):
     required = attr.ib(repr=False, default=True)
 
 
-@attr.s
+@attr.s(cmp=False)
 class QueryParameter(BaseParameter):
     """
     Query parameter with properties defined by the RAML specification's \
@@ -138,7 +190,7 @@ class QueryParameter(BaseParameter):
     required = attr.ib(repr=False, default=False)
 
 
-@attr.s
+@attr.s(cmp=False)
 class FormParameter(BaseParameter):
     """
     Form parameter with properties defined by the RAML specification's
@@ -151,7 +203,7 @@ class FormParameter(BaseParameter):
     required = attr.ib(repr=False, default=False)
 
 
-class Documentation(object):
+class Documentation(Fingerprinted):
     """
     User documentation for the API.
 
@@ -164,18 +216,22 @@ class Documentation(object):
 
     @property
     def title(self):
-        return Content(self._title)
+        return _cached_content(self, "title", self._title)
 
     @property
     def content(self):
-        return Content(self._content)
+        return _cached_content(self, "content", self._content)
+
+    @property
+    def fingerprint(self):
+        return fingerprint(self, ["_title", "_content"])
 
     def __repr__(self):  # NOCOV
         return "Documentation(title='{0}')".format(self.title)
 
 
-@attr.s
-class Header(object):
+@attr.s(cmp=False)
+class Header(Fingerprinted):
     """
     Header with properties defined by the RAML spec's 'Named Parameters'
     section, e.g.:
@@ -239,7 +295,7 @@ class Header(object):
     @property
     def description(self):
         if self.desc:
-            return Content(self.desc)
+            return _cached_content(self, "desc", self.desc)
         return None
 
     def _inherit_type_properties(self, inherited_param):
@@ -252,8 +308,8 @@ class Header(object):
                     setattr(self, n, attr)
 
 
-@attr.s
-class Body(object):
+@attr.s(cmp=False)
+class Body(Fingerprinted):
     """
     Body of the request/response.
 
@@ -292,9 +348,44 @@ class Body(object):
                     attr = getattr(param, n, None)
                     setattr(self, n, attr)
 
-
-@attr.s
-class Response(object):
+    def validate(self, payload, raw=False):
+        """
+        Validate a request/response payload against the body's JSON
+        ``schema``.  The schema is compiled on first use and shared with
+        every other ``Body`` defining the same schema.
+
+        :param payload: Decoded JSON document, or if ``raw`` is ``True``, \
+            the ``bytes``/``str`` of the JSON document.
+        :param bool raw: Decode ``payload`` before validating.
+        :returns: ``list`` of :py:class:`.errors.InvalidParameterError` s, \
+            empty if ``payload`` is valid or the body has no schema.
+        :raises InvalidParameterError: If the body's schema is not a \
+            JSON schema, e.g. the body is not JSON.
+        """
+        schema = self.schema
+        if not schema:
+            return []
+        cached = self.__dict__.get("_validator")
+        if cached is None or cached[0] is not schema:
+            # XML schemas are loaded into dicts, too
+            if not (isinstance(schema, dict) and
+                    _schema.is_json(self.mime_type)):
+                msg = "Body schema for '{0}' is not a JSON schema.".format(
+                    self.mime_type)
+                raise InvalidParameterError(msg, "body")
+            cached = (schema, _schema.get_validator(schema))
+            self._validator = cached
+        return _schema.validate_json(cached[1], payload, raw)
+
+    def __getstate__(self):
+        # compiled validators are rebuilt on demand, not serialized
+        state = self.__dict__.copy()
+        state.pop("_validator", None)
+        return state
+
+
+@attr.s(cmp=False)
+class Response(Fingerprinted):
     """
     Expected response parameters.
 
@@ -319,7 +410,7 @@ class Response(object):
     @property
     def description(self):
         if self.desc:
-            return Content(self.desc)
+            return _cached_content(self, "desc", self.desc)
         return None
 
     def _inherit_type_properties(self, inherited_param):
@@ -331,8 +422,8 @@ class Response(object):
                     setattr(self, n, attr)
 
 
-@attr.s
-class SecurityScheme(object):
+@attr.s(cmp=False)
+class SecurityScheme(Fingerprinted):
     """
     Security scheme definition.
 
@@ -358,5 +449,5 @@ class SecurityScheme(object):
     @property
     def description(self):
         if self.desc:
-            return Content(self.desc)
+            return _cached_content(self, "desc", self.desc)
         return None
@@ -3,13 +3,14 @@
 
 from __future__ import absolute_import, division, print_function
 import re
+import threading
 
 import attr
 from six import iteritems, iterkeys, itervalues
 
 
-from .config import MEDIA_TYPES
-from .errors import InvalidRAMLError
+from . import config as _config
+from .errors import ErrorList, InvalidRAMLError
 from .parameters import (
     Documentation, Header, Body, Response, URIParameter, QueryParameter,
     FormParameter, SecurityScheme
@@ -18,6 +19,7 @@ from .parser_utils import (
     security_schemes
 )
 from .raml import RootNode, ResourceNode, ResourceTypeNode, TraitNode
+from .stats import timed
 from .utils import (
     load_schema, _resource_type_lookup,
     _get_resource_type, _get_trait, _get_attribute,
@@ -31,37 +33,55 @@ from .utils import (
 
 __all__ = ["parse_raml"]
 
+# attrs only has a process-wide switch for running validators, which
+# parse_raml() flips; one parse at a time keeps threads from parsing
+# with another thread's setting.
+_PARSE_LOCK = threading.RLock()
 
-def parse_raml(loaded_raml, config):
+
+def parse_raml(loaded_raml, config, stats=None):
     """
     Parse loaded RAML file into RAML/Python objects.
 
     :param RAMLDict loaded_raml: OrderedDict of loaded RAML file
+    :param ParseStats stats: Records the time spent in each phase and \
+        the number of objects created, if given \
+        (see :py:class:`.stats.ParseStats`).
     :returns: :py:class:`.raml.RootNode` object.
-    :raises: :py:class:`.errors.InvalidRAMLError` when RAML file is invalid
+    :raises: :py:class:`.errors.InvalidRAMLError` when RAML file is invalid,
+        or as soon as ``max_errors`` (if set in ``config``) errors are found
     """
 
-    validate = str(_get(config, "validate")).lower() == 'true'
+    with _PARSE_LOCK:
+        validate = str(_get(config, "validate")).lower() == 'true'
 
-    # Postpone validating the root node until the end; otherwise,
-    # we end up with duplicate validation exceptions.
-    attr.set_run_validators(False)
-    root = create_root(loaded_raml, config)
-    attr.set_run_validators(validate)
+        # Postpone validating the root node until the end; otherwise,
+        # we end up with duplicate validation exceptions.
+        attr.set_run_validators(False)
+        with timed(stats, "create_root"):
+            root = create_root(loaded_raml, config)
+        attr.set_run_validators(validate)
 
-    root.security_schemes = create_sec_schemes(root.raml_obj, root)
-    root.traits = create_traits(root.raml_obj, root)
-    root.resource_types = create_resource_types(root.raml_obj, root)
-    root.resources = create_resources(root.raml_obj, [], root,
-                                      parent=None)
+        with timed(stats, "create_sec_schemes"):
+            root.security_schemes = create_sec_schemes(root.raml_obj, root)
+        with timed(stats, "create_traits"):
+            root.traits = create_traits(root.raml_obj, root)
+        with timed(stats, "create_resource_types"):
+            root.resource_types = create_resource_types(root.raml_obj, root)
+        with timed(stats, "create_resources"):
+            root.resources = create_resources(root.raml_obj, [], root,
+                                              parent=None)
+        if stats is not None:
+            stats.count(root)
 
-    if validate:
-        attr.validate(root)  # need to validate again for root node
+        if validate:
+            with timed(stats, "validation"):
+                attr.validate(root)  # need to validate again for root node
 
-        if root.errors:
-            raise InvalidRAMLError(root.errors)
+            if root.errors:
+                raise InvalidRAMLError(root.errors)
 
-    return root
+        return root
 
 
 def create_root(raml, config):
@@ -72,7 +92,7 @@ def create_root(raml, config):
     :returns: :py:class:`.raml.RootNode` object with API root attributes set
     """
 
-    errors = []
+    errors = ErrorList(_get(config, "max_errors"))
 
     def protocols():
         explicit_protos = _get(raml, "protocols")
@@ -834,7 +854,7 @@ def create_node(name, raw_data, method, parent, root):
             body_list = []
             default_body = {}
             for (key, spec) in body.items():
-                if key not in MEDIA_TYPES:
+                if key not in _config.MEDIA_TYPES:
                     # if a root mediaType was defined, the response body
                     # may omit the mime_type definition
                     if key in ('schema', 'example'):
@@ -881,8 +901,7 @@ def create_node(name, raw_data, method, parent, root):
         resp_codes = [r.code for r in resp_objs]
         for k, v in list(iteritems(resps)):
             if k in resp_codes:
-                resp = [r for r in resp_objs if r.code == k][0]
-                index = resp_objs.index(resp)
+                index = [r.code for r in resp_objs].index(k)
                 inherit_resp = resp_objs.pop(index)
                 headers = resp_headers(_get(v, "headers", default={}))
                 if inherit_resp.headers:
@@ -4,12 +4,16 @@
 from __future__ import absolute_import, division, print_function
 
 import attr
-from six.moves import BaseHTTPServer as httpserver  # NOQA
 
-from .parameters import Content
+from .parameters import _cached_content, render_html
+from . import serialize
+from .fingerprint import Fingerprinted
+from .index import ResourceIndex
+from .memory import memory_report
+from .request import RequestValidator
+from .router import Router
 from .validate import *  # NOQA
 
-HTTP_RESP_CODES = httpserver.BaseHTTPRequestHandler.responses.keys()
 AVAILABLE_METHODS = [
     "get", "post", "put", "delete", "patch", "head", "options",
     "trace", "connect"
@@ -19,9 +23,44 @@ METHOD_PROPERTIES = [
     "headers", "body", "responses", "query_params", "form_params"
 ]
 
+DESCRIBED_PROPERTIES = [
+    "headers", "responses", "uri_params", "base_uri_params", "query_params",
+    "form_params"
+]
+
+
+def _descriptions(root):
+    for doc in root.documentation or []:
+        yield doc.title
+        yield doc.content
+    nodes = [root]
+    for name in ("traits", "resource_types", "resources", "security_schemes"):
+        nodes.extend(getattr(root, name, None) or [])
+    for node in nodes:
+        yield getattr(node, "description", None)
+        for name in DESCRIBED_PROPERTIES:
+            for param in getattr(node, name, None) or []:
+                yield param.description
+                # response headers
+                for header in getattr(param, "headers", None) or []:
+                    yield header.description
+
 
-@attr.s
-class RootNode(object):
+def render_all_html(root, processes=1):
+    """
+    Render the Markdown of every description and documentation in an
+    API ahead of time, e.g. before serving its documentation.
+
+    :param RootNode root: Parsed API
+    :param int processes: Number of worker processes to render with, \
+        or ``None`` for one per CPU.  Defaults to rendering in this process.
+    :returns: Number of texts rendered, not counting those already rendered.
+    """
+    return render_html(_descriptions(root), processes)
+
+
+@attr.s(cmp=False)
+class RootNode(Fingerprinted):
     """
     API Root Node
 
@@ -73,9 +112,108 @@ class RootNode(object):
                                validator=attr.validators.instance_of(dict))
     errors           = attr.ib(repr=False)
 
+    def dump(self, fileobj):
+        """
+        Serialize the parsed API into a binary file object, to be loaded
+        again with :py:func:`ramlfications.load_parsed` without re-parsing
+        the RAML file.
+
+        :param fileobj: File object opened in binary mode
+        """
+        serialize.dump(self, fileobj)
+
+    def memory_report(self, peak=None):
+        """
+        Break down the memory retained by the parsed API by class, \
+        separating objects shared within the API from unique ones.
+
+        :param int peak: Peak bytes allocated while parsing, if measured \
+            (see :py:func:`.memory.peak_memory`).
+        :rtype: :py:class:`.memory.MemoryReport`
+        """
+        return memory_report(self, peak)
+
+    def match(self, method, url):
+        """
+        Find the resource defining ``method`` on ``url``.  The route index
+        is built on first use.
 
-@attr.s
-class BaseNode(object):
+        :param str method: HTTP method, or ``None`` for resources that \
+            do not define any methods.
+        :param str url: Absolute URL under the API's base URI, or path \
+            relative to the base URI.
+        :returns: ``(ResourceNode, dict)`` of the matching resource and the \
+            values of its URI parameters, or ``None`` if nothing matches.
+        """
+        return self._route_index().match(method, url)
+
+    def _route_index(self):
+        router = self.__dict__.get("_router")
+        if router is None:
+            router = self._router = Router(self)
+        return router
+
+    def _resource_index(self):
+        index = self.__dict__.get("_index")
+        if index is None:
+            index = self._index = ResourceIndex(self)
+        return index
+
+    def resource(self, path, method=None):
+        """
+        Find a resource by its path and method.  This and the other
+        lookups below share an index of the resources, built on first use.
+
+        :param str path: Path of the resource, e.g. ``/users/{userId}``
+        :param str method: HTTP method, or ``None`` for resources that \
+            do not define any methods.
+        :returns: :py:class:`ResourceNode`, or ``None``
+        """
+        return self._resource_index().resource(path, method)
+
+    def resources_by_trait(self, name):
+        """
+        :returns: ``list`` of :py:class:`ResourceNode` s assigned the \
+            trait ``name``.
+        """
+        return self._resource_index().resources_by_trait(name)
+
+    def resources_by_type(self, name):
+        """
+        :returns: ``list`` of :py:class:`ResourceNode` s assigned the \
+            resource type ``name``.
+        """
+        return self._resource_index().resources_by_type(name)
+
+    def resources_secured_by(self, scheme, scope=None):
+        """
+        :param str scheme: Name of the security scheme
+        :param str scope: Only resources requiring this scope (e.g. an \
+            OAuth 2 scope), if given.
+        :returns: ``list`` of :py:class:`ResourceNode` s secured by \
+            ``scheme``.
+        """
+        return self._resource_index().resources_secured_by(scheme, scope)
+
+    def resources_by_media_type(self, media_type):
+        """
+        :returns: ``list`` of :py:class:`ResourceNode` s with a request or \
+            response body of ``media_type``.
+        """
+        return self._resource_index().resources_by_media_type(media_type)
+
+    def children(self, node=None):
+        """
+        :param ResourceNode node: Parent resource, or ``None`` for the \
+            top-level resources.
+        :returns: ``list`` of :py:class:`ResourceNode` s nested directly \
+            under the path of ``node``, for all of its methods.
+        """
+        return self._resource_index().children(node)
+
+
+@attr.s(cmp=False)
+class BaseNode(Fingerprinted):
     """
     :param dict raw: The raw data parsed from the RAML file
     :param RootNode root: Back reference to the node's API root
@@ -118,10 +256,10 @@ class BaseNode(object):
 
     @property
     def description(self):
-        return Content(self.desc)
+        return _cached_content(self, "desc", self.desc)
 
 
-@attr.s
+@attr.s(cmp=False)
 class TraitNode(BaseNode):
     """
     RAML Trait object
@@ -134,7 +272,7 @@ class TraitNode(BaseNode):
     usage = attr.ib(repr=False)
 
 
-@attr.s
+@attr.s(cmp=False)
 class ResourceTypeNode(BaseNode):
     """
     RAML Resource Type object
@@ -173,7 +311,7 @@ class ResourceTypeNode(BaseNode):
     display_name     = attr.ib(repr=False)
 
 
-@attr.s
+@attr.s(cmp=False)
 class ResourceNode(BaseNode):
     """
     Supported API-endpoint (“resource”)
@@ -221,3 +359,15 @@ class ResourceNode(BaseNode):
             if resource_prop and inherited_prop:
                 for r in resource_prop:
                     r._inherit_type_properties(inherited_prop)
+
+    def compile_validator(self):
+        """
+        Returns a :py:class:`.request.RequestValidator` checking incoming
+        requests against this resource's URI parameters, query parameters,
+        headers and form parameters.  The validator is compiled once and
+        reused on later calls.
+        """
+        validator = self.__dict__.get("_validator")
+        if validator is None:
+            validator = self._validator = RequestValidator(self)
+        return validator
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+__all__ = ["RefCache"]
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+from multiprocessing.pool import ThreadPool
+
+import jsonref
+import six
+from six.moves.urllib.parse import urldefrag, urljoin, urlsplit
+
+try:  # NOCOV
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+    import six.moves.urllib.request as urllib
+    import six.moves.urllib.error as urllib_error
+
+from .errors import LoadRAMLError
+
+
+REMOTE_SCHEMES = ("http", "https")
+
+
+def _is_remote(uri):
+    return urlsplit(uri).scheme in REMOTE_SCHEMES
+
+
+def _ref_uris(obj, base_uri, found):
+    """
+    Collects the URIs of the documents ``obj`` refers to, without
+    resolving any ``jsonref`` proxies.
+    """
+    if isinstance(obj, jsonref.JsonRef):
+        # plain attribute access would resolve the proxy
+        uri = object.__getattribute__(obj, "full_uri")
+    elif isinstance(obj, dict):
+        ref = obj.get("$ref")
+        if not isinstance(ref, six.string_types):
+            for value in obj.values():
+                _ref_uris(value, base_uri, found)
+            return
+        uri = urljoin(base_uri, ref)
+    elif isinstance(obj, list):
+        for value in obj:
+            _ref_uris(value, base_uri, found)
+        return
+    else:
+        return
+    found.add(urldefrag(uri)[0])
+
+
+def _remote_refs(obj, base_uri, found):
+    """Collects the remote documents ``obj`` refers to."""
+    uris = set()
+    _ref_uris(obj, base_uri, uris)
+    found.update(uri for uri in uris if _is_remote(uri))
+
+
+class RefCache(object):
+    """
+    Fetches remote (HTTP/S) ``$ref`` targets of included JSON schemas for
+    :py:class:`.loader.RAMLLoader`, and keeps them for later parses.
+
+    All remote documents a schema refers to, directly or through other
+    remote documents, are fetched concurrently over one pooled HTTP
+    session (``requests`` if it is installed, ``urllib`` otherwise).
+    With a ``cache_dir``, fetched documents are stored on disk along with
+    their ``ETag`` and ``Last-Modified`` headers; they are revalidated
+    with conditional requests, and used as is when offline or when the
+    server can not be reached.
+
+    :param str cache_dir: Directory to persist fetched documents in, \
+        if any.
+    :param bool offline: Never make HTTP requests; every remote document \
+        must already be in ``cache_dir``.
+    :param int max_workers: Number of documents to fetch at once.
+    :param float timeout: Seconds to wait for each HTTP response.
+    """
+    def __init__(self, cache_dir=None, offline=False, max_workers=8,
+                 timeout=30):
+        if offline and not cache_dir:
+            msg = "Offline mode requires a cache directory."
+            raise LoadRAMLError(msg)
+        self.cache_dir = cache_dir
+        self.offline = offline
+        self.max_workers = max_workers
+        self.timeout = timeout
+        # URL -> JSON text, for documents fetched or revalidated by
+        # this instance
+        self._documents = {}
+        self._lock = threading.Lock()
+        self._session = None
+        if requests is not None and not offline:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=max_workers,
+                                  pool_maxsize=max_workers)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+        if cache_dir and not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+
+    def __call__(self, uri):
+        """
+        Returns the decoded JSON document at ``uri``.  Passed to
+        ``jsonref`` as its ``loader``.
+        """
+        if not _is_remote(uri):
+            return jsonref.jsonloader(uri)
+        text = self._documents.get(uri)
+        if text is None:
+            text = self._get(uri)
+        # a fresh copy, since jsonref replaces references in place
+        return json.loads(text)
+
+    def prefetch(self, schema, base_uri=""):
+        """
+        Fetch every remote document ``schema`` refers to, directly or
+        through other remote documents.
+
+        :param schema: Decoded JSON schema, as returned by ``jsonref``.
+        :param str base_uri: URI that relative ``$ref`` s in ``schema`` \
+            are relative to.
+        :raises LoadRAMLError: If a document can not be fetched, nor \
+            found in the cache.
+        """
+        found = set()
+        _remote_refs(schema, base_uri, found)
+        seen = set()
+        while found - seen:
+            batch = sorted(found - seen)
+            seen.update(batch)
+            missing = [u for u in batch if u not in self._documents]
+            if len(missing) > 1:
+                pool = ThreadPool(min(self.max_workers, len(missing)))
+                try:
+                    pool.map(self._get, missing)
+                finally:
+                    pool.close()
+                    pool.join()
+            elif missing:
+                self._get(missing[0])
+            for uri in batch:
+                _remote_refs(json.loads(self._documents[uri]), uri, found)
+
+    def _get(self, uri):
+        cached = self._read_cache(uri)
+        if self.offline:
+            if cached is None:
+                msg = "Remote reference '{0}' is not cached (offline).".format(
+                    uri)
+                raise LoadRAMLError(msg)
+            text = cached["document"]
+        else:
+            text = self._fetch(uri, cached)
+        with self._lock:
+            self._documents[uri] = text
+        return text
+
+    def _fetch(self, uri, cached):
+        headers = {}
+        if cached is not None:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        try:
+            if self._session is not None:
+                status, text, etag, modified = self._requests_get(
+                    uri, headers)
+            else:
+                status, text, etag, modified = self._urllib_get(uri, headers)
+        except Exception as e:  # any network failure
+            if cached is not None:
+                return cached["document"]
+            msg = "Could not fetch remote reference '{0}': {1}".format(uri, e)
+            raise LoadRAMLError(msg)
+
+        if status == 304 and cached is not None:
+            return cached["document"]
+        try:
+            json.loads(text)
+        except ValueError as e:
+            msg = "Remote reference '{0}' is not valid JSON: {1}".format(
+                uri, e)
+            raise LoadRAMLError(msg)
+        self._write_cache(uri, text, etag, modified)
+        return text
+
+    def _requests_get(self, uri, headers):
+        response = self._session.get(uri, headers=headers,
+                                     timeout=self.timeout)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return (response.status_code, response.text,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"))
+
+    def _urllib_get(self, uri, headers):
+        request = urllib.Request(uri, headers=headers)
+        try:
+            response = urllib.urlopen(request, timeout=self.timeout)
+        except urllib_error.HTTPError as e:
+            if e.code == 304:
+                return 304, None, None, None
+            raise
+        try:
+            text = response.read().decode("utf-8")
+            info = response.info()
+            return (response.getcode(), text, info.get("ETag"),
+                    info.get("Last-Modified"))
+        finally:
+            response.close()
+
+    def _cache_path(self, uri):
+        key = hashlib.sha1(uri.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def _read_cache(self, uri):
+        if not self.cache_dir:
+            return None
+        try:
+            with io.open(self._cache_path(uri), encoding="utf-8") as f:
+                cached = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+        if cached.get("url") != uri:
+            return None
+        return cached
+
+    def _write_cache(self, uri, text, etag, modified):
+        if not self.cache_dir:
+            return
+        data = json.dumps({"url": uri, "etag": etag,
+                           "last_modified": modified, "document": text})
+        # write then rename, so other processes never see partial files
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with io.open(fd, "w", encoding="utf-8") as f:
+            f.write(six.text_type(data))
+        os.rename(tmp, self._cache_path(uri))
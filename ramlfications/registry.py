@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+__all__ = ["SpecRegistry"]
+
+try:
+    from collections import OrderedDict
+except ImportError:  # NOCOV
+    from ordereddict import OrderedDict  # NOCOV
+
+import threading
+
+import attr
+from six.moves import intern
+
+from .fingerprint import fingerprint, hash_value, semantic_fields
+from .memory import memory_report
+
+# Attributes holding lists of objects that may be shared between APIs
+SHARED_ATTRIBUTES = frozenset([
+    "headers", "body", "responses", "uri_params", "base_uri_params",
+    "query_params", "form_params", "security_schemes"
+])
+
+# Attributes holding lists of nodes, which are never shared: they refer
+# back to their own API
+NODE_ATTRIBUTES = frozenset(["resource_types", "traits", "resources"])
+
+
+class _Interner(object):
+    """
+    Shares equal parameters, headers, bodies, responses, security
+    schemes and JSON schemas between APIs, and interns their strings.
+    Each shared object is kept for as long as an API uses it.
+    """
+    def __init__(self):
+        # key -> [object, number of APIs using it]
+        self._objects = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._objects)
+
+    def add(self, root):
+        """
+        Replace the objects of ``root`` with equal ones of earlier APIs.
+
+        :returns: Keys of the shared objects ``root`` uses, to be passed \
+            to :py:meth:`release` once ``root`` is dropped.
+        """
+        # hashes every object of the API, without holding the lock
+        fingerprint(root)
+        with self._lock:
+            return self._add(root)
+
+    def _add(self, root):
+        used = set()
+        # id -> (object, its replacement); keeps objects alive, so that
+        # their ids are not reused while walking
+        memo = {}
+
+        def share(key, obj):
+            entry = self._objects.get(key)
+            if entry is None:
+                entry = self._objects[key] = [obj, 0]
+            if key not in used:
+                used.add(key)
+                entry[1] += 1
+            return entry[0]
+
+        def visit(obj):
+            seen = memo.get(id(obj))
+            if seen is not None:
+                return seen[1]
+            memo[id(obj)] = (obj, obj)
+            for name in semantic_fields(obj):
+                value = getattr(obj, name)
+                if type(value) is str:
+                    setattr(obj, name, intern(value))
+                elif name in SHARED_ATTRIBUTES and isinstance(value, list):
+                    # e.g. a body's form parameters are a raw ``dict``
+                    value[:] = [visit(item) if attr.has(type(item)) else item
+                                for item in value]
+                elif name in NODE_ATTRIBUTES and value:
+                    for node in value:
+                        visit(node)
+                elif name == "schema" and isinstance(value, (dict, list)):
+                    key = ("schema", hash_value(value))
+                    setattr(obj, name, share(key, value))
+            if _is_node(obj):
+                return obj
+            shared = share((type(obj).__name__, obj.fingerprint), obj)
+            memo[id(obj)] = (obj, shared)
+            return shared
+
+        visit(root)
+        return used
+
+    def release(self, keys):
+        """Drop the shared objects no API uses any more."""
+        with self._lock:
+            for key in keys:
+                entry = self._objects.get(key)
+                if entry is not None:
+                    entry[1] -= 1
+                    if entry[1] <= 0:
+                        del self._objects[key]
+
+
+def _is_node(obj):
+    # resource, trait & resource type nodes, and the root
+    return hasattr(obj, "root") or hasattr(obj, "resources")
+
+
+class _Flight(object):
+    """One load of an API, waited on by everyone asking for it meanwhile."""
+    def __init__(self):
+        self._done = threading.Event()
+        self.root = None
+        self.error = None
+
+    def finish(self, root=None, error=None):
+        self.root = root
+        self.error = error
+        self._done.set()
+
+    def wait(self):
+        self._done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.root
+
+
+@attr.s
+class _Entry(object):
+    root = attr.ib()
+    size = attr.ib()
+    shared = attr.ib()
+
+
+def _parse(key, config_file=None):
+    from ramlfications import parse
+    return parse(key, config_file)
+
+
+def _size(root):
+    return memory_report(root).total
+
+
+class SpecRegistry(object):
+    """
+    Parsed APIs of many RAML files in one process, loaded on first use
+    and dropped least recently used first.
+
+    Equal parameters, headers, bodies, responses, security schemes and
+    JSON schemas (by :py:attr:`fingerprint`) are shared between the APIs,
+    and their strings are interned.  Shared objects keep the raw data of
+    the API that loaded them first.
+
+    When several threads ask for an API that is not loaded, it is loaded
+    once, and they all get the same :py:class:`.raml.RootNode`.
+
+    :param loader: Function returning the :py:class:`.raml.RootNode` of \
+        a key, e.g. a RAML file path.  Defaults to \
+        :py:func:`ramlfications.parse` with ``config_file``.
+    :param str config_file: Config file for the default ``loader``.
+    :param int max_bytes: Memory budget: drop APIs while their sizes add \
+        up to more than this.  The most recently used API is always kept.
+    :param int max_specs: Most APIs to keep loaded, if given.
+    :param size: Function returning the size in bytes of an API.  \
+        Defaults to the total of :py:func:`.memory.memory_report`, which \
+        counts shared objects towards every API using them, but not the \
+        configuration every API shares.
+    """
+    def __init__(self, loader=None, config_file=None, max_bytes=None,
+                 max_specs=None, size=None):
+        if loader is None:
+            def loader(key):
+                return _parse(key, config_file)
+        self._loader = loader
+        self.max_bytes = max_bytes
+        self.max_specs = max_specs
+        self._size = size or _size
+        # key -> _Entry, least recently used first
+        self._entries = OrderedDict()
+        # key -> _Flight, of APIs being loaded
+        self._flights = {}
+        self._interner = _Interner()
+        self._lock = threading.Lock()
+        self.size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def keys(self):
+        """Keys of the loaded APIs, least recently used first."""
+        with self._lock:
+            return list(self._entries)
+
+    def get(self, key):
+        """
+        Returns the API of ``key``, loading it if it is not loaded.
+
+        :raises: Whatever the ``loader`` raises, e.g. \
+            :py:class:`.errors.InvalidRAMLError`; the failure is not kept.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._entries[key] = entry
+                return entry.root
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            return flight.wait()
+
+        try:
+            root = self._loader(key)
+            shared = self._interner.add(root)
+            size = self._size(root)
+        except Exception as e:
+            with self._lock:
+                del self._flights[key]
+            flight.finish(error=e)
+            raise
+
+        with self._lock:
+            del self._flights[key]
+            self._entries[key] = _Entry(root, size, shared)
+            self.size += size
+            self._evict()
+        flight.finish(root)
+        return root
+
+    def discard(self, key):
+        """Drop the API of ``key``, if it is loaded."""
+        with self._lock:
+            self._drop(key)
+
+    def clear(self):
+        """Drop every API."""
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key)
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+            self._interner.release(entry.shared)
+
+    def _evict(self):
+        while len(self._entries) > 1 and (
+                (self.max_specs is not None and
+                 len(self._entries) > self.max_specs) or
+                (self.max_bytes is not None and self.size > self.max_bytes)):
+            self._drop(next(iter(self._entries)))
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+__all__ = ["RequestValidator"]
+
+import re
+
+import six
+
+from .errors import InvalidParameterError
+
+
+#####
+# Type coercers: return the typed value or raise ValueError
+#####
+
+def _to_string(value):
+    return value
+
+
+def _to_integer(value):
+    if isinstance(value, bool):
+        raise ValueError(value)
+    if isinstance(value, six.integer_types):
+        return value
+    return int(value)
+
+
+def _to_number(value):
+    if isinstance(value, bool):
+        raise ValueError(value)
+    if isinstance(value, (float, ) + six.integer_types):
+        return value
+    return float(value)
+
+
+def _to_boolean(value):
+    if isinstance(value, bool):
+        return value
+    if value == "true":
+        return True
+    if value == "false":
+        return False
+    raise ValueError(value)
+
+
+def _to_date(value):
+    # RAML dates follow RFC 2616, e.g. "Sun, 06 Nov 1994 08:49:37 GMT"
+    from email.utils import parsedate
+    if parsedate(value) is None:
+        raise ValueError(value)
+    return value
+
+
+def _to_text(value):
+    # what patterns, lengths & enums are checked against
+    if isinstance(value, six.text_type):
+        return value
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return six.text_type(value)
+
+
+COERCERS = {
+    "string": _to_string,
+    "integer": _to_integer,
+    "number": _to_number,
+    "boolean": _to_boolean,
+    "date": _to_date,
+    "file": _to_string,
+}
+
+
+class _CompiledParameter(object):
+    """A named parameter's constraints, prepared once for validation."""
+    __slots__ = ("name", "required", "repeat", "type", "coerce", "enum",
+                 "pattern", "min_length", "max_length", "minimum", "maximum")
+
+    def __init__(self, param, kind):
+        self.name = param.name
+        self.required = bool(param.required)
+        self.repeat = bool(param.repeat)
+        self.type = param.type or "string"
+        self.coerce = COERCERS.get(self.type, _to_string)
+        self.enum = None
+        if param.enum:
+            self.enum = frozenset(_to_text(e) for e in param.enum)
+        self.pattern = None
+        if param.pattern:
+            try:
+                self.pattern = re.compile(param.pattern)
+            except re.error as e:
+                msg = "Invalid pattern for {0} '{1}': {2}".format(
+                    kind, param.name, e)
+                raise InvalidParameterError(msg, kind)
+        self.min_length = param.min_length
+        self.max_length = param.max_length
+        self.minimum = param.minimum
+        self.maximum = param.maximum
+
+    def check(self, value):
+        """Returns an error message if ``value`` is invalid, else ``None``."""
+        try:
+            typed = self.coerce(value)
+        except (TypeError, ValueError):
+            return "'{0}' must be of type {1}, not '{2}'.".format(
+                self.name, self.type, value)
+        value = _to_text(value)
+        if self.enum is not None and value not in self.enum:
+            return "'{0}' must be one of {1}, not '{2}'.".format(
+                self.name, sorted(self.enum), value)
+        if self.pattern is not None and not self.pattern.search(value):
+            return "'{0}' must match pattern '{1}', not '{2}'.".format(
+                self.name, self.pattern.pattern, value)
+        if self.min_length is not None and len(value) < self.min_length:
+            return "'{0}' must be at least {1} characters long.".format(
+                self.name, self.min_length)
+        if self.max_length is not None and len(value) > self.max_length:
+            return "'{0}' must be at most {1} characters long.".format(
+                self.name, self.max_length)
+        if self.minimum is not None and typed < self.minimum:
+            return "'{0}' must be at least {1}, not {2}.".format(
+                self.name, self.minimum, typed)
+        if self.maximum is not None and typed > self.maximum:
+            return "'{0}' must be at most {1}, not {2}.".format(
+                self.name, self.maximum, typed)
+        return None
+
+
+class RequestValidator(object):
+    """
+    Validates the named parameters of an incoming request against a
+    :py:class:`.raml.ResourceNode`.
+
+    Types, enums, patterns, length & value ranges, ``required`` and
+    ``repeat`` of the node's URI parameters, query parameters, headers
+    and form parameters are compiled once, so that validating a request
+    is a single pass over its parameters.
+
+    :param ResourceNode node: Resource to validate requests for
+    :raises InvalidParameterError: If a parameter's ``pattern`` is not a \
+        valid regular expression.
+    """
+    def __init__(self, node):
+        self.uri_params = self._compile(node.uri_params, "uri")
+        self.query_params = self._compile(node.query_params, "query")
+        self.headers = self._compile(node.headers, "header")
+        self.form_params = self._compile(node.form_params, "form")
+
+    @staticmethod
+    def _compile(params, kind):
+        return tuple(_CompiledParameter(p, kind) for p in params or [])
+
+    def validate(self, uri_params=None, query_params=None, headers=None,
+                 form_params=None):
+        """
+        Validate a request's parameters.  Each argument maps parameter
+        names to a value, or to a ``list`` of values for repeated
+        parameters.  Header names are case-insensitive.  Parameters not
+        defined in the RAML file are ignored.
+
+        :returns: ``list`` of :py:class:`.errors.InvalidParameterError` s, \
+            empty if the request is valid.
+        """
+        errors = []
+        if headers:
+            headers = dict((k.lower(), v) for k, v in six.iteritems(headers))
+            lookup = self._lookup_header
+        else:
+            lookup = self._lookup
+        self._check(self.uri_params, uri_params, "uri", self._lookup, errors)
+        self._check(self.query_params, query_params, "query", self._lookup,
+                    errors)
+        self._check(self.headers, headers, "header", lookup, errors)
+        self._check(self.form_params, form_params, "form", self._lookup,
+                    errors)
+        return errors
+
+    @staticmethod
+    def _lookup(values, name):
+        return values.get(name)
+
+    @staticmethod
+    def _lookup_header(values, name):
+        return values.get(name.lower())
+
+    @staticmethod
+    def _check(compiled, values, kind, lookup, errors):
+        values = values or {}
+        for param in compiled:
+            value = lookup(values, param.name)
+            if isinstance(value, (list, tuple)) and not value:
+                value = None
+            if value is None:
+                if param.required:
+                    msg = "Missing required {0} parameter '{1}'.".format(
+                        kind, param.name)
+                    errors.append(InvalidParameterError(msg, kind))
+                continue
+            if isinstance(value, (list, tuple)):
+                if len(value) > 1 and not param.repeat:
+                    msg = "{0} parameter '{1}' can not be repeated.".format(
+                        kind.capitalize(), param.name)
+                    errors.append(InvalidParameterError(msg, kind))
+                    continue
+            else:
+                value = (value, )
+            for v in value:
+                msg = param.check(v)
+                if msg:
+                    errors.append(InvalidParameterError(msg, kind))
+                    break
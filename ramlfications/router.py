@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+__all__ = ["Router"]
+
+import re
+
+from six.moves.urllib.parse import unquote, urlsplit
+
+
+PARAM_PATTERN = re.compile(r"\{(.*?)\}")
+
+# Values of RAML's reserved URI parameter, e.g. ``/users{mediaTypeExtension}``
+# matching ``/users.json``
+MEDIA_TYPE_EXTENSION = "mediaTypeExtension"
+
+
+def _split(path):
+    return [unquote(s) for s in path.split("/") if s]
+
+
+def _compile_segment(segment):
+    """
+    Returns a regex matching a path segment that mixes static text and
+    URI parameters (e.g. ``ids{mediaTypeExtension}``), and the names of
+    its parameters in order.
+    """
+    parts = PARAM_PATTERN.split(segment)
+    static, names = parts[::2], parts[1::2]
+    regex = re.escape(static[0])
+    for name, text in zip(names, static[1:]):
+        if name == MEDIA_TYPE_EXTENSION:
+            regex += r"(\.[^.]+)"
+        else:
+            regex += "(.+?)"
+        regex += re.escape(text)
+    return re.compile(regex + "$"), names
+
+
+class _Trie(object):
+    """One path segment of the :py:class:`Router` index."""
+    __slots__ = ("static", "patterns", "wildcards", "methods")
+
+    def __init__(self):
+        # segment -> _Trie, for segments without URI parameters
+        self.static = {}
+        # (regex, param names, static length, _Trie), for segments mixing
+        # static text and URI parameters
+        self.patterns = []
+        # param name -> _Trie, for segments that are one URI parameter
+        self.wildcards = {}
+        # HTTP method (or ``None``) -> ResourceNode
+        self.methods = {}
+
+    def child(self, segment):
+        names = PARAM_PATTERN.findall(segment)
+        if not names:
+            return self.static.setdefault(segment, _Trie())
+        if segment == "{" + names[0] + "}":
+            return self.wildcards.setdefault(names[0], _Trie())
+        regex, names = _compile_segment(segment)
+        for other, _, _, child in self.patterns:
+            if other.pattern == regex.pattern:
+                return child
+        child = _Trie()
+        static_len = len(PARAM_PATTERN.sub("", segment))
+        self.patterns.append((regex, names, static_len, child))
+        # try the most specific patterns first
+        self.patterns.sort(key=lambda p: -p[2])
+        return child
+
+
+class Router(object):
+    """
+    Maps an HTTP method and a URL to the :py:class:`.raml.ResourceNode`
+    that defines it.
+
+    The index is a trie of path segments built once from every resource's
+    ``path``.  Segments that contain URI parameters match any value; when
+    a URL matches more than one resource, static segments are preferred
+    over URI parameters.
+
+    :param RootNode root: Parsed API
+    """
+    def __init__(self, root):
+        self._trie = _Trie()
+        for node in root.resources or []:
+            trie = self._trie
+            for segment in node.path.split("/"):
+                if segment:
+                    trie = trie.child(segment)
+            trie.methods.setdefault(node.method, node)
+
+        base = urlsplit(root.base_uri or "")
+        self._base = [_compile_segment(s) for s in base.path.split("/") if s]
+        # absolute URLs must be on the base URI's host, over one of the
+        # API's protocols
+        self._schemes = frozenset(
+            [p.lower() for p in root.protocols or []] +
+            [base.scheme.lower()]) - frozenset([""])
+        self._host = None
+        if base.netloc:
+            self._host = _compile_segment(base.netloc.lower())
+
+    def match(self, method, url):
+        """
+        Find the resource defining ``method`` on ``url``.
+
+        :param str method: HTTP method, or ``None`` for resources that \
+            do not define any methods.
+        :param str url: Either an absolute URL under the API's base URI \
+            (e.g. ``https://api.github.com/users/foo``), or a path relative \
+            to the base URI (e.g. ``/users/foo``).  Query strings are \
+            ignored.  Absolute URLs on another host, or over a protocol \
+            the API does not support, match nothing.
+        :returns: ``(ResourceNode, dict)`` of the matching resource and the \
+            values of its URI parameters, or ``None`` if nothing matches.
+        """
+        if method is not None:
+            method = method.lower()
+        parts = urlsplit(url)
+        segments = _split(parts.path)
+        params = []
+        if parts.scheme or parts.netloc:
+            if self._schemes and parts.scheme.lower() not in self._schemes:
+                return None
+            if self._host is not None:
+                regex, names = self._host
+                m = regex.match(parts.netloc.lower())
+                if not m:
+                    return None
+                params.extend(zip(names, m.groups()))
+            if len(segments) < len(self._base):
+                return None
+            for segment, (regex, names) in zip(segments, self._base):
+                m = regex.match(segment)
+                if not m:
+                    return None
+                params.extend(zip(names, m.groups()))
+            segments = segments[len(self._base):]
+
+        node = self._match(self._trie, segments, 0, method, params)
+        if node is None:
+            return None
+        return node, dict(params)
+
+    def _match(self, trie, segments, index, method, params):
+        if index == len(segments):
+            return trie.methods.get(method)
+        segment = segments[index]
+
+        child = trie.static.get(segment)
+        if child is not None:
+            node = self._match(child, segments, index + 1, method, params)
+            if node is not None:
+                return node
+
+        size = len(params)
+        for regex, names, _, child in trie.patterns:
+            m = regex.match(segment)
+            if m:
+                params.extend(zip(names, m.groups()))
+                node = self._match(child, segments, index + 1, method,
+                                   params)
+                if node is not None:
+                    return node
+                del params[size:]
+
+        for name, child in trie.wildcards.items():
+            params.append((name, segment))
+            node = self._match(child, segments, index + 1, method, params)
+            if node is not None:
+                return node
+            del params[size:]
+        return None
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+__all__ = ["get_validator", "validate_json", "clear_cache", "is_json"]
+
+try:
+    from collections import OrderedDict
+except ImportError:  # NOCOV
+    from ordereddict import OrderedDict  # NOCOV
+
+import json
+import threading
+
+import six
+
+from .errors import InvalidParameterError
+
+# Most compiled validators kept; the least recently used are dropped
+MAX_VALIDATORS = 256
+
+# canonical schema -> compiled validator, least recently used first
+_VALIDATORS = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def _schema_key(schema, ancestors=()):
+    """
+    Key identical schemas alike, regardless of which ``Body`` they were
+    parsed for.  Recursive ``$ref`` s are keyed by how many levels up
+    they point.
+    """
+    if isinstance(schema, (dict, list)):
+        if id(schema) in ancestors:
+            return ("$cycle", len(ancestors) - ancestors.index(id(schema)))
+        ancestors = ancestors + (id(schema), )
+        if isinstance(schema, dict):
+            return ("{", ) + tuple(sorted(
+                (k, _schema_key(v, ancestors)) for k, v in schema.items()))
+        return ("[", ) + tuple(_schema_key(v, ancestors) for v in schema)
+    return (type(schema).__name__, schema)
+
+
+def is_json(mime_type):
+    """
+    Whether bodies of ``mime_type`` are JSON, and so have JSON schemas,
+    e.g. ``application/json`` or ``application/vnd.api+json``.
+    """
+    if not mime_type:
+        return False
+    mime_type = mime_type.split(";")[0].strip().lower()
+    return mime_type in ("application/json", "text/json") or \
+        mime_type.endswith("+json")
+
+
+def _compile(schema):
+    try:
+        from jsonschema.validators import validator_for
+    except ImportError:  # NOCOV
+        msg = ("Validating bodies against JSON schemas requires the "
+               "'jsonschema' package: pip install ramlfications[jsonschema]")
+        raise ImportError(msg)
+    return validator_for(schema)(schema)
+
+
+def get_validator(schema):
+    """
+    Returns a ``jsonschema`` validator for ``schema``, compiled once and
+    shared by every schema with the same content.  Only the
+    ``MAX_VALIDATORS`` most recently used validators are kept.
+
+    :param dict schema: Decoded JSON schema, e.g. :py:attr:`.Body.schema`
+    """
+    key = _schema_key(schema)
+    with _LOCK:
+        validator = _VALIDATORS.pop(key, None)
+        if validator is None:
+            validator = _compile(schema)
+        _VALIDATORS[key] = validator
+        while len(_VALIDATORS) > MAX_VALIDATORS:
+            _VALIDATORS.popitem(last=False)
+    return validator
+
+
+def clear_cache():
+    """Drop all compiled validators."""
+    with _LOCK:
+        _VALIDATORS.clear()
+
+
+def _error_message(error):
+    path = "/".join(six.text_type(p) for p in error.absolute_path)
+    return "{0}: {1}".format("/" + path, error.message)
+
+
+def validate_json(validator, payload, raw=False):
+    """
+    Validate ``payload`` with a validator from :py:func:`get_validator`.
+
+    :param payload: Decoded JSON document, or if ``raw`` is ``True``, \
+        the ``bytes``/``str`` of the JSON document.
+    :param bool raw: Decode ``payload`` before validating.
+    :returns: ``list`` of :py:class:`.errors.InvalidParameterError` s, \
+        empty if ``payload`` is valid.
+    """
+    if raw:
+        if isinstance(payload, bytes):
+            payload = payload.decode("utf-8")
+        try:
+            payload = json.loads(payload)
+        except ValueError as e:
+            msg = "Body is not valid JSON: {0}".format(e)
+            return [InvalidParameterError(msg, "body")]
+    if validator.is_valid(payload):
+        return []
+    return [InvalidParameterError(_error_message(e), "body")
+            for e in validator.iter_errors(payload)]
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+__all__ = ["dump", "dumps", "dump_module", "dumps_module", "load", "loads"]
+
+import io
+import pickle
+import struct
+import sys
+
+from six.moves import copyreg
+
+from . import __version__
+from .errors import LoadRAMLError
+
+
+MAGIC = b"RAMLFICATIONS"
+FORMAT_VERSION = 1
+
+# Bytes of serialized data per line of a compiled module
+MODULE_LINE_BYTES = 64
+
+MODULE_TEMPLATE = '''# -*- coding: utf-8 -*-
+# Generated by ramlfications {version}{source}; do not edit.
+# Load with the same version of ramlfications that generated it.
+from ramlfications.serialize import loads as _loads
+
+FINGERPRINT = {fingerprint!r}
+
+_DATA = (
+{data}
+)
+
+api = _loads(_DATA)
+del _DATA
+'''
+
+# magic, format version, length of the ramlfications version string
+_HEADER = struct.Struct(">{0}sHB".format(len(MAGIC)))
+
+
+def _resolved(subject):
+    """Unpickles a ``jsonref`` proxy as the object it refers to."""
+    return subject
+
+
+def _reduce_json_ref(proxy):
+    return _resolved, (proxy.__subject__,)
+
+
+def _register_json_ref():
+    """
+    Pickles ``jsonref`` proxies as the objects they refer to, sharing
+    them with every other reference to those objects.  Registered with
+    :py:mod:`copyreg`, which every pickler of every supported Python
+    version consults, and only once ``jsonref`` was imported: otherwise
+    the API holds no proxies.
+    """
+    jsonref = sys.modules.get("jsonref")
+    if jsonref is not None:
+        copyreg.pickle(jsonref.JsonRef, _reduce_json_ref)
+
+
+def _header():
+    version = __version__.encode("ascii")
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, len(version)) + version
+
+
+def dump(root, fileobj):
+    """
+    Serialize a parsed API into a binary file object.
+
+    Objects shared within the parsed model (e.g. parent nodes, the
+    ``RootNode`` back reference, inherited trait & resource type parameters)
+    stay shared once loaded again.  ``$ref`` s in JSON schemas are stored
+    resolved.
+
+    :param RootNode root: Parsed API
+    :param fileobj: File object opened in binary mode
+    """
+    _register_json_ref()
+    fileobj.write(_header())
+    pickle.dump(root, fileobj, pickle.HIGHEST_PROTOCOL)
+
+
+def dumps(root):
+    """
+    Serialize a parsed API into ``bytes``. See :py:func:`dump`.
+
+    :param RootNode root: Parsed API
+    :rtype: bytes
+    """
+    buf = io.BytesIO()
+    dump(root, buf)
+    return buf.getvalue()
+
+
+def load(fileobj):
+    """
+    Load a parsed API previously serialized with :py:func:`dump`.
+
+    .. warning::
+        The data is unpickled, which can run arbitrary code.  Only load
+        data you serialized yourself, or got from a source you trust.
+
+    :param fileobj: File object opened in binary mode
+    :returns: :py:class:`.raml.RootNode` object
+    :raises LoadRAMLError: If the data was not written by :py:func:`dump` \
+        or was written by a different version of ``ramlfications``.
+    """
+    header = fileobj.read(_HEADER.size)
+    if len(header) != _HEADER.size:
+        raise LoadRAMLError("Not a serialized RAML API: data is truncated.")
+    magic, format_version, version_len = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise LoadRAMLError("Not a serialized RAML API.")
+    version = fileobj.read(version_len).decode("ascii")
+    if format_version != FORMAT_VERSION or version != __version__:
+        msg = ("Serialized RAML API was written by ramlfications {0} "
+               "(format {1}); expected {2} (format {3}).".format(
+                   version, format_version, __version__, FORMAT_VERSION))
+        raise LoadRAMLError(msg)
+    try:
+        return pickle.load(fileobj)
+    except Exception as e:
+        msg = "Error loading serialized RAML API: {0}".format(e)
+        raise LoadRAMLError(msg)
+
+
+def loads(data):
+    """
+    Load a parsed API from ``bytes``. See :py:func:`load`.
+
+    .. warning::
+        The data is unpickled, which can run arbitrary code.  Only load
+        data you serialized yourself, or got from a source you trust.
+
+    :param bytes data: Data returned by :py:func:`dumps`
+    :returns: :py:class:`.raml.RootNode` object
+    """
+    return load(io.BytesIO(data))
+
+
+def dumps_module(root, source=None):
+    """
+    Returns the source of a Python module that rebuilds a parsed API on
+    import, from the data of :py:func:`dumps` stored as a ``bytes``
+    literal.  Importing the module loads neither the RAML file nor any
+    of YAML, ``jsonref`` or Markdown, and does not validate anything; once
+    imported, the module's bytecode holds the data ready to load.
+
+    The module has two attributes: ``api``, the
+    :py:class:`.raml.RootNode`, and ``FINGERPRINT``, the API's
+    :py:attr:`.RootNode.fingerprint`.
+
+    :param RootNode root: Parsed API
+    :param str source: Name of the RAML file, noted in the module
+    :rtype: str
+    """
+    # computed first, so that the module's API has every fingerprint
+    fingerprint = root.fingerprint
+    data = dumps(root)
+    lines = []
+    for start in range(0, len(data), MODULE_LINE_BYTES):
+        chunk = data[start:start + MODULE_LINE_BYTES]
+        lines.append("    " + repr(chunk))
+    return MODULE_TEMPLATE.format(
+        version=__version__,
+        source=" from {0}".format(source) if source else "",
+        fingerprint=fingerprint,
+        data="\n".join(lines))
+
+
+def dump_module(root, fileobj, source=None):
+    """
+    Write the source of a Python module that rebuilds a parsed API to a
+    text file object.  See :py:func:`dumps_module`.
+
+    :param RootNode root: Parsed API
+    :param fileobj: File object opened in text mode
+    :param str source: Name of the RAML file, noted in the module
+    """
+    fileobj.write(dumps_module(root, source))
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+__all__ = ["ParseStats", "timed"]
+
+try:
+    from collections import OrderedDict
+except ImportError:  # NOCOV
+    from ordereddict import OrderedDict
+
+import time
+from contextlib import contextmanager
+from timeit import default_timer
+
+try:
+    cpu_timer = time.process_time
+except AttributeError:  # NOCOV
+    cpu_timer = time.clock
+
+PHASES = [
+    "load", "includes", "create_root", "create_sec_schemes",
+    "create_traits", "create_resource_types", "create_resources",
+    "validation"
+]
+
+PARAM_PROPERTIES = [
+    "uri_params", "base_uri_params", "query_params", "form_params",
+    "headers"
+]
+
+
+class ParseStats(object):
+    """
+    Wall and CPU time spent in each phase of loading & parsing a RAML
+    file, and how many objects were created.
+
+    Phases are ``load`` (YAML parsing, without ``includes``),
+    ``includes`` (reading & parsing ``!include`` d files),
+    ``create_root``, ``create_sec_schemes``, ``create_traits``,
+    ``create_resource_types``, ``create_resources`` and ``validation``.
+    """
+    def __init__(self):
+        #: phase -> ``[wall seconds, CPU seconds]``
+        self.phases = OrderedDict()
+        #: ``nodes``, ``parameters``, ``bodies`` and ``responses`` -> count
+        self.counts = OrderedDict()
+        self._depth = {}
+
+    def add(self, name, wall, cpu):
+        """Add time to a phase."""
+        totals = self.phases.setdefault(name, [0.0, 0.0])
+        totals[0] += wall
+        totals[1] += cpu
+
+    @contextmanager
+    def phase(self, name, exclude=None):
+        """
+        Time the enclosed block as part of phase ``name``.  When blocks
+        of the same phase nest (e.g. includes within included files),
+        only the outermost one counts.
+
+        :param str exclude: Another phase whose time spent within the \
+            block is not counted for ``name``.
+        """
+        depth = self._depth.get(name, 0)
+        self._depth[name] = depth + 1
+        excluded = list(self.phases.get(exclude, (0.0, 0.0)))
+        wall, cpu = default_timer(), cpu_timer()
+        try:
+            yield
+        finally:
+            wall, cpu = default_timer() - wall, cpu_timer() - cpu
+            self._depth[name] = depth
+            if not depth:
+                after = self.phases.get(exclude, (0.0, 0.0))
+                self.add(name, wall - (after[0] - excluded[0]),
+                         cpu - (after[1] - excluded[1]))
+
+    def count(self, root):
+        """Count the objects of a parsed API."""
+        nodes = [root]
+        for name in ("security_schemes", "traits", "resource_types",
+                     "resources"):
+            nodes.extend(getattr(root, name, None) or [])
+
+        params, bodies, responses = set(), set(), set()
+        for node in nodes:
+            for name in PARAM_PROPERTIES:
+                params.update(id(p) for p in getattr(node, name, None) or [])
+            bodies.update(id(b) for b in getattr(node, "body", None) or [])
+            for resp in getattr(node, "responses", None) or []:
+                responses.add(id(resp))
+                params.update(id(h) for h in resp.headers or [])
+                bodies.update(id(b) for b in resp.body or [])
+
+        self.counts["nodes"] = len(nodes) - 1
+        self.counts["parameters"] = len(params)
+        self.counts["bodies"] = len(bodies)
+        self.counts["responses"] = len(responses)
+
+    @property
+    def total(self):
+        """Total ``(wall seconds, CPU seconds)`` of all phases."""
+        return (sum(t[0] for t in self.phases.values()),
+                sum(t[1] for t in self.phases.values()))
+
+    def format(self):
+        """Returns a table of the timings and counts."""
+        lines = ["{0:<24}{1:>12}{2:>12}".format("Phase", "Wall (ms)",
+                                                "CPU (ms)")]
+        names = [p for p in PHASES if p in self.phases]
+        names += [p for p in self.phases if p not in PHASES]
+        rows = [(n, self.phases[n]) for n in names]
+        rows.append(("total", self.total))
+        for name, (wall, cpu) in rows:
+            lines.append("{0:<24}{1:>12.1f}{2:>12.1f}".format(
+                name, wall * 1000, cpu * 1000))
+        if self.counts:
+            lines.append(", ".join("{0}: {1}".format(k, v)
+                                   for k, v in self.counts.items()))
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.format()
+
+
+@contextmanager
+def _untimed():
+    yield
+
+
+def timed(stats, name, exclude=None):
+    """
+    :py:meth:`ParseStats.phase` of ``stats``, or a no-op if ``stats``
+    is ``None``.
+    """
+    if stats is None:
+        return _untimed()
+    return stats.phase(name, exclude)
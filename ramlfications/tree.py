@@ -11,9 +11,8 @@ except ImportError:  # pragma: no cover
 import sys
 
 from six import iteritems, itervalues
-from termcolor import colored
 
-from .config import setup_config
+from .config import load_config
 from .parser import parse_raml
 
 COLOR_MAP = {
@@ -30,12 +29,23 @@ COLOR_MAP = {
 }
 
 
-def _get_node_level(node, count):
-    if node.parent:
-        count += 1
-        return _get_node_level(node.parent, count)
-    else:
-        return count
+# Lines to collect before writing them out in one go
+BUFFER_LINES = 1024
+
+
+def _node_levels(resources):
+    """Nesting level of each resource, by ``id``, from one traversal."""
+    levels = {}
+
+    def level(node):
+        key = id(node)
+        if key not in levels:
+            levels[key] = level(node.parent) + 1 if node.parent else 0
+        return levels[key]
+
+    for r in resources:
+        level(r)
+    return levels
 
 
 def _get_tree(api):
@@ -50,25 +60,46 @@ def _get_tree(api):
     return resources
 
 
-def _create_space(v):
-    space_count = _get_node_level(v, count=0)
-    space = "  " * space_count
-    return space
-
-
-def _set_ansi(string, screen_color, line_color):
-    if screen_color:
-        color, attr = COLOR_MAP[screen_color][line_color]
-        if attr:
-            return colored(string, color, attrs=[attr])
-        return colored(string, color)
-    return string
-
-
-def _print_line(sp, msg, color, line_color):
-    pipe = _set_ansi("|", color, 2)
-    output = pipe + _set_ansi(sp + msg, color, line_color) + "\n"
-    sys.stdout.write(output)
+def _palette(screen_color):
+    """
+    ``(prefix, suffix)`` wrapping a string in each line color of
+    ``screen_color``, as added by ``termcolor``.
+    """
+    if not screen_color:
+        return [("", "")] * len(COLOR_MAP["light"])
+    from termcolor import colored
+    palette = []
+    for color, attr in COLOR_MAP[screen_color]:
+        attrs = [attr] if attr else None
+        prefix, _, suffix = colored("\0", color, attrs=attrs).partition("\0")
+        palette.append((prefix, suffix))
+    return palette
+
+
+class _TreeWriter(object):
+    """Buffers colored lines of the tree, and writes them to ``stream``."""
+    def __init__(self, stream, screen_color):
+        self.stream = stream
+        self.palette = _palette(screen_color)
+        prefix, suffix = self.palette[2]
+        self.pipe = prefix + "|" + suffix
+        self.lines = []
+
+    def paint(self, string, line_color):
+        prefix, suffix = self.palette[line_color]
+        return prefix + string + suffix
+
+    def line(self, sp, msg, line_color):
+        self.lines.append(self.pipe + self.paint(sp + msg, line_color) + "\n")
+        if len(self.lines) >= BUFFER_LINES:
+            self.flush()
+
+    def write(self, string):
+        self.lines.append(string)
+
+    def flush(self):
+        self.stream.write("".join(self.lines))
+        del self.lines[:]
 
 
 def _return_param_type(node):
@@ -82,49 +113,58 @@ def _return_param_type(node):
     return params
 
 
-def _params(space, node, color, desc):
+def _params(writer, space, node, desc):
     params = _return_param_type(node)
     for k, v in list(iteritems(params)):
-        _print_line(space + '     ', k, color, 4)
+        writer.line(space + '     ', k, 4)
         for p in v:
             if desc:
                 desc = ": " + p.display_name
             else:
                 desc = ''
-            _print_line(space + '      ⌙ ', p.name + desc, color, 4)
+            writer.line(space + '      ⌙ ', p.name + desc, 4)
 
 
-def _print_verbosity(resources, color, verbosity):
+def _print_verbosity(writer, resources, verbosity):
+    levels = _node_levels(itervalues(resources))
     for r in list(itervalues(resources)):
-        space = _create_space(r)
-        _print_line(space, "- " + r.path, color, 2)
+        space = "  " * levels[id(r)]
+        writer.line(space, "- " + r.path, 2)
         if verbosity > 0:
             if r.method:
-                _print_line(space, "  ⌙ " + r.method.upper(), color, 3)
+                writer.line(space, "  ⌙ " + r.method.upper(), 3)
             else:
                 continue
             if verbosity > 1:
                 desc = verbosity == 3
-                _params(space, r, color, desc)
+                _params(writer, space, r, desc)
 
 
-def _print_metadata(api, color):
+def _print_metadata(writer, api):
     if not api.title:
         api.title = "MISSING TITLE"
-    head = _set_ansi("=" * len(api.title), color, 0) + "\n"
-    head += _set_ansi(api.title, color, 1) + "\n"
-    head += _set_ansi("=" * len(api.title), color, 0) + "\n"
-    head += _set_ansi("Base URI: " + api.base_uri, color, 1) + "\n"
+    head = writer.paint("=" * len(api.title), 0) + "\n"
+    head += writer.paint(api.title, 1) + "\n"
+    head += writer.paint("=" * len(api.title), 0) + "\n"
+    head += writer.paint("Base URI: " + api.base_uri, 1) + "\n"
 
-    sys.stdout.write(head)
+    writer.write(head)
 
 
-def _print_tree(api, ordered_resources, print_color, verbosity):
-    _print_metadata(api, print_color)
-    _print_verbosity(ordered_resources, print_color, verbosity)
+def _print_tree(api, ordered_resources, print_color, verbosity, stream=None):
+    """
+    Write the tree of ``api`` to ``stream``, or else to ``sys.stdout``.
+    """
+    if stream is None:
+        stream = sys.stdout
+    writer = _TreeWriter(stream, print_color)
+    _print_metadata(writer, api)
+    _print_verbosity(writer, ordered_resources, verbosity)
+    writer.flush()
 
 
-def tree(load_obj, color, output, verbosity, validate, config):  # NOCOV
+def tree(load_obj, color, output, verbosity, validate, config,
+         stats=None):  # NOCOV
     """
     Create a tree visualization of given RAML file.
 
@@ -133,6 +173,7 @@ def tree(load_obj, color, output, verbosity, validate, config):  # NOCOV
         output
     :param str output: Path to output file, if given
     :param str verbosity: Level of verbosity to print out
+    :param ParseStats stats: Records the time spent parsing, if given
     :return: ASCII Tree representation of API
     :rtype: stdout to screen or given file name
     :raises InvalidRootNodeError: API metadata is invalid according to RAML \
@@ -142,13 +183,13 @@ def tree(load_obj, color, output, verbosity, validate, config):  # NOCOV
     :raises InvalidParameterError: Named parameter is invalid \
         according to RAML `specification <http://raml.org/spec.html>`_.
     """
-    config = setup_config(config)
-    api = parse_raml(load_obj, config)
+    config = load_config(config)
+    api = parse_raml(load_obj, config, stats)
     resources = _get_tree(api)
 
     if output:
-        sys.stdout = output  # file is opened via @click from __main__.py
-        _print_tree(api, resources, color, verbosity)
+        # file is opened via @click from __main__.py
+        _print_tree(api, resources, color, verbosity, output)
         output.close()
     else:
         _print_tree(api, resources, color, verbosity)
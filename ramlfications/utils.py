@@ -4,19 +4,21 @@
 from __future__ import absolute_import, division, print_function
 
 
+import io
 import json
 import logging
 import os
 import re
 import sys
+import tempfile
 
 try:
     from collections import OrderedDict
 except ImportError:  # NOCOV
     from ordereddict import OrderedDict
 
-from six import iterkeys, iteritems
-import xmltodict
+import six
+from six import iterkeys, iteritems, string_types
 
 from .parameters import (
     Body, URIParameter, Header, FormParameter, QueryParameter
@@ -24,21 +26,33 @@ from .parameters import (
 
 PYVER = sys.version_info[:3]
 
+
+def _installed(module):
+    """Whether ``module`` can be imported, without importing it."""
+    try:
+        from importlib.util import find_spec
+    except ImportError:  # NOCOV
+        import imp
+        try:
+            imp.find_module(module)
+            return True
+        except ImportError:
+            return False
+    return find_spec(module) is not None
+
+
+# The download libraries are imported on first download
+requests = urllib = urllib_error = None
+
 if PYVER == (2, 7, 9) or PYVER == (3, 4, 3):  # NOCOV
-    import six.moves.urllib.request as urllib
-    import six.moves.urllib.error as urllib_error
     URLLIB = True
     SECURE_DOWNLOAD = True
+elif _installed("requests"):  # NOCOV
+    URLLIB = False
+    SECURE_DOWNLOAD = True
 else:
-    try:  # NOCOV
-        import requests
-        URLLIB = False
-        SECURE_DOWNLOAD = True
-    except ImportError:
-        import six.moves.urllib.request as urllib
-        import six.moves.urllib.error as urllib_error
-        URLLIB = True
-        SECURE_DOWNLOAD = False
+    URLLIB = True
+    SECURE_DOWNLOAD = False
 
 from .errors import MediaTypeError
 
@@ -46,6 +60,14 @@ from .errors import MediaTypeError
 IANA_URL = "https://www.iana.org/assignments/media-types/media-types.xml"
 
 
+def _maybe_xml(data):
+    if isinstance(data, bytes):
+        return data.lstrip(b"\xef\xbb\xbf \t\r\n").startswith(b"<")
+    if isinstance(data, string_types):
+        return data.lstrip(u"\ufeff \t\r\n").startswith(u"<")
+    return hasattr(data, "read")
+
+
 def load_schema(data):
     """
     Load Schema/Example data depending on its type (JSON, XML).
@@ -59,7 +81,12 @@ def load_schema(data):
     except Exception:  # POKEMON!
         pass
 
+    # skip loading the XML parser for what can't be XML
+    if not _maybe_xml(data):
+        return data
+
     try:
+        import xmltodict
         return xmltodict.parse(data)
     except Exception:  # GOTTA CATCH THEM ALL
         pass
@@ -81,117 +108,224 @@ def setup_logger(key):
     return log
 
 
-def _requests_download(url):
-    """Download a URL using ``requests`` library"""
+def _requests_download(url, headers=None):
+    """
+    Download a URL using ``requests`` library, conditionally if
+    ``headers`` has ``If-None-Match`` or ``If-Modified-Since``.
+
+    :returns: ``(status, ETag, Last-Modified, file object of the body)``; \
+        the body is ``None`` when unchanged (status 304).
+    """
+    global requests
+    if requests is None:
+        import requests
     try:
-        response = requests.get(url)
-        return response.text
+        response = requests.get(url, headers=headers or {}, stream=True)
+        if response.status_code == 304:
+            response.close()
+            return 304, None, None, None
+        response.raise_for_status()
     except requests.exceptions.RequestException as e:
         msg = "Error downloading from {0}: {1}".format(url, e)
         raise MediaTypeError(msg)
+    response.raw.decode_content = True
+    return (response.status_code, response.headers.get("ETag"),
+            response.headers.get("Last-Modified"), response.raw)
 
 
-def _urllib_download(url):
-    """Download a URL using ``urllib`` library"""
+def _urllib_download(url, headers=None):
+    """
+    Download a URL using ``urllib`` library, see \
+    :py:func:`_requests_download`.
+    """
+    global urllib, urllib_error
+    if urllib is None:
+        import six.moves.urllib.request as urllib
+        import six.moves.urllib.error as urllib_error
+    request = urllib.Request(url, headers=headers or {})
     try:
-        response = urllib.urlopen(url)
+        response = urllib.urlopen(request)
+    except urllib_error.HTTPError as e:
+        if e.code == 304:
+            return 304, None, None, None
+        msg = "Error downloading from {0}: {1}".format(url, e)
+        raise MediaTypeError(msg)
     except urllib_error.URLError as e:
         msg = "Error downloading from {0}: {1}".format(url, e)
         raise MediaTypeError(msg)
-    return response.read()
+    info = response.info()
+    return (response.getcode(), info.get("ETag"), info.get("Last-Modified"),
+            response)
 
 
-def download_url(url):
+def download_url(url, headers=None):
     """
     General download function, given a URL.
 
     If running 2.7.8 or earlier, or 3.4.2 or earlier, then use
     ``requests`` if it's installed.  Otherwise, use ``urllib``.
+
+    :returns: ``(status, ETag, Last-Modified, file object of the body)``
     """
     log = setup_logger("DOWNLOAD")
     if SECURE_DOWNLOAD and not URLLIB:
-        return _requests_download(url)
+        return _requests_download(url, headers)
     elif SECURE_DOWNLOAD and URLLIB:
-        return _urllib_download(url)
+        return _urllib_download(url, headers)
     msg = ("Downloading over HTTPS but can not verify the host's "
            "certificate.  To avoid this in the future, `pip install"
            " \"requests[security]\"`.")
     log.warn(msg)
-    return _urllib_download(url)
+    return _urllib_download(url, headers)
 
 
-def _xml_to_dict(response_text):
-    """Parse XML response from IANA into a Python ``dict``."""
-    try:
-        return xmltodict.parse(response_text)
-    except xmltodict.expat.ExpatError as e:
-        msg = "Error parsing XML: {0}".format(e)
-        raise MediaTypeError(msg)
+def _local_name(tag):
+    """``record`` of ``{http://www.iana.org/assignments}record``"""
+    return tag.rpartition("}")[2]
+
 
+def _record_mime_type(record, reg_name):
+    """MIME type of a ``record`` element of registry ``reg_name``."""
+    name = None
+    for child in record:
+        tag = _local_name(child.tag)
+        if tag == "file" and child.text:
+            return child.text
+        if tag == "name":
+            name = child.text
+    if name:
+        return reg_name + "/" + name
 
-def _extract_mime_types(registry):
+
+def _parse_xml_stream(stream):
     """
-    Parse out MIME types from a defined registry (e.g. "application",
-    "audio", etc).
+    Parse out the MIME types of the IANA registry XML read from
+    ``stream``, one record at a time: records are dropped once read, so
+    the whole document is never held in memory.
     """
-    mime_types = []
-    records = registry.get("record", {})
-    reg_name = registry.get("@id")
-    for rec in records:
-        mime = rec.get("file", {}).get("#text")
-        if mime:
-            mime_types.append(mime)
-        else:
-            mime = rec.get("name")
-            if mime:
-                hacked_mime = reg_name + "/" + mime
-                mime_types.append(hacked_mime)
-    return mime_types
+    from xml.etree.ElementTree import iterparse, ParseError
 
+    mime_types = []
+    registries = 0
+    path = []  # elements from the root down to the current one
+    try:
+        for event, elem in iterparse(stream, events=("start", "end")):
+            if event == "start":
+                path.append(elem)
+                continue
+            path.pop()
+            tag = _local_name(elem.tag)
+            depth = len(path)
+            if depth == 2 and tag == "record":
+                mime = _record_mime_type(elem, path[1].get("id"))
+                if mime:
+                    mime_types.append(mime)
+            elif depth == 1 and tag == "registry":
+                registries += 1
+            if 0 < depth <= 2:
+                path[-1].remove(elem)
+    except (ParseError, SyntaxError) as e:
+        msg = "Error parsing XML: {0}".format(e)
+        raise MediaTypeError(msg)
 
-def _parse_xml_data(xml_data):
-    """Parse the given XML data."""
-    registries = xml_data.get("registry", {}).get("registry")
     if not registries:
         msg = "No registries found to parse."
         raise MediaTypeError(msg)
-    if len(registries) is not 9:
+    if registries != 9:
         msg = ("Expected 9 registries but parsed "
-               "{0}".format(len(registries)))
+               "{0}".format(registries))
         raise MediaTypeError(msg)
-    all_mime_types = []
-    for registry in registries:
-        mime_types = _extract_mime_types(registry)
-        all_mime_types.extend(mime_types)
-
-    return all_mime_types
+    return mime_types
 
 
 def _save_updated_mime_types(output_file, mime_types):
-    """Save the updated MIME Media types within the package."""
-    with open(output_file, "w") as f:
-        json.dump(mime_types, f)
+    """
+    Save the updated MIME Media types within the package.  Written to a
+    temporary file first, so readers never see a partial file.
+    """
+    _atomic_write(output_file, json.dumps(mime_types))
 
 
-def update_mime_types():
+def _atomic_write(path, text):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                               suffix=".tmp")
+    try:
+        with io.open(fd, "w", encoding="utf-8") as f:
+            f.write(six.text_type(text))
+        getattr(os, "replace", os.rename)(tmp, path)
+    except Exception:
+        os.remove(tmp)
+        raise
+
+
+def _download_state_file(output_file):
+    return output_file + ".http"
+
+
+def _read_download_state(output_file, url):
+    """``ETag`` & ``Last-Modified`` of ``url`` when ``output_file`` was
+    last written from it."""
+    if not os.path.isfile(output_file):
+        return {}
+    try:
+        with io.open(_download_state_file(output_file),
+                     encoding="utf-8") as f:
+            state = json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+    if state.get("url") != url:
+        return {}
+    return state
+
+
+def update_mime_types(url=IANA_URL, output_file=None):
     """
     Update MIME Media Types from IANA.  Requires internet connection.
+
+    The registry is only downloaded if it changed since the last update
+    (using its ``ETag`` and ``Last-Modified`` headers), and parsed as it
+    is read.
+
+    :param str url: URL of the IANA media types registry XML.
+    :param str output_file: JSON file to write the MIME types to, \
+        defaults to the list of MIME types supported by ``ramlfications``.
+    :returns: ``True`` if the MIME types were updated, ``False`` if the \
+        registry did not change.
+    :raises MediaTypeError: If the registry could not be downloaded \
+        or parsed.
     """
     log = setup_logger("UPDATE")
 
+    if output_file is None:
+        current_dir = os.path.dirname(os.path.realpath(__file__))
+        data_dir = os.path.join(current_dir, "data")
+        output_file = os.path.join(data_dir, "supported_mime_types.json")
+
+    state = _read_download_state(output_file, url)
+    headers = {}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+
     log.debug("Getting XML data from IANA")
-    raw_data = download_url(IANA_URL)
-    log.debug("Data received; parsing...")
-    xml_data = _xml_to_dict(raw_data)
-    mime_types = _parse_xml_data(xml_data)
+    status, etag, last_modified, stream = download_url(url, headers)
+    if status == 304:
+        log.debug("Supported IANA MIME media types are up to date.")
+        return False
 
-    current_dir = os.path.dirname(os.path.realpath(__file__))
-    data_dir = os.path.join(current_dir, "data")
-    output_file = os.path.join(data_dir, "supported_mime_types.json")
+    log.debug("Data received; parsing...")
+    try:
+        mime_types = _parse_xml_stream(stream)
+    finally:
+        stream.close()
 
     _save_updated_mime_types(output_file, mime_types)
+    _atomic_write(_download_state_file(output_file), json.dumps({
+        "url": url, "etag": etag, "last_modified": last_modified}))
 
     log.debug("Done! Supported IANA MIME media types have been updated.")
+    return True
 
 
 def _resource_type_lookup(assigned, root):
@@ -108,7 +108,8 @@ setup(
     package_data={"": ["data/supported_mime_types.json"]},
     install_requires=install_requires(),
     extras_require={
-        "all": ["requests[security]"]
+        "all": ["requests[security]", "jsonschema"],
+        "jsonschema": ["jsonschema"],
     },
     tests_require=[
         "pytest", "mock"
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+
+import pytest
+
+from ramlfications import diff, loads, parse
+from ramlfications.changes import Change
+from ramlfications.config import setup_config
+from ramlfications.parser import parse_raml
+
+from .base import EXAMPLES
+
+
+OLD = """#%RAML 0.8
+title: Diff API
+version: v1
+baseUri: https://api.example.com
+/users:
+  get:
+    queryParameters:
+      q:
+        type: string
+      limit:
+        type: integer
+    responses:
+      200:
+        headers:
+          X-Total:
+            type: integer
+        body:
+          application/json:
+            example: |
+              {"users": []}
+  post:
+    body:
+      application/json:
+        example: |
+          {"name": "a"}
+/widgets:
+  get:
+"""
+
+NEW = """#%RAML 0.8
+title: Diff API
+version: v2
+baseUri: https://api.example.com
+/users:
+  get:
+    description: List users
+    queryParameters:
+      q:
+        type: string
+        required: true
+      page:
+        type: integer
+    responses:
+      200:
+        headers:
+          X-Total:
+            type: string
+        body:
+          application/xml:
+      404:
+  post:
+    body:
+      application/json:
+        example: |
+          {"name": "a"}
+  delete:
+/gadgets:
+  get:
+"""
+
+
+def _parse(raml):
+    return parse_raml(loads(raml), setup_config())
+
+
+@pytest.fixture(scope="session")
+def changes():
+    return diff(_parse(OLD), _parse(NEW))
+
+
+def test_no_changes():
+    assert diff(_parse(OLD), _parse(OLD)) == []
+
+
+@pytest.mark.parametrize("expected", [
+    Change("changed", "root", fields=["version"]),
+    Change("added", "resource", "/gadgets"),
+    Change("removed", "resource", "/widgets"),
+    Change("added", "method", "/users", "delete"),
+    Change("changed", "method", "/users", "get", fields=["desc"]),
+    Change("changed", "query_param", "/users", "get", "q", ["required"]),
+    Change("added", "query_param", "/users", "get", "page"),
+    Change("removed", "query_param", "/users", "get", "limit"),
+    Change("added", "response", "/users", "get", 404),
+    Change("changed", "response_header", "/users", "get", "200 X-Total",
+           ["type"]),
+    Change("added", "response_body", "/users", "get", "200 application/xml"),
+    Change("removed", "response_body", "/users", "get",
+           "200 application/json"),
+])
+def test_changes(changes, expected):
+    assert expected in changes
+
+
+def test_unchanged_skipped(changes):
+    assert not [c for c in changes if c.method == "post"]
+    assert not [c for c in changes if c.kind == "uri_param"]
+    assert len(changes) == 12
+
+
+def test_changes_sorted(changes):
+    paths = [c.path or "" for c in changes]
+    assert paths == sorted(paths)
+
+
+def test_moved_resource_not_compared():
+    # the removed resource's methods are not listed one by one
+    changes = diff(_parse(OLD), _parse(NEW))
+    assert not [c for c in changes if c.path == "/widgets" and c.method]
+
+
+@pytest.mark.parametrize("change,expected", [
+    (Change("added", "resource", "/gadgets"), "+ resource /gadgets"),
+    (Change("removed", "method", "/users", "delete"),
+     "- method DELETE /users"),
+    (Change("changed", "query_param", "/users", "get", "q",
+            ["type", "required"]),
+     "~ query_param GET /users q (type, required)"),
+    (Change("changed", "root", fields=["title"]), "~ root (title)"),
+])
+def test_change_str(change, expected):
+    assert str(change) == expected
+
+
+def test_same_file_parsed_twice():
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    config_file = os.path.join(EXAMPLES, "test-config.ini")
+    old = parse(raml_file, config_file)
+    new = parse(raml_file, config_file)
+    assert diff(old, new) == []
+
+    changed = parse(raml_file, config_file)
+    changed.title = "Changed"
+    assert diff(old, changed) == [
+        Change("changed", "root", fields=["title"])
+    ]
+
+
+DEFINED = """#%RAML 0.8
+title: Diff API
+baseUri: https://api.example.com
+securitySchemes:
+  - oauth:
+      type: OAuth 2.0
+      description: {scheme}
+      settings:
+        authorizationUri: https://example.com/auth
+        accessTokenUri: https://example.com/token
+        authorizationGrants: [ code ]
+traits:
+  - paged:
+      description: {trait}
+resourceTypes:
+  - collection:
+      get:
+        description: {resource_type}
+/users:
+  get:
+"""
+
+
+@pytest.mark.parametrize("edit,expected", [
+    ("trait", Change("changed", "trait", name="paged", fields=["desc"])),
+    ("resource_type", Change("changed", "resource_type",
+                             name="collection GET", fields=["desc"])),
+    ("scheme", Change("changed", "security_scheme", name="oauth",
+                      fields=["desc"])),
+])
+def test_unused_definition_changed(edit, expected):
+    # none of them are used by a resource, but they are part of the API
+    texts = dict(scheme="Before", trait="Before", resource_type="Before")
+    old = _parse(DEFINED.format(**texts))
+    texts[edit] = "After"
+    new = _parse(DEFINED.format(**texts))
+
+    assert old.fingerprint != new.fingerprint
+    assert diff(old, new) == [expected]
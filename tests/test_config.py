@@ -3,12 +3,13 @@
 from __future__ import absolute_import, division, print_function
 
 import os
+import pickle
 
 import pytest
 
 from six import iteritems
 
-from ramlfications.config import setup_config
+from ramlfications.config import FrozenConfig, load_config, setup_config
 from ramlfications.config import (
     AUTH_SCHEMES, HTTP_RESP_CODES, MEDIA_TYPES, PROTOCOLS, HTTP_METHODS,
     RAML_VERSIONS, PRIM_TYPES
@@ -82,3 +83,52 @@ def test_no_config_file_found():
 
     msg = ("No such file or directory: '{0}'".format(config_file),)
     assert e.value.args == msg
+
+
+def test_load_config_cached(config):
+    loaded = load_config(config)
+    assert load_config(config) is loaded
+    assert load_config(os.path.relpath(config)) is loaded
+    assert load_config() is load_config(None)
+
+    copy = setup_config(config)
+    assert copy == dict((k, list(v) if isinstance(v, tuple) else v)
+                        for k, v in loaded.items())
+    copy["validate"] = None
+    copy["resp_codes"].append(999)
+    assert load_config(config)["validate"] == loaded["validate"] is not None
+    assert 999 not in load_config(config)["resp_codes"]
+
+
+def test_load_config_changed(tmpdir):
+    config_file = tmpdir.join("config.ini")
+    config_file.write("[main]\nvalidate = True\n")
+    config_file.setmtime(1000000000)
+    loaded = load_config(str(config_file))
+    assert loaded["validate"] == "True"
+
+    config_file.write("[main]\nvalidate = False\n")
+    config_file.setmtime(1000000000)
+    changed = load_config(str(config_file))
+    assert changed is not loaded
+    assert changed["validate"] == "False"
+
+
+def test_frozen_config(config):
+    loaded = load_config(config)
+    assert isinstance(loaded, FrozenConfig)
+    assert isinstance(loaded["resp_codes"], tuple)
+    with pytest.raises(TypeError):
+        loaded["validate"] = False
+    with pytest.raises(TypeError):
+        loaded.update(validate=False)
+    with pytest.raises(TypeError):
+        del loaded["validate"]
+    with pytest.raises(TypeError):
+        loaded |= {"validate": False}
+    assert load_config(config)["validate"] is not False
+
+    unpickled = pickle.loads(pickle.dumps(loaded, 2))
+    assert isinstance(unpickled, FrozenConfig)
+    assert unpickled == loaded
+    assert dict(loaded, validate=False)["validate"] is False
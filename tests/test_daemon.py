@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+import socket
+import threading
+
+import pytest
+
+if not hasattr(socket, "AF_UNIX"):  # NOCOV
+    pytest.skip("Unix sockets are not available")
+
+from ramlfications.daemon import ValidationServer, request
+
+from .base import EXAMPLES, VALIDATE
+
+
+RAML = """#%RAML 0.8
+title: Example
+baseUri: https://example.com
+/users:
+  get:
+    description: !include description.md
+"""
+
+
+@pytest.fixture
+def server(tmpdir):
+    server = ValidationServer(str(tmpdir.join("daemon.sock")))
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join(5)
+
+
+def _request(server, path, **kwargs):
+    return request(server.socket_path, path, timeout=5, **kwargs)
+
+
+def test_validate(server):
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    result = _request(server, raml_file)
+    assert result == {
+        "path": raml_file, "valid": True, "errors": [], "cached": False
+    }
+
+
+def test_validate_invalid(server):
+    raml_file = os.path.join(VALIDATE, "no-base-uri-no-title.raml")
+    result = _request(server, raml_file)
+    assert not result["valid"]
+    assert ("InvalidRootNodeError: RAML File does not define an API title."
+            in result["errors"])
+    assert len(_request(server, raml_file, max_errors=1)["errors"]) == 1
+
+
+def test_validate_missing_file(server, tmpdir):
+    result = _request(server, str(tmpdir.join("missing.raml")))
+    assert not result["valid"]
+    assert "No such file" in result["errors"][0]
+
+
+def test_validate_cached_until_include_changes(server, tmpdir):
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write(RAML)
+    include = tmpdir.join("description.md")
+    include.write("Lists users")
+
+    assert not _request(server, str(raml_file))["cached"]
+    assert _request(server, str(raml_file))["cached"]
+
+    include.write("Lists all the users")
+    result = _request(server, str(raml_file))
+    assert result["valid"]
+    assert not result["cached"]
+
+    include.remove()
+    result = _request(server, str(raml_file))
+    assert not result["valid"]
+    assert not result["cached"]
+
+
+def test_validate_cached_until_ref_changes(server, tmpdir):
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write(
+        "#%RAML 0.8\ntitle: Example\nbaseUri: https://example.com\n"
+        "schemas:\n  - user: !include user.schema.json\n/users:\n  get:\n")
+    tmpdir.join("user.schema.json").write(
+        '{"type": "object", "properties": {"name": {"$ref": "name.json"}}}')
+    ref = tmpdir.join("name.json")
+    ref.write('{"type": "string"}')
+
+    assert _request(server, str(raml_file))["valid"]
+    assert _request(server, str(raml_file))["cached"]
+    ref.write('{"type": "string", "minLength": 1}')
+    assert not _request(server, str(raml_file))["cached"]
+
+
+def test_validate_yaml_error(server, tmpdir):
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write("#%RAML 0.8\ntitle: Example\n\tbaseUri: x\n")
+    result = _request(server, str(raml_file))
+    assert not result["valid"]
+    assert result["errors"][0].startswith("ScannerError: ")
+
+
+def test_validate_unexpected_error(server, monkeypatch):
+    def parse_raml(loaded, config):
+        raise TypeError("broken")
+    monkeypatch.setattr("ramlfications._helpers.parse_raml", parse_raml)
+
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    result = _request(server, raml_file)
+    assert not result["valid"]
+    assert result["errors"] == ["TypeError: broken"]
+
+
+def test_includes_kept_between_files(server, tmpdir):
+    tmpdir.join("description.md").write("Lists users")
+    tmpdir.join("users.raml").write(
+        "get:\n  description: !include description.md\n")
+    for name in ("one", "two"):
+        tmpdir.join(name + ".raml").write(
+            "#%RAML 0.8\ntitle: {0}\nbaseUri: https://example.com\n"
+            "/users: !include users.raml\n".format(name))
+
+    assert _request(server, str(tmpdir.join("one.raml")))["valid"]
+    assert len(server._include_cache) == 1
+    assert _request(server, str(tmpdir.join("two.raml")))["valid"]
+    assert len(server._include_cache) == 1
+
+    # a change of a nested include is still picked up
+    tmpdir.join("description.md").remove()
+    assert not _request(server, str(tmpdir.join("two.raml")))["valid"]
+
+
+def test_request_without_reply(tmpdir):
+    socket_path = str(tmpdir.join("broken.sock"))
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen(1)
+    replies = [b"", b"not json\n", b'{"error": "Bad request: x"}\n']
+
+    def serve():
+        for reply in replies:
+            conn = listener.accept()[0]
+            conn.makefile("rb").readline()
+            conn.sendall(reply)
+            conn.close()
+
+    thread = threading.Thread(target=serve)
+    thread.daemon = True
+    thread.start()
+    try:
+        errors = [request(socket_path, "api.raml", timeout=5)["errors"][0]
+                  for _ in replies]
+    finally:
+        thread.join(5)
+        listener.close()
+    assert errors == [
+        "DaemonError: The daemon closed the connection without replying.",
+        "DaemonError: Unexpected reply: {0!r}".format(b"not json\n"),
+        "DaemonError: Bad request: x",
+    ]
+
+
+def test_bad_request(server):
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(5)
+    client.connect(server.socket_path)
+    client.sendall(b"{}\n")
+    response = client.makefile("rb").readline()
+    client.close()
+    assert response.startswith(b'{"error": "Bad request')
+
+
+def test_socket_in_use(server):
+    with pytest.raises(IOError) as e:
+        ValidationServer(server.socket_path)
+    assert "already listening" in str(e.value)
+
+
+def test_stale_socket_removed(tmpdir):
+    socket_path = str(tmpdir.join("daemon.sock"))
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+
+    server = ValidationServer(socket_path)
+    server.server_close()
+    assert not os.path.exists(socket_path)
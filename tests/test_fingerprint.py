@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+
+import jsonref
+import pytest
+
+from ramlfications import loads, parse
+from ramlfications.config import setup_config
+from ramlfications.fingerprint import fingerprint, hash_value
+from ramlfications.parser import parse_raml
+
+from .base import EXAMPLES, JSONREF
+
+
+RAML = """#%RAML 0.8
+title: Fingerprint API
+baseUri: https://api.example.com
+/users:
+  get:
+    queryParameters:
+      q:
+        type: string
+    responses:
+      200:
+        body:
+          application/json:
+            example: |
+              {"users": []}
+/widgets:
+  get:
+"""
+
+
+def _parse(raml):
+    return parse_raml(loads(raml), setup_config())
+
+
+@pytest.fixture(scope="module")
+def api():
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    config_file = os.path.join(EXAMPLES, "test-config.ini")
+    return parse(raml_file, config_file)
+
+
+def test_fingerprint_stable(api):
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    config_file = os.path.join(EXAMPLES, "test-config.ini")
+    other = parse(raml_file, config_file)
+
+    assert len(api.fingerprint) == 40
+    assert api.fingerprint == other.fingerprint
+    for node, other_node in zip(api.resources, other.resources):
+        assert node.fingerprint == other_node.fingerprint
+    for trait, other_trait in zip(api.traits, other.traits):
+        assert trait.fingerprint == other_trait.fingerprint
+    for res_type, other_type in zip(api.resource_types,
+                                    other.resource_types):
+        assert res_type.fingerprint == other_type.fingerprint
+
+
+def test_fingerprint_cached(api):
+    node = api.resources[0]
+    assert node.fingerprint is node.fingerprint
+    assert node.__dict__["_fingerprint"] == node.fingerprint
+
+
+def test_fingerprint_changes_bottom_up():
+    old = _parse(RAML)
+    new = _parse(RAML.replace("type: string", "type: integer"))
+    old_users, new_users = old.resources[0], new.resources[0]
+
+    assert old_users.query_params[0].fingerprint != \
+        new_users.query_params[0].fingerprint
+    assert old_users.fingerprint != new_users.fingerprint
+    assert old.fingerprint != new.fingerprint
+    # siblings are not affected
+    assert old_users.responses[0].fingerprint == \
+        new_users.responses[0].fingerprint
+    assert old.resources[1].fingerprint == new.resources[1].fingerprint
+
+
+def test_fingerprint_ignores_back_references():
+    old = _parse(RAML)
+    new = _parse(RAML.replace("title: Fingerprint API", "title: Renamed"))
+    assert old.fingerprint != new.fingerprint
+    # each resource refers back to its root, which is not hashed
+    for node, other_node in zip(old.resources, new.resources):
+        assert node.fingerprint == other_node.fingerprint
+
+
+def test_equality():
+    old, new = _parse(RAML), _parse(RAML)
+    assert old == new
+    assert old.resources[0] == new.resources[0]
+    assert old.resources[0] != new.resources[1]
+    assert old.resources[0].responses[0] == new.resources[0].responses[0]
+    assert old.resources[0] != old.resources[0].responses[0]
+    with pytest.raises(TypeError):
+        hash(old.resources[0])
+
+
+def test_fingerprint_recursive_schema():
+    raml_file = os.path.join(JSONREF, "jsonref_recursive.raml")
+    api = parse(raml_file, flatten_refs=True)
+    assert len(api.fingerprint) == 40
+    assert api.fingerprint == parse(raml_file, flatten_refs=True).fingerprint
+
+
+def test_hash_value_keeps_refs_lazy():
+    data = jsonref.loads('{"a": {"b": 1}, "c": {"$ref": "#/a"}}')
+    proxy = dict.__getitem__(data, "c")
+    assert len(hash_value(data)) == 40
+    assert "cache" not in object.__getattribute__(proxy, "__dict__")
+
+
+@pytest.mark.parametrize("first,second", [
+    ({"a": 1, "b": 2}, {"b": 2, "a": 1}),
+    (["a", "b"], ["a", "b"]),
+    ((1, "1"), (1, "1")),
+])
+def test_hash_value_equal(first, second):
+    assert hash_value(first) == hash_value(second)
+
+
+@pytest.mark.parametrize("first,second", [
+    (["ab", "c"], ["a", "bc"]),
+    (1, "1"),
+    (1, True),
+    ([1, 2], [2, 1]),
+    ({"a": 1}, {"a": 2}),
+])
+def test_hash_value_different(first, second):
+    assert hash_value(first) != hash_value(second)
+
+
+def test_fingerprint_fields(api):
+    doc = api.documentation[0]
+    assert doc.fingerprint == fingerprint(doc, ["_title", "_content"])
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+
+import pytest
+
+from ramlfications import parse, validate
+from ramlfications.generate import generate, write
+
+
+def test_generate_reproducible():
+    assert generate(seed=3) == generate(seed=3)
+    assert generate(seed=3) != generate(seed=4)
+
+
+def test_generate_includes():
+    files = generate(schemas=3, includes=2)
+    assert sorted(files) == ["api.raml", "schemas/Schema0.json",
+                             "schemas/Schema1.json"]
+    assert "- Schema0: !include schemas/Schema0.json" in files["api.raml"]
+    assert "- Schema2: |" in files["api.raml"]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_generated_api_is_valid(tmpdir, seed):
+    raml_file = write(tmpdir.strpath, resources=3, depth=3, methods=3,
+                      traits=3, resource_types=2, security_schemes=2,
+                      schemas=2, includes=1, params=2, seed=seed)
+    assert raml_file == os.path.join(tmpdir.strpath, "api.raml")
+    validate(raml_file)
+
+    api = parse(raml_file)
+    assert api.title == "Generated API {0}".format(seed)
+    # 3 top-level resources, each with 3 levels below, 3 methods each
+    assert len(api.resources) == 3 * 4 * 3
+    assert len(api.traits) == 3
+    assert len(api.security_schemes) == 2
+    assert len(api.schemas) == 2
+    paths = set(r.path for r in api.resources)
+    assert "/resource0/{resource0Id}/sub1/{sub1Id}" in paths
+
+
+def test_generate_no_extras(tmpdir):
+    raml_file = write(tmpdir.strpath, resources=1, depth=0, methods=1,
+                      traits=0, resource_types=0, security_schemes=0,
+                      schemas=0, includes=0, params=0)
+    validate(raml_file)
+    api = parse(raml_file)
+    assert len(api.resources) == 1
+    assert api.traits is None
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from ramlfications import parse
+from ramlfications.serialize import dumps_module
+
+from .base import EXAMPLES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Only imported once needed, see ``test_lazy_imports``
+HEAVY_MODULES = [
+    "markdown2", "xmltodict", "jsonref", "yaml", "termcolor", "requests",
+    "multiprocessing", "six.moves.urllib.request", "email.utils",
+]
+if sys.version_info[0] > 2:
+    HEAVY_MODULES += ["http.server", "http.client"]
+else:  # NOCOV
+    HEAVY_MODULES += ["BaseHTTPServer", "httplib"]
+
+
+def _imported(code):
+    """Modules of ``HEAVY_MODULES`` imported by running ``code``."""
+    script = (
+        "import json, sys\n" + code + "\n"
+        "print(json.dumps([m for m in {0!r} if m in sys.modules]))"
+    ).format(HEAVY_MODULES)
+    output = subprocess.check_output([sys.executable, "-c", script],
+                                     cwd=ROOT)
+    return json.loads(output.decode("utf-8").splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", ["ramlfications", "ramlfications.__main__"])
+def test_lazy_imports(module):
+    assert _imported("import " + module) == []
+
+
+def test_parse_imports_only_needed():
+    raml_file = os.path.join(EXAMPLES, "twitter.raml")
+    config_file = os.path.join(EXAMPLES, "twitter-config.ini")
+    code = "import ramlfications\napi = ramlfications.parse({0!r}, {1!r})"
+    code = code.format(raml_file, config_file)
+    imported = _imported(code)
+    assert "yaml" in imported
+    for module in ("markdown2", "xmltodict", "jsonref", "termcolor",
+                   "requests", "multiprocessing"):
+        assert module not in imported
+
+
+def test_compiled_module_imports_only_needed(tmpdir):
+    raml_file = os.path.join(EXAMPLES, "twitter.raml")
+    config_file = os.path.join(EXAMPLES, "twitter-config.ini")
+    api = parse(raml_file, config_file)
+    tmpdir.join("api_spec.py").write(dumps_module(api))
+
+    code = "sys.path.insert(0, {0!r})\nimport api_spec".format(str(tmpdir))
+    assert _imported(code) == []
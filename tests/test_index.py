@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import pytest
+
+from ramlfications import loads
+from ramlfications.config import setup_config
+from ramlfications.parser import parse_raml
+
+
+@pytest.fixture(scope="session")
+def api():
+    raml = loads("""#%RAML 0.8
+title: Index API
+baseUri: https://api.example.com
+securitySchemes:
+  - oauth_2_0:
+      type: OAuth 2.0
+      settings:
+        authorizationUri: https://example.com/authorize
+        accessTokenUri: https://example.com/token
+        authorizationGrants: [ code ]
+traits:
+  - paged:
+      queryParameters:
+        page:
+          type: integer
+  - searchable:
+      queryParameters:
+        q:
+          type: string
+resourceTypes:
+  - collection:
+      description: A collection
+      get:
+        description: List the collection
+/users:
+  type: collection
+  is: [ paged ]
+  get:
+    is: [ searchable ]
+    securedBy: [ oauth_2_0: { scopes: [ user-read ] } ]
+    responses:
+      200:
+        body:
+          application/json:
+  post:
+    securedBy: [ oauth_2_0: { scopes: [ user-write ] } ]
+    body:
+      application/x-www-form-urlencoded:
+        formParameters:
+          name:
+            type: string
+  /{userId}:
+    get:
+      securedBy: [ oauth_2_0 ]
+    /files:
+      get:
+/widgets:
+  type: collection
+  get:
+    responses:
+      200:
+        body:
+          application/json:
+          text/xml:
+""")
+    return parse_raml(raml, setup_config())
+
+
+def _keys(nodes):
+    # methods of a resource with a resource type are not kept in order
+    return sorted((n.path, n.method) for n in nodes)
+
+
+@pytest.mark.parametrize("path,method,expected", [
+    ("/users", "get", ("/users", "get")),
+    ("/users", "POST", ("/users", "post")),
+    ("/users/{userId}/files", "get", ("/users/{userId}/files", "get")),
+    ("/users", "delete", None),
+    ("/gadgets", "get", None),
+])
+def test_resource(api, path, method, expected):
+    node = api.resource(path, method)
+    if expected is None:
+        assert node is None
+    else:
+        assert (node.path, node.method) == expected
+
+
+def test_resources_by_trait(api):
+    assert _keys(api.resources_by_trait("paged")) == [
+        ("/users", "get"), ("/users", "post")
+    ]
+    assert _keys(api.resources_by_trait("searchable")) == [("/users", "get")]
+    assert api.resources_by_trait("missing") == []
+
+
+def test_resources_by_type(api):
+    assert _keys(api.resources_by_type("collection")) == [
+        ("/users", "get"), ("/users", "post"), ("/widgets", "get")
+    ]
+
+
+def test_resources_secured_by(api):
+    assert _keys(api.resources_secured_by("oauth_2_0")) == [
+        ("/users", "get"), ("/users", "post"), ("/users/{userId}", "get")
+    ]
+    assert _keys(api.resources_secured_by("oauth_2_0", "user-read")) == [
+        ("/users", "get")
+    ]
+    assert api.resources_secured_by("oauth_2_0", "admin") == []
+    assert api.resources_secured_by("basic") == []
+
+
+def test_resources_by_media_type(api):
+    assert _keys(api.resources_by_media_type("application/json")) == [
+        ("/users", "get"), ("/widgets", "get")
+    ]
+    assert _keys(api.resources_by_media_type(
+        "application/x-www-form-urlencoded")) == [("/users", "post")]
+    assert _keys(api.resources_by_media_type("text/xml")) == [
+        ("/widgets", "get")
+    ]
+
+
+def test_children(api):
+    top = [("/users", "get"), ("/users", "post"), ("/widgets", "get")]
+    assert _keys(api.children()) == top
+    assert _keys(api.children(api)) == top
+    # the same children for each method of the parent path
+    for method in ("get", "post"):
+        users = api.resource("/users", method)
+        assert _keys(api.children(users)) == [("/users/{userId}", "get")]
+    user = api.resource("/users/{userId}", "get")
+    assert _keys(api.children(user)) == [("/users/{userId}/files", "get")]
+    assert api.children(api.resource("/widgets", "get")) == []
+
+
+def test_index_built_once(api):
+    api.resource("/users", "get")
+    index = api.__dict__["_index"]
+    api.resources_by_trait("paged")
+    assert api.__dict__["_index"] is index
+
+
+def test_lookups_return_copies(api):
+    api.resources_by_trait("paged").pop()
+    assert len(api.resources_by_trait("paged")) == 2
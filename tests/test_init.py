@@ -1,15 +1,17 @@
 # -*- coding: utf-8 -*-
 # Copyright (c) 2015 Spotify AB
 
+import gc
 import os
 
 import pytest
 
-from ramlfications import parse, load, loads, validate
+from ramlfications import parse, load, loads, validate, preload
 from ramlfications.raml import RootNode
-from ramlfications.errors import LoadRAMLError
+from ramlfications.errors import InvalidRAMLError, LoadRAMLError
 
-from .base import EXAMPLES
+from .base import EXAMPLES, JSONREF
+from .test_loader import _has_jsonref
 
 
 @pytest.fixture(scope="session")
@@ -67,3 +69,45 @@ def test_validate_nonexistant_file():
     raml_file = "/tmp/non-existant-raml-file.raml"
     with pytest.raises(LoadRAMLError):
         validate(raml_file)
+
+
+@pytest.fixture
+def frozen():
+    yield
+    if hasattr(gc, "unfreeze"):
+        gc.unfreeze()
+
+
+def test_preload(frozen):
+    raml_file = os.path.join(EXAMPLES + "complete-valid-example.raml")
+    config = os.path.join(EXAMPLES + "test-config.ini")
+    gc_enabled = gc.isenabled()
+    apis = preload([raml_file, raml_file], config)
+
+    assert [a.title for a in apis] == ["Example Web API"] * 2
+    assert gc.isenabled() == gc_enabled
+    for api in apis:
+        assert "_fingerprint" in api.__dict__
+        assert "_router" in api.__dict__
+        assert "_index" in api.__dict__
+    if hasattr(gc, "freeze"):
+        assert gc.get_freeze_count() > 0
+    # equal objects are shared between the APIs
+    assert apis[0] is not apis[1]
+    assert apis[0].resources[0].path is apis[1].resources[0].path
+
+
+def test_preload_resolves_refs(frozen):
+    raml_file = os.path.join(JSONREF, "jsonref_relative_local_includes.raml")
+    api = preload([raml_file])[0]
+    assert api.schemas
+    assert not _has_jsonref(api.schemas)
+
+
+def test_preload_invalid(frozen, tmpdir):
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write("#%RAML 0.8\nbaseUri: https://example.com\n")
+    gc_enabled = gc.isenabled()
+    with pytest.raises(InvalidRAMLError):
+        preload([str(raml_file)])
+    assert gc.isenabled() == gc_enabled
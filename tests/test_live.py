@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+import threading
+
+import pytest
+
+from ramlfications.errors import InvalidRAMLError, LoadRAMLError
+from ramlfications.live import LiveSpec
+
+from .base import EXAMPLES
+
+
+RAML = """#%RAML 0.8
+title: {title}
+baseUri: https://example.com
+/users:
+  get:
+    description: !include description.md
+"""
+
+
+@pytest.fixture
+def raml_file(tmpdir):
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write(RAML.format(title="Example"))
+    tmpdir.join("description.md").write("Lists users")
+    return raml_file
+
+
+def test_parse(raml_file, tmpdir):
+    with LiveSpec(str(raml_file), interval=None) as spec:
+        assert spec.root.title == "Example"
+        assert spec.version == 1
+        assert spec.error is None
+        include = str(tmpdir.join("description.md"))
+        assert spec.files == [str(raml_file), include]
+        assert not spec.check()
+
+
+def test_config_file():
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    config_file = os.path.join(EXAMPLES, "test-config.ini")
+    spec = LiveSpec(raml_file, config_file, interval=None)
+    assert spec.root.title == "Example Web API"
+    assert config_file in spec.files
+
+
+def test_invalid_at_first(tmpdir):
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write("#%RAML 0.8\nbaseUri: https://example.com\n")
+    with pytest.raises(InvalidRAMLError):
+        LiveSpec(str(raml_file), interval=None)
+    with pytest.raises(LoadRAMLError):
+        LiveSpec(str(tmpdir.join("missing.raml")), interval=None)
+
+
+def test_reload_on_include_change(raml_file, tmpdir):
+    reloaded = []
+    spec = LiveSpec(str(raml_file), interval=None,
+                    on_reload=reloaded.append)
+    old = spec.root
+
+    tmpdir.join("description.md").write("Lists all the users")
+    assert spec.check()
+    assert spec.version == 2
+    assert spec.root is not old
+    assert spec.root.resources[0].description.raw == "Lists all the users"
+    assert old.resources[0].description.raw == "Lists users"
+    assert reloaded == [spec.root]
+
+
+def test_reload_on_ref_change(tmpdir):
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write(
+        "#%RAML 0.8\ntitle: Example\nbaseUri: https://example.com\n"
+        "schemas:\n  - user: !include user.schema.json\n/users:\n  get:\n")
+    tmpdir.join("user.schema.json").write(
+        '{"type": "object", "properties": {"name": {"$ref": "name.json"}}}')
+    ref = tmpdir.join("name.json")
+    ref.write('{"type": "string"}')
+
+    spec = LiveSpec(str(raml_file), interval=None)
+    assert str(ref) in spec.files
+    ref.write('{"type": "string", "minLength": 1}')
+    assert spec.check()
+
+
+def test_keeps_root_on_error(raml_file, tmpdir):
+    errors = []
+    spec = LiveSpec(str(raml_file), interval=None, on_error=errors.append)
+    old = spec.root
+
+    raml_file.write("#%RAML 0.8\nbaseUri: https://example.com\n")
+    assert not spec.check()
+    assert spec.root is old
+    assert spec.version == 1
+    assert isinstance(spec.error, InvalidRAMLError)
+    assert errors == [spec.error]
+    # not parsed again until it changes again
+    assert not spec.check()
+
+    raml_file.write(RAML.format(title="Fixed"))
+    assert spec.check()
+    assert spec.root.title == "Fixed"
+    assert spec.error is None
+
+
+def test_keeps_root_on_missing_include(raml_file, tmpdir):
+    spec = LiveSpec(str(raml_file), interval=None)
+    include = tmpdir.join("description.md")
+    include.remove()
+    assert not spec.check()
+    assert isinstance(spec.error, LoadRAMLError)
+
+    include.write("Back again")
+    assert spec.check()
+    assert spec.root.resources[0].description.raw == "Back again"
+
+
+def test_background_reload(raml_file):
+    reloaded = threading.Event()
+    with LiveSpec(str(raml_file), interval=0.01,
+                  on_reload=lambda root: reloaded.set()) as spec:
+        raml_file.write(RAML.format(title="Changed"))
+        assert reloaded.wait(5)
+        assert spec.root.title == "Changed"
+    assert spec._thread is None
+
+
+def test_background_survives_failing_callback(raml_file):
+    reloads, errors = [], []
+    reloaded = threading.Event()
+
+    def on_reload(root):
+        reloads.append(root.title)
+        if len(reloads) == 1:
+            raise RuntimeError("callback failed")
+        reloaded.set()
+
+    with LiveSpec(str(raml_file), interval=0.01, on_reload=on_reload,
+                  on_error=errors.append) as spec:
+        raml_file.write(RAML.format(title="Once"))
+        for _ in range(500):
+            if errors:
+                break
+            threading.Event().wait(0.01)
+        raml_file.write(RAML.format(title="Twice"))
+        assert reloaded.wait(5)
+        assert spec.root.title == "Twice"
+    assert reloads == ["Once", "Twice"]
+    assert [str(e) for e in errors] == ["callback failed"]
+
+
+def test_concurrent_checks_reload_once(raml_file, monkeypatch):
+    spec = LiveSpec(str(raml_file), interval=None)
+    parse = spec._parse
+    parsing, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_parse():
+        calls.append(1)
+        parsing.set()
+        release.wait(5)
+        return parse()
+
+    monkeypatch.setattr(spec, "_parse", slow_parse)
+    raml_file.write(RAML.format(title="Changed"))
+    results = []
+    first = threading.Thread(target=lambda: results.append(spec.check()))
+    first.start()
+    assert parsing.wait(5)
+    second = threading.Thread(target=lambda: results.append(spec.check()))
+    second.start()
+    release.set()
+    first.join(5)
+    second.join(5)
+
+    assert sorted(results) == [False, True]
+    assert len(calls) == 1
+    assert spec.version == 2
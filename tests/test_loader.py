@@ -5,6 +5,9 @@ from __future__ import absolute_import, division, print_function
 import os
 
 import json
+import pickle
+
+import jsonref
 import pytest
 from six import iteritems
 
@@ -41,6 +44,48 @@ def test_load_file_with_nested_includes():
     assert dict_equal(raml, expected_data)
 
 
+def test_load_file_records_includes():
+    raml_file = os.path.join(EXAMPLES + "nested-includes.raml")
+    raml_loader = loader.RAMLLoader()
+    with open(raml_file) as f:
+        raml_loader.load(f)
+
+    includes = [os.path.relpath(i, EXAMPLES) for i in raml_loader.includes]
+    assert includes[0] == os.path.join("includes", "all-the-properties.raml")
+    assert len(includes) > 1
+    assert all(os.path.isabs(i) for i in raml_loader.includes)
+
+
+def test_include_cache(tmpdir):
+    tmpdir.join("outer.raml").write("inner: !include inner.yaml\n")
+    inner = tmpdir.join("inner.yaml")
+    inner.write("value: 1\n")
+    raml = "#%RAML 0.8\nincluded: !include outer.raml\n"
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write(raml)
+    cache = loader.IncludeCache()
+
+    def load():
+        raml_loader = loader.RAMLLoader(include_cache=cache)
+        with open(str(raml_file)) as f:
+            data = raml_loader.load(f)
+        return data, raml_loader.includes
+
+    first, includes = load()
+    assert first["included"]["inner"]["value"] == 1
+    assert len(cache) == 2
+    first["included"]["inner"]["value"] = "changed"
+
+    second, cached_includes = load()
+    # every load gets its own copy
+    assert second["included"]["inner"]["value"] == 1
+    assert sorted(cached_includes) == sorted(includes)
+
+    inner.write("value: 22\n")
+    third, _ = load()
+    assert third["included"]["inner"]["value"] == 22
+
+
 def test_load_file_with_nonyaml_include():
     raml_file = os.path.join(EXAMPLES + "nonyaml-includes.raml")
     with open(raml_file) as f:
@@ -157,6 +202,51 @@ def test_jsonref_multiref_internal_fragments():
     assert dict_equal(raml, expected_data)
 
 
+def _has_jsonref(obj, seen=None):
+    seen = set() if seen is None else seen
+    if isinstance(obj, jsonref.JsonRef):
+        return True
+    if id(obj) in seen:
+        return False
+    seen.add(id(obj))
+    if isinstance(obj, dict):
+        return any(_has_jsonref(v, seen) for v in obj.values())
+    if isinstance(obj, list):
+        return any(_has_jsonref(v, seen) for v in obj)
+    return False
+
+
+def test_jsonref_flatten_refs():
+    raml_file = os.path.join(JSONREF,
+                             "jsonref_multiref_internal_fragment.raml")
+    with open(raml_file) as f:
+        raml = loader.RAMLLoader(flatten_refs=True).load(f)
+
+    expected_data = lf.jsonref_multiref_internal_fragments_expected
+    assert dict_equal(raml, expected_data)
+    assert not _has_jsonref(raml)
+
+    schema = raml["schemas"][0]["json"]
+    assert type(schema) is dict
+    assert schema["is_this_internal?"] == "yes"
+    assert schema["two_references"] is True
+    # round-trips with plain pickle, no jsonref support needed
+    assert pickle.loads(pickle.dumps(raml)) == raml
+
+
+def test_jsonref_flatten_refs_recursive():
+    raml_file = os.path.join(JSONREF, "jsonref_recursive.raml")
+    with open(raml_file) as f:
+        raml = loader.RAMLLoader(flatten_refs=True).load(f)
+
+    assert not _has_jsonref(raml)
+    schema = raml["/tree"]["post"]["body"]["application/json"]["schema"]
+    assert schema["properties"]["children"]["items"] is schema
+
+    copy = pickle.loads(pickle.dumps(schema))
+    assert copy["properties"]["children"]["items"] is copy
+
+
 def test_jsonref_absolute_local_uri(tmpdir):
     # Set up a tmp RAML file with an absolute path
     json_schema_file = tmpdir.join("json_absolute_ref.json")
@@ -202,6 +292,20 @@ def test_jsonref_relative_local_uri_includes():
     assert dict_equal(expected, actual)
 
 
+def test_jsonref_local_files_recorded():
+    ramlfile = os.path.join(JSONREF, "jsonref_relative_local_includes.raml")
+    raml_loader = loader.RAMLLoader()
+    with open(ramlfile, "r") as f:
+        raml_loader.load(f)
+
+    includes = [os.path.relpath(i, JSONREF) for i in raml_loader.includes]
+    assert includes == [
+        "jsonref_relative_local_includes.schema.json",
+        os.path.join("includes", "artist.schema.json"),
+        os.path.join("includes", "image.schema.json"),
+    ]
+
+
 def test_jsonref_remote_uri(tmpdir, httpserver):
     mock_remote_json = os.path.join(JSONREF, "jsonref_mock_remote.json")
     httpserver.serve_content(open(mock_remote_json).read())
@@ -51,6 +51,37 @@ def test_validate_fail(runner):
     assert exp_msg_3 in result.output
 
 
+def test_validate_fail_fast(runner):
+    """
+    Stop at the first error for invalid RAML file via CLI when validating.
+    """
+    raml_file = os.path.join(VALIDATE, "no-base-uri-no-title.raml")
+    exp_msg_1 = "Error validating file {0}: \n".format(raml_file)
+    exp_msg_2 = 'RAML File does not define'
+
+    result = runner.invoke(main.validate, [raml_file, "--fail-fast"])
+
+    assert result.exit_code == 1
+    assert exp_msg_1 in result.output
+    assert result.output.count(exp_msg_2) == 1
+
+
+def test_validate_timings(runner):
+    """
+    Print the time spent in each phase of parsing, even when invalid.
+    """
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    result = runner.invoke(main.validate, [raml_file, "--timings"])
+    assert result.exit_code == 0
+    assert "create_resources" in result.output
+    assert "nodes: " in result.output
+
+    raml_file = os.path.join(VALIDATE, "no-base-uri-no-title.raml")
+    result = runner.invoke(main.validate, [raml_file, "--timings"])
+    assert result.exit_code == 1
+    assert "create_root" in result.output
+
+
 def test_tree(runner):
     """
     Successfully print out tree of RAML file via CLI.
@@ -83,22 +114,203 @@ def test_update(runner, mocker):
     """
     Successfully update supported mime types
     """
-    json_file = "ramlfications/data/supported_mime_types.json"
-    parent = os.path.dirname(os.path.pardir)
-    json_path = os.path.join(parent, json_file)
+    update = mocker.patch("ramlfications.__main__.umt")
+
+    result = runner.invoke(main.update)
+
+    assert result.exit_code == 0
+    update.assert_called_once_with()
+
+
+def test_mock(runner, mocker):
+    """
+    Serve examples of RAML file via CLI.
+    """
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    server = mocker.patch("ramlfications.mockserver.MockServer")
+    server.return_value.url = "http://127.0.0.1:9090"
+    server.return_value.serve_forever.side_effect = KeyboardInterrupt
+
+    result = runner.invoke(main.mock, [raml_file, "--port=9090"])
+
+    exp_msg = "Serving {0} at http://127.0.0.1:9090\n".format(raml_file)
+    check_result(0, exp_msg, result)
+    api = server.call_args[0][0]
+    assert api.title == "Example Web API"
+    assert server.call_args[0][1:] == ("127.0.0.1", 9090, False)
+    server.return_value.server_close.assert_called_once_with()
+
+
+def test_mock_invalid(runner):
+    """
+    Raise error for invalid RAML file via CLI when serving examples.
+    """
+    raml_file = os.path.join(VALIDATE, "no-title.raml")
+    config_file = os.path.join(VALIDATE, "valid-config.ini")
+    exp_code = 1
+    exp_msg = '"{0}" is not a valid RAML file: \n\t{1}: {2}\n'.format(
+        raml_file, 'InvalidRootNodeError',
+        'RAML File does not define an API title.')
+    result = runner.invoke(main.mock, [raml_file,
+                           "--config={0}".format(config_file)])
+    check_result(exp_code, exp_msg, result)
+
+
+def test_memory(runner):
+    """
+    Print the memory retained by a parsed RAML file via CLI.
+    """
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    config_file = os.path.join(EXAMPLES, "test-config.ini")
+    result = runner.invoke(main.memory, [raml_file, "-c", config_file,
+                                         "-n", "5"])
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[0].startswith("Class")
+    assert len(lines) == 8
+    assert lines[-1].startswith("Peak while parsing: ")
+
+
+def test_memory_invalid(runner):
+    """
+    Raise error for invalid RAML file via CLI when reporting memory.
+    """
+    raml_file = os.path.join(VALIDATE, "no-title.raml")
+    config_file = os.path.join(VALIDATE, "valid-config.ini")
+    result = runner.invoke(main.memory, [raml_file, "-c", config_file])
+    assert result.exit_code == 1
+    assert "is not a valid RAML file" in result.output
+
+
+def test_generate(runner, tmpdir):
+    """
+    Write a generated RAML file via CLI.
+    """
+    directory = tmpdir.join("generated").strpath
+    result = runner.invoke(main.generate, [directory, "--resources=2",
+                                           "--seed=7"])
+    raml_file = os.path.join(directory, "api.raml")
+    check_result(0, raml_file + "\n", result)
+    assert os.path.isfile(os.path.join(directory, "schemas", "Schema0.json"))
+
+    result = runner.invoke(main.validate, [raml_file])
+    assert result.exit_code == 0
+
+
+def test_diff(runner, tmpdir):
+    """
+    List the differences between two RAML files via CLI.
+    """
+    raml = ("#%RAML 0.8\ntitle: Diff API\nbaseUri: https://example.com\n"
+            "/users:\n  get:\n")
+    old = tmpdir.join("old.raml")
+    old.write(raml)
+    new = tmpdir.join("new.raml")
+    new.write(raml + "/added:\n  get:\n")
 
-    start_mtime = os.path.getmtime(json_path)
+    result = runner.invoke(main.diff, [str(old), str(old)])
+    check_result(0, "", result)
 
-    from ramlfications import utils
-    mocker.patch("ramlfications.utils.update_mime_types")
-    mocker.patch("ramlfications.utils._save_updated_mime_types")
+    result = runner.invoke(main.diff, [str(old), str(new)])
+    check_result(1, "+ resource /added\n", result)
 
-    runner.invoke(main.update)
 
-    utils.update_mime_types.assert_called_once()
-    utils._save_updated_mime_types.assert_called_once()
+def test_diff_invalid(runner):
+    """
+    Raise error for invalid RAML file via CLI when comparing files.
+    """
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    invalid = os.path.join(VALIDATE, "no-title.raml")
+    config_file = os.path.join(VALIDATE, "valid-config.ini")
+    result = runner.invoke(main.diff, [raml_file, invalid, "-c", config_file])
+    assert result.exit_code == 1
+    assert "is not a valid RAML file" in result.output
+
+
+def test_compile(runner, tmpdir):
+    """
+    Compile a RAML file into a Python module via CLI.
+    """
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    config_file = os.path.join(EXAMPLES, "test-config.ini")
+    output = tmpdir.join("api_spec.py")
+    result = runner.invoke(main.compile_module, [raml_file, "-c", config_file,
+                                                 "-o", str(output)])
+    assert result.exit_code == 0
+    msg = "Compiled {0} into {1}\n".format(raml_file, output)
+    assert result.output == msg
+    assert "Generated by ramlfications" in output.read()
+    assert list(tmpdir.visit("*.pyc"))
+
+    result = runner.invoke(main.compile_module, [raml_file, "-c", config_file])
+    assert result.exit_code == 0
+    assert result.output == output.read()
 
-    end_mtime = os.path.getmtime(json_path)
 
-    # sanity check that data was not written to file
-    assert start_mtime == end_mtime
+def test_compile_invalid(runner):
+    """
+    Raise error for invalid RAML file via CLI when compiling.
+    """
+    raml_file = os.path.join(VALIDATE, "no-title.raml")
+    config_file = os.path.join(VALIDATE, "valid-config.ini")
+    result = runner.invoke(main.compile_module, [raml_file, "-c", config_file])
+    assert result.exit_code == 1
+    assert "is not a valid RAML file" in result.output
+
+
+def test_serve(runner, mocker, tmpdir):
+    """
+    Run the validation daemon via CLI.
+    """
+    socket_path = str(tmpdir.join("daemon.sock"))
+    server = mocker.patch("ramlfications.daemon.ValidationServer")
+    server.return_value.serve_forever.side_effect = KeyboardInterrupt
+
+    result = runner.invoke(main.serve, ["--socket", socket_path])
+
+    exp_msg = "Validating RAML files sent to {0}\n".format(socket_path)
+    check_result(0, exp_msg, result)
+    server.assert_called_once_with(socket_path, None)
+    server.return_value.server_close.assert_called_once_with()
+
+
+def test_validate_daemon(runner, mocker, tmpdir):
+    """
+    Validate RAML files via a validation daemon.
+    """
+    socket_path = tmpdir.join("daemon.sock")
+    socket_path.write("")
+    raml_file = os.path.join(VALIDATE, "no-title.raml")
+    request = mocker.patch("ramlfications.daemon.request")
+    request.return_value = {"valid": True, "errors": []}
+
+    result = runner.invoke(main.validate, [raml_file, "--fail-fast",
+                                           "--daemon", str(socket_path)])
+
+    exp_msg = "Success! Valid RAML file: {0}\n".format(raml_file)
+    check_result(0, exp_msg, result)
+    request.assert_called_once_with(str(socket_path), raml_file, None, 1)
+
+    request.return_value = {
+        "valid": False,
+        "errors": ["InvalidRootNodeError: RAML File does not define an "
+                   "API title."]
+    }
+    result = runner.invoke(main.validate, [raml_file,
+                                           "--daemon", str(socket_path)])
+    exp_msg = ("Error validating file {0}: \n\n\tInvalidRootNodeError: "
+               "RAML File does not define an API title.\n").format(raml_file)
+    check_result(1, exp_msg, result)
+
+
+def test_validate_no_daemon(runner, tmpdir):
+    """
+    Raise error when no validation daemon listens on the socket.
+    """
+    socket_path = tmpdir.join("daemon.sock")
+    socket_path.write("")
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    result = runner.invoke(main.validate, [raml_file,
+                                           "--daemon", str(socket_path)])
+    assert result.exit_code == 2
+    assert "No validation daemon at {0}".format(socket_path) in result.output
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+
+import jsonref
+import pytest
+
+from ramlfications import parse
+from ramlfications.memory import memory_report, peak_memory
+
+from .base import EXAMPLES
+
+
+@pytest.fixture(scope="module")
+def api():
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    config_file = os.path.join(EXAMPLES, "test-config.ini")
+    return parse(raml_file, config_file)
+
+
+def test_memory_report(api):
+    report = api.memory_report()
+    classes = report.classes
+    assert classes["RootNode"][0] == 1
+    assert classes["ResourceNode"][0] == len(api.resources)
+    assert classes["Response"][0] > 0
+    assert classes["str"][1] > 0
+    assert report.total == report.unique + report.shared > 0
+    assert report.peak is None
+    assert "NoneType" not in classes
+    assert "type" not in classes
+
+
+def test_memory_report_skips_config(api):
+    report = api.memory_report()
+    assert "FrozenConfig" not in report.classes
+    # the media types of the config are the largest tuple otherwise
+    media_types = memory_report(api.config["media_types"]).total
+    assert report.classes.get("tuple", [0, 0, 0])[1] < media_types
+
+
+def test_memory_report_shared():
+    shared = ["a" * 100]
+    report = memory_report({"x": shared, "y": shared, "z": ["b" * 100]})
+    assert report.classes["list"][0] == 2
+    assert report.classes["list"][1] > 0
+    assert report.classes["list"][2] > 0
+    # the shared list is reached once, so its string is unique
+    assert report.classes["str"][2] == 0
+
+
+def test_memory_report_keeps_refs_lazy():
+    data = jsonref.loads('{"a": {"b": 1}, "c": {"$ref": "#/a"}}')
+    proxy = dict.__getitem__(data, "c")
+    report = memory_report(data)
+    assert report.classes["JsonRef"][0] == 1
+    assert "cache" not in object.__getattribute__(proxy, "__dict__")
+
+
+def test_memory_report_format(api):
+    lines = api.memory_report(peak=1234).format(top=3).splitlines()
+    assert lines[0].split() == ["Class", "Count", "Unique", "(B)",
+                                "Shared", "(B)"]
+    assert len(lines) == 6
+    assert lines[-2].startswith("total")
+    assert lines[-1] == "Peak while parsing: 1234 B"
+
+
+def test_peak_memory():
+    result, peak = peak_memory(lambda n: [0] * n, 100000)
+    assert len(result) == 100000
+    assert peak >= 800000
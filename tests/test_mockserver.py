@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import json
+import threading
+from multiprocessing.pool import ThreadPool
+
+import pytest
+from six.moves import http_client
+
+from ramlfications import loads
+from ramlfications.config import setup_config
+from ramlfications.mockserver import MockServer
+from ramlfications.parser import parse_raml
+
+
+RAML = """#%RAML 0.8
+title: Mock API
+baseUri: https://api.example.com/{version}
+version: v1
+/users:
+  get:
+    responses:
+      404:
+      200:
+        headers:
+          X-Total:
+            example: 2
+        body:
+          application/json:
+            example: |
+              [{"name": "Foo"}, {"name": "Bar"}]
+          application/xml:
+            example: <users><user>Foo</user><user>Bar</user></users>
+      201:
+  post:
+    responses:
+      201:
+        body:
+          application/json:
+            example: {"name": "Baz"}
+  /{userId}:
+    delete:
+    put:
+      responses:
+        400:
+          body:
+            text/plain:
+              example: Bad user
+"""
+
+
+@pytest.fixture(scope="module")
+def server():
+    api = parse_raml(loads(RAML), setup_config())
+    server = MockServer(api)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _request(server, method, path, body=None, headers=None):
+    conn = http_client.HTTPConnection(*server.server_address[:2])
+    try:
+        conn.request(method, path, body, headers or {})
+        response = conn.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        conn.close()
+
+
+def test_lowest_success_response(server):
+    status, headers, body = _request(server, "GET", "/users")
+    assert status == 200
+    assert headers["Content-Type"] == "application/json"
+    assert headers["X-Total"] == "2"
+    assert body == b'[{"name": "Foo"}, {"name": "Bar"}]\n'
+
+
+def test_accept(server):
+    accept = {"Accept": "text/html, application/xml;q=0.9"}
+    status, headers, body = _request(server, "GET", "/users?page=2",
+                                     headers=accept)
+    assert status == 200
+    assert headers["Content-Type"] == "application/xml"
+    assert body == b"<users><user>Foo</user><user>Bar</user></users>"
+
+
+def test_parsed_example(server):
+    status, headers, body = _request(server, "POST", "/users",
+                                     body=json.dumps({"name": "Baz"}))
+    assert status == 201
+    assert json.loads(body.decode("utf-8")) == {"name": "Baz"}
+
+
+def test_no_responses(server):
+    status, headers, body = _request(server, "DELETE", "/users/foo")
+    assert status == 204
+    assert body == b""
+
+
+def test_only_error_response(server):
+    status, headers, body = _request(server, "PUT", "/users/foo")
+    assert status == 400
+    assert headers["Content-Type"] == "text/plain"
+    assert body == b"Bad user"
+
+
+def test_head(server):
+    status, headers, body = _request(server, "HEAD", "/users")
+    assert status == 200
+    assert headers["Content-Length"] == "35"
+    assert body == b""
+
+
+def test_not_found(server):
+    status, headers, body = _request(server, "GET", "/unknown")
+    assert status == 404
+    assert body == b""
+    status, _, _ = _request(server, "PATCH", "/users")
+    assert status == 404
+
+
+def test_concurrent_keep_alive(server):
+    def fetch(_):
+        conn = http_client.HTTPConnection(*server.server_address[:2])
+        try:
+            statuses = []
+            for _ in range(10):
+                conn.request("GET", "/users")
+                response = conn.getresponse()
+                response.read()
+                statuses.append(response.status)
+            return statuses
+        finally:
+            conn.close()
+
+    pool = ThreadPool(8)
+    try:
+        results = pool.map(fetch, range(16))
+    finally:
+        pool.close()
+        pool.join()
+    assert results == [[200] * 10] * 16
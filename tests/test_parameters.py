@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+
+import pytest
+
+from ramlfications import parameters, parse
+from ramlfications.parameters import Content
+from ramlfications.raml import render_all_html
+
+from .base import EXAMPLES
+
+
+@pytest.fixture
+def api():
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    config_file = os.path.join(EXAMPLES, "test-config.ini")
+    return parse(raml_file, config_file)
+
+
+def test_content_html_cached(mocker):
+    markdown = mocker.patch("markdown2.markdown",
+                            return_value="<p>foo</p>\n")
+    content = Content("foo")
+    assert content.html == "<p>foo</p>\n"
+    assert content.html == "<p>foo</p>\n"
+    markdown.assert_called_once_with("foo")
+
+
+def test_description_cached(api):
+    param = api.base_uri_params[0]
+    content = param.description
+    assert param.description is content
+
+    param.desc = "Changed"
+    assert param.description is not content
+    assert param.description.raw == "Changed"
+
+    resource = api.resources[0]
+    assert resource.description is resource.description
+
+    doc = api.documentation[0]
+    assert doc.title is doc.title
+    assert doc.content is doc.content
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_render_all_html(api, processes, mocker):
+    count = render_all_html(api, processes)
+    assert count > 0
+
+    markdown = mocker.patch("markdown2.markdown")
+    param = api.base_uri_params[0]
+    assert param.description.html.startswith("<p>")
+    assert api.documentation[0].content.html
+    markdown.assert_not_called()
+    assert render_all_html(api, processes) == 0
+
+
+def test_render_html_kept_by_api():
+    first, second = Content("*foo*"), Content("*foo*")
+    assert parameters.render_html([first, second, None]) == 1
+    assert first.html == second.html == "<p><em>foo</em></p>\n"
+    assert parameters.render_html([first, Content(None)]) == 0
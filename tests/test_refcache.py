@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import json
+import os
+
+import pytest
+
+from ramlfications import loader
+from ramlfications.errors import LoadRAMLError
+from ramlfications.refcache import RefCache
+
+
+REMOTE = {
+    "definitions": {
+        "name": {"type": "string"},
+        "id": {"type": "integer"},
+    },
+}
+
+RAML = """#%RAML 0.8
+title: Remote Refs API
+schemas:
+    - remote: !include {json_file}
+"""
+
+
+@pytest.fixture
+def raml_file(tmpdir, httpserver):
+    httpserver.serve_content(json.dumps(REMOTE), headers={
+        "ETag": '"v1"',
+        "Last-Modified": "Sun, 06 Nov 1994 08:49:37 GMT",
+    })
+    schema = {
+        "type": "object",
+        "properties": {
+            "name": {"$ref": httpserver.url + "/a.json#/definitions/name"},
+            "id": {"$ref": httpserver.url + "/b.json#/definitions/id"},
+            "other": {"$ref": httpserver.url + "/a.json#/definitions/id"},
+        },
+    }
+    json_file = tmpdir.join("remote.json")
+    json_file.write(json.dumps(schema))
+    raml = tmpdir.join("remote.raml")
+    raml.write(RAML.format(json_file=json_file.strpath))
+    return raml.strpath
+
+
+def _load(raml_file, ref_cache):
+    with open(raml_file) as f:
+        raml = loader.RAMLLoader(ref_cache=ref_cache).load(f)
+    properties = raml["schemas"][0]["remote"]["properties"]
+    return dict((k, dict(v)) for k, v in properties.items())
+
+
+EXPECTED = {
+    "name": {"type": "string"},
+    "id": {"type": "integer"},
+    "other": {"type": "integer"},
+}
+
+
+def test_prefetch(raml_file, httpserver, tmpdir):
+    cache_dir = tmpdir.join("cache").strpath
+    cache = RefCache(cache_dir)
+    assert _load(raml_file, cache) == EXPECTED
+
+    # each document is fetched once, before any reference is resolved
+    paths = sorted(r.path for r in httpserver.requests)
+    assert paths == ["/a.json", "/b.json"]
+    assert len(os.listdir(cache_dir)) == 2
+
+    # documents are kept by the cache for later parses
+    assert _load(raml_file, cache) == EXPECTED
+    assert len(httpserver.requests) == 2
+
+
+def test_conditional_request(raml_file, httpserver, tmpdir):
+    cache_dir = tmpdir.join("cache").strpath
+    _load(raml_file, RefCache(cache_dir))
+
+    httpserver.serve_content("", code=304)
+    assert _load(raml_file, RefCache(cache_dir)) == EXPECTED
+    revalidations = httpserver.requests[2:]
+    assert len(revalidations) == 2
+    for request in revalidations:
+        assert request.headers["If-None-Match"] == '"v1"'
+        assert request.headers["If-Modified-Since"] == (
+            "Sun, 06 Nov 1994 08:49:37 GMT")
+
+
+def test_offline(raml_file, httpserver, tmpdir):
+    cache_dir = tmpdir.join("cache").strpath
+    _load(raml_file, RefCache(cache_dir))
+
+    assert _load(raml_file, RefCache(cache_dir, offline=True)) == EXPECTED
+    assert len(httpserver.requests) == 2
+
+
+def test_unreachable_uses_cache(raml_file, httpserver, tmpdir):
+    cache_dir = tmpdir.join("cache").strpath
+    _load(raml_file, RefCache(cache_dir))
+
+    httpserver.serve_content("", code=503)
+    assert _load(raml_file, RefCache(cache_dir)) == EXPECTED
+
+
+def test_unreachable_not_cached(raml_file, httpserver):
+    httpserver.serve_content("", code=503)
+    with pytest.raises(LoadRAMLError) as e:
+        _load(raml_file, RefCache())
+    assert "Could not fetch remote reference" in e.value.args[0]
+
+
+def test_offline_not_cached(raml_file, tmpdir):
+    cache = RefCache(tmpdir.join("cache").strpath, offline=True)
+    with pytest.raises(LoadRAMLError) as e:
+        _load(raml_file, cache)
+    assert "is not cached (offline)" in e.value.args[0]
+
+
+def test_offline_requires_cache_dir():
+    with pytest.raises(LoadRAMLError) as e:
+        RefCache(offline=True)
+    assert e.value.args[0] == "Offline mode requires a cache directory."
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+import threading
+
+import pytest
+
+from ramlfications import loads
+from ramlfications.config import setup_config
+from ramlfications.errors import InvalidRAMLError
+from ramlfications.parser import parse_raml
+from ramlfications.registry import SpecRegistry
+
+from .base import EXAMPLES
+
+
+RAML = """#%RAML 0.8
+title: {title}
+baseUri: https://{title}.example.com
+/users:
+  get:
+    queryParameters:
+      page:
+        type: integer
+        description: Page of results
+    responses:
+      200:
+        body:
+          application/json:
+            schema: |
+              {{"type": "object"}}
+"""
+
+
+def _parse(title):
+    return parse_raml(loads(RAML.format(title=title)), setup_config())
+
+
+class Loader(object):
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, key):
+        self.calls.append(key)
+        return _parse(key)
+
+
+@pytest.fixture
+def loader():
+    return Loader()
+
+
+def test_get_loads_once(loader):
+    registry = SpecRegistry(loader)
+    api = registry.get("one")
+    assert api.title == "one"
+    assert registry.get("one") is api
+    assert loader.calls == ["one"]
+    assert "one" in registry
+    assert len(registry) == 1
+    assert registry.size > 0
+
+
+def test_get_default_loader():
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    config_file = os.path.join(EXAMPLES, "test-config.ini")
+    registry = SpecRegistry(config_file=config_file)
+    assert registry.get(raml_file).title == "Example Web API"
+
+
+def test_shares_equal_objects(loader):
+    registry = SpecRegistry(loader)
+    one = registry.get("one").resources[0]
+    two = registry.get("two").resources[0]
+    assert one.root is not two.root
+    assert one.query_params[0] is two.query_params[0]
+    assert one.responses[0] is two.responses[0]
+    assert one.responses[0].body[0].schema is \
+        two.responses[0].body[0].schema
+
+
+def test_interns_strings(loader):
+    registry = SpecRegistry(loader)
+    one = registry.get("one").resources[0]
+    two = registry.get("two").resources[0]
+    # nodes are not shared, but their strings are
+    assert one is not two
+    assert one.path is two.path
+    assert one.display_name is two.display_name
+
+
+def test_evict_max_specs(loader):
+    registry = SpecRegistry(loader, max_specs=2)
+    registry.get("one")
+    registry.get("two")
+    registry.get("one")
+    registry.get("three")
+    assert registry.keys() == ["one", "three"]
+
+    registry.get("two")
+    assert loader.calls == ["one", "two", "three", "two"]
+
+
+def test_evict_max_bytes(loader):
+    registry = SpecRegistry(loader, max_bytes=250, size=lambda root: 100)
+    for key in ("one", "two", "three"):
+        registry.get(key)
+    assert registry.keys() == ["two", "three"]
+    assert registry.size == 200
+
+
+def test_keeps_most_recent_over_budget(loader):
+    registry = SpecRegistry(loader, max_bytes=1)
+    registry.get("one")
+    registry.get("two")
+    assert registry.keys() == ["two"]
+
+
+def test_releases_shared_objects(loader):
+    registry = SpecRegistry(loader)
+    registry.get("one")
+    shared = len(registry._interner)
+    assert shared > 0
+    registry.get("two")
+    registry.discard("one")
+    assert len(registry._interner) == shared
+    registry.clear()
+    assert len(registry._interner) == 0
+    assert registry.size == 0
+    assert len(registry) == 0
+
+
+def test_single_flight():
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def loader(key):
+        calls.append(key)
+        started.set()
+        release.wait(5)
+        return _parse(key)
+
+    registry = SpecRegistry(loader)
+    results = []
+
+    def get():
+        results.append(registry.get("one"))
+
+    threads = [threading.Thread(target=get) for _ in range(8)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == ["one"]
+    assert len(results) == 8
+    assert all(r is results[0] for r in results)
+
+
+def test_failed_load_not_kept():
+    calls = []
+
+    def loader(key):
+        calls.append(key)
+        if len(calls) == 1:
+            raise InvalidRAMLError(["broken"])
+        return _parse(key)
+
+    registry = SpecRegistry(loader)
+    with pytest.raises(InvalidRAMLError):
+        registry.get("one")
+    assert "one" not in registry
+    assert registry.get("one").title == "one"
+    assert calls == ["one", "one"]
+
+
+def test_hits_not_blocked_by_interning(loader, monkeypatch):
+    registry = SpecRegistry(loader)
+    registry.get("one")
+    interning, release = threading.Event(), threading.Event()
+    add = registry._interner.add
+
+    def slow_add(root):
+        interning.set()
+        release.wait(5)
+        return add(root)
+
+    monkeypatch.setattr(registry._interner, "add", slow_add)
+    thread = threading.Thread(target=registry.get, args=("two",))
+    thread.start()
+    try:
+        assert interning.wait(5)
+        # answered while "two" is being interned
+        assert registry.get("one").title == "one"
+    finally:
+        release.set()
+        thread.join(5)
+    assert registry.keys() == ["one", "two"]
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+
+import pytest
+
+from ramlfications import loads, parse
+from ramlfications.config import setup_config
+from ramlfications.errors import InvalidParameterError
+from ramlfications.parser import parse_raml
+from ramlfications.request import RequestValidator
+
+from .base import EXAMPLES
+
+
+@pytest.fixture(scope="session")
+def api():
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    config_file = os.path.join(EXAMPLES, "test-config.ini")
+    return parse(raml_file, config_file)
+
+
+@pytest.fixture(scope="session")
+def types_api():
+    raml = loads("""#%RAML 0.8
+title: Parameter Types API
+baseUri: https://api.example.com
+/items/{itemId}:
+  uriParameters:
+    itemId:
+      type: integer
+      minimum: 1
+  get:
+    headers:
+      X-Since:
+        type: date
+    queryParameters:
+      verbose:
+        type: boolean
+      ratio:
+        type: number
+        maximum: 1.5
+      tag:
+        repeat: true
+        minLength: 2
+      sort:
+        enum: [asc, desc]
+""")
+    return parse_raml(raml, setup_config())
+
+
+def _messages(errors):
+    assert all(isinstance(e, InvalidParameterError) for e in errors)
+    return [e.args[0] for e in errors]
+
+
+def _node(api, method, path):
+    return api.match(method, path)[0]
+
+
+def test_compile_validator_cached(api):
+    node = _node(api, "GET", "/search")
+    validator = node.compile_validator()
+    assert isinstance(validator, RequestValidator)
+    assert node.compile_validator() is validator
+
+
+def test_valid_request(api):
+    node, uri_params = api.match("GET", "/thingys/1234/doodads")
+    uri_params["communityPath"] = "foo-bar"
+    validator = node.compile_validator()
+    errors = validator.validate(
+        uri_params=uri_params,
+        query_params={"thingy_type": "thingamajig", "limit": "10"},
+    )
+    assert errors == []
+
+
+def test_missing_required(api):
+    validator = _node(api, "GET", "/search").compile_validator()
+    errors = validator.validate(uri_params={"communityPath": "foo"},
+                                query_params={"type": "widget"})
+    assert _messages(errors) == ["Missing required query parameter 'q'."]
+    assert errors[0].parameter == "query"
+
+
+def test_enum_and_pattern(api):
+    validator = _node(api, "GET", "/search").compile_validator()
+    errors = validator.validate(uri_params={"communityPath": "-foo"},
+                                query_params={"q": "a", "type": "doodad"})
+    assert _messages(errors) == [
+        "'communityPath' must match pattern '^[a-zA-Z0-9][-a-zA-Z0-9]*$', "
+        "not '-foo'.",
+        "'type' must be one of ['gizmo', 'thingy', 'widget'], not 'doodad'.",
+    ]
+
+
+def test_non_string_values(api):
+    validator = _node(api, "GET", "/search").compile_validator()
+    errors = validator.validate(uri_params={"communityPath": 5},
+                                query_params={"q": 5, "type": True})
+    assert _messages(errors) == [
+        "'type' must be one of ['gizmo', 'thingy', 'widget'], not 'true'.",
+    ]
+
+    errors = validator.validate(uri_params={"communityPath": -5},
+                                query_params={"q": 5, "type": "widget"})
+    assert _messages(errors) == [
+        "'communityPath' must match pattern '^[a-zA-Z0-9][-a-zA-Z0-9]*$', "
+        "not '-5'.",
+    ]
+
+
+def test_empty_list_missing(api):
+    validator = _node(api, "GET", "/search").compile_validator()
+    errors = validator.validate(uri_params={"communityPath": "foo"},
+                                query_params={"q": [], "type": "widget"})
+    assert _messages(errors) == ["Missing required query parameter 'q'."]
+
+
+def test_integer_minimum(api):
+    validator = _node(api, "GET", "/me/widgets").compile_validator()
+    errors = validator.validate(uri_params={"communityPath": "foo"},
+                                query_params={"limit": "-1",
+                                              "offset": "one"})
+    assert _messages(errors) == [
+        "'limit' must be at least 0, not -1.",
+        "'offset' must be of type integer, not 'one'.",
+    ]
+
+
+def test_form_params_max_length(api):
+    validator = _node(api, "POST", "/form_parameters").compile_validator()
+    errors = validator.validate(uri_params={"communityPath": "foo"},
+                                form_params={"foo": "x" * 101})
+    assert _messages(errors) == [
+        "'foo' must be at most 100 characters long."
+    ]
+
+
+def test_types(types_api):
+    validator = _node(types_api, "GET", "/items/1").compile_validator()
+    errors = validator.validate(
+        uri_params={"itemId": "0"},
+        query_params={"verbose": "yes", "ratio": "2.5", "sort": "up"},
+        headers={"x-since": "yesterday"},
+    )
+    assert _messages(errors) == [
+        "'itemId' must be at least 1, not 0.",
+        "'verbose' must be of type boolean, not 'yes'.",
+        "'ratio' must be at most 1.5, not 2.5.",
+        "'sort' must be one of ['asc', 'desc'], not 'up'.",
+        "'X-Since' must be of type date, not 'yesterday'.",
+    ]
+
+    errors = validator.validate(
+        uri_params={"itemId": 3},
+        query_params={"verbose": "false", "ratio": "0.5", "tag": ["ab"]},
+        headers={"X-SINCE": "Sun, 06 Nov 1994 08:49:37 GMT"},
+    )
+    assert errors == []
+
+
+def test_repeat(types_api):
+    validator = _node(types_api, "GET", "/items/1").compile_validator()
+    errors = validator.validate(
+        uri_params={"itemId": "1"},
+        query_params={"tag": ["ab", "c"], "sort": ["asc", "desc"]},
+    )
+    assert _messages(errors) == [
+        "'tag' must be at least 2 characters long.",
+        "Query parameter 'sort' can not be repeated.",
+    ]
+
+    errors = validator.validate(uri_params={"itemId": "1"},
+                                query_params={"tag": [7]})
+    assert _messages(errors) == ["'tag' must be at least 2 characters long."]
+
+
+def test_invalid_pattern(types_api):
+    node = _node(types_api, "GET", "/items/1")
+    node.query_params[-1].pattern = "(unclosed"
+    try:
+        with pytest.raises(InvalidParameterError) as e:
+            RequestValidator(node)
+        assert "Invalid pattern for query 'sort'" in e.value.args[0]
+    finally:
+        node.query_params[-1].pattern = None
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+
+import pytest
+
+from ramlfications import loads, parse
+from ramlfications.config import setup_config
+from ramlfications.parser import parse_raml
+from ramlfications.router import Router
+
+from .base import EXAMPLES
+
+
+@pytest.fixture(scope="session")
+def github():
+    raml_file = os.path.join(EXAMPLES, "github.raml")
+    config_file = os.path.join(EXAMPLES, "github-config.ini")
+    return parse(raml_file, config_file)
+
+
+@pytest.fixture(scope="session")
+def twitter():
+    raml_file = os.path.join(EXAMPLES, "twitter.raml")
+    config_file = os.path.join(EXAMPLES, "twitter-config.ini")
+    return parse(raml_file, config_file)
+
+
+@pytest.fixture(scope="session")
+def routes():
+    raml = loads("""#%RAML 0.8
+title: Router API
+baseUri: https://api.example.com/{region}/{version}
+version: v1
+baseUriParameters:
+  region:
+    type: string
+/users:
+  get:
+  /me:
+    put:
+  /{userId}:
+    get:
+    put:
+    /files{mediaTypeExtension}:
+      get:
+/nomethods:
+  displayName: No Methods
+""")
+    return parse_raml(raml, setup_config())
+
+
+def _match(api, method, url):
+    node, params = api.match(method, url)
+    return node.method, node.path, params
+
+
+def test_match_static(github):
+    result = _match(github, "GET", "/user/repos")
+    assert result == ("get", "/user/repos", {})
+
+
+def test_match_uri_params(github):
+    result = _match(github, "get", "/users/octocat/repos")
+    assert result == ("get", "/users/{userId}/repos", {"userId": "octocat"})
+
+
+def test_match_absolute_url(github):
+    url = "https://api.github.com/repos/foo/bar/contents/README%20x?ref=a"
+    result = _match(github, "GET", url)
+    expected_params = {"ownerId": "foo", "repoId": "bar", "path": "README x"}
+    assert result == ("get", "/repos/{ownerId}/{repoId}/contents/{path}",
+                      expected_params)
+
+
+def test_match_prefers_static(github):
+    result = _match(github, "GET", "/user/emails")
+    assert result == ("get", "/user/emails", {})
+    result = _match(github, "GET", "/user/octocat")
+    assert result == ("get", "/user/{userId}", {"userId": "octocat"})
+
+
+def test_match_media_type_extension(twitter):
+    url = "https://api.twitter.com/1.1/statuses/show/123.json"
+    result = _match(twitter, "GET", url)
+    expected_params = {"id": "123", "mediaTypeExtension": ".json"}
+    assert result == ("get", "/statuses/show/{id}{mediaTypeExtension}",
+                      expected_params)
+
+
+def test_match_wrong_base_uri(twitter):
+    url = "https://api.twitter.com/2/statuses/show/123.json"
+    assert twitter.match("GET", url) is None
+
+
+def test_match_wrong_host(github):
+    assert github.match("GET", "https://evil.example.com/users/foo") is None
+    assert github.match("GET", "http://api.github.com/users/foo") is None
+    assert github.match("GET", "https://api.github.com:8443/users/foo") is None
+
+    result = _match(github, "GET", "HTTPS://API.GitHub.com/users/foo")
+    assert result == ("get", "/users/{userId}", {"userId": "foo"})
+
+
+def test_match_base_uri_host_params():
+    raml = loads("""#%RAML 0.8
+title: Hosts API
+baseUri: http://{bucket}.example.com/
+protocols: [HTTP, HTTPS]
+/files:
+  get:
+""")
+    api = parse_raml(raml, setup_config())
+    result = _match(api, "GET", "https://photos.example.com/files")
+    assert result == ("get", "/files", {"bucket": "photos"})
+    assert api.match("GET", "https://photos.example.org/files") is None
+    assert api.match("GET", "ftp://photos.example.com/files") is None
+
+
+def test_match_base_uri_params(routes):
+    url = "https://api.example.com/eu/v1/users/me"
+    result = _match(routes, "PUT", url)
+    assert result == ("put", "/users/me", {"region": "eu"})
+    assert routes.match("PUT", "https://api.example.com/eu/v2/users") is None
+
+
+def test_match_falls_back_to_uri_param(routes):
+    result = _match(routes, "GET", "/users/me")
+    assert result == ("get", "/users/{userId}", {"userId": "me"})
+
+
+def test_match_nested_mixed_segment(routes):
+    result = _match(routes, "GET", "/users/me/files.xml")
+    expected_params = {"userId": "me", "mediaTypeExtension": ".xml"}
+    assert result == ("get", "/users/{userId}/files{mediaTypeExtension}",
+                      expected_params)
+
+
+def test_match_no_methods(routes):
+    result = _match(routes, None, "/nomethods/")
+    assert result == (None, "/nomethods", {})
+
+
+def test_no_match(routes):
+    assert routes.match("DELETE", "/users/me") is None
+    assert routes.match("GET", "/users/me/files") is None
+    assert routes.match("GET", "/unknown") is None
+
+
+def test_router_built_once(routes):
+    routes.match("GET", "/users")
+    router = routes._router
+    routes.match("GET", "/users/me")
+    assert routes._router is router
+    assert isinstance(router, Router)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+
+import pytest
+
+from ramlfications import parse, schema, serialize
+from ramlfications.errors import InvalidParameterError
+
+from .base import EXAMPLES, JSONREF
+
+jsonschema = pytest.importorskip("jsonschema")
+
+
+@pytest.fixture
+def recursive():
+    schema.clear_cache()
+    return parse(os.path.join(JSONREF, "jsonref_recursive.raml"))
+
+
+def _messages(errors):
+    assert all(isinstance(e, InvalidParameterError) for e in errors)
+    return [e.args[0] for e in errors]
+
+
+def test_validate_payload(recursive):
+    body = recursive.resources[1].body[0]
+    assert body.validate({"name": "a", "children": [{"name": "b"}]}) == []
+
+    errors = body.validate({"name": "a", "children": [{"name": 1}]})
+    assert _messages(errors) == [
+        "/children/0/name: 1 is not of type 'string'"
+    ]
+
+
+def test_validate_raw_payload(recursive):
+    body = recursive.resources[1].body[0]
+    assert body.validate(b'{"name": "a"}', raw=True) == []
+    assert body.validate(u'{"name": "a"}', raw=True) == []
+
+    errors = body.validate(b'{"children": []}', raw=True)
+    assert _messages(errors) == ["/: 'name' is a required property"]
+
+    errors = body.validate(b'{"name": ', raw=True)
+    assert _messages(errors)[0].startswith("Body is not valid JSON: ")
+
+
+def test_validators_shared_between_bodies(recursive):
+    request_body = recursive.resources[1].body[0]
+    response_body = recursive.resources[0].responses[0].body[0]
+    request_body.validate({"name": "a"})
+    response_body.validate({"name": "a"})
+
+    assert request_body._validator[1] is response_body._validator[1]
+
+
+def test_validators_shared_for_equal_schemas():
+    schema.clear_cache()
+    first = schema.get_validator({"type": "string"})
+    second = schema.get_validator({"type": "string"})
+    other = schema.get_validator({"type": "integer"})
+
+    assert first is second
+    assert first is not other
+
+
+def test_validators_least_recently_used_dropped(monkeypatch):
+    schema.clear_cache()
+    monkeypatch.setattr(schema, "MAX_VALIDATORS", 2)
+    string = schema.get_validator({"type": "string"})
+    integer = schema.get_validator({"type": "integer"})
+    assert schema.get_validator({"type": "string"}) is string
+    schema.get_validator({"type": "number"})
+
+    assert len(schema._VALIDATORS) == 2
+    assert schema.get_validator({"type": "string"}) is string
+    assert schema.get_validator({"type": "integer"}) is not integer
+
+
+def test_validators_shared_for_equal_recursive_schemas():
+    schema.clear_cache()
+    first = {"type": "object", "properties": {}}
+    first["properties"]["child"] = first
+    second = {"type": "object", "properties": {}}
+    second["properties"]["child"] = second
+    other = {"type": "object", "properties": {"child": {}}}
+    other["properties"]["child"]["properties"] = {"child": other}
+
+    assert schema.get_validator(first) is schema.get_validator(second)
+    assert schema.get_validator(first) is not schema.get_validator(other)
+
+
+def test_validate_no_schema():
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    config_file = os.path.join(EXAMPLES, "test-config.ini")
+    api = parse(raml_file, config_file)
+    body = api.match("GET", "/search")[0].body[0]
+
+    assert body.mime_type == "application/x-www-form-urlencoded"
+    assert body.schema is None
+    assert body.validate({"anything": True}) == []
+
+
+def test_validate_not_json_schema(recursive):
+    body = recursive.resources[1].body[0]
+    original = body.schema
+    body.schema = "<xs:schema/>"
+    try:
+        with pytest.raises(InvalidParameterError) as e:
+            body.validate({})
+    finally:
+        body.schema = original
+    msg = ("Body schema for 'application/json' is not a JSON schema.",)
+    assert e.value.args == msg
+
+
+def test_validate_xml_schema(tmpdir):
+    pytest.importorskip("xmltodict")
+    xsd = os.path.join(EXAMPLES, "includes", "thingy.xsd")
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write(
+        "#%RAML 0.8\ntitle: Example\nbaseUri: https://example.com\n"
+        "/thingy:\n  post:\n    body:\n      application/xml:\n"
+        "        schema: !include {0}\n".format(xsd))
+    body = parse(str(raml_file)).resources[0].body[0]
+    assert isinstance(body.schema, dict)
+
+    with pytest.raises(InvalidParameterError) as e:
+        body.validate("<thingy><name>a</name></thingy>")
+    msg = ("Body schema for 'application/xml' is not a JSON schema.",)
+    assert e.value.args == msg
+
+
+def test_is_json():
+    assert schema.is_json("application/json")
+    assert schema.is_json("application/json; charset=utf-8")
+    assert schema.is_json("application/vnd.api+json")
+    assert not schema.is_json("application/xml")
+    assert not schema.is_json("text/plain")
+    assert not schema.is_json(None)
+
+
+def test_validator_not_serialized(recursive):
+    body = recursive.resources[1].body[0]
+    body.validate({"name": "a"})
+    loaded = serialize.loads(serialize.dumps(recursive))
+
+    loaded_body = loaded.resources[1].body[0]
+    assert "_validator" not in loaded_body.__dict__
+    assert loaded_body.validate({"name": 1})
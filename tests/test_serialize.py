@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import io
+import os
+
+import pytest
+
+from ramlfications import load_parsed, parse, serialize
+from ramlfications.errors import LoadRAMLError
+
+from .base import EXAMPLES, JSONREF
+
+
+@pytest.fixture(scope="session")
+def api():
+    raml_file = os.path.join(EXAMPLES, "github.raml")
+    config_file = os.path.join(EXAMPLES, "github-config.ini")
+    return parse(raml_file, config_file)
+
+
+@pytest.fixture(scope="session")
+def loaded_api(api):
+    buf = io.BytesIO()
+    api.dump(buf)
+    buf.seek(0)
+    return load_parsed(buf)
+
+
+def test_dump_load_roundtrip(api, loaded_api):
+    assert loaded_api.title == api.title
+    assert loaded_api.base_uri == api.base_uri
+    assert len(loaded_api.resources) == len(api.resources)
+    for old, new in zip(api.resources, loaded_api.resources):
+        assert new.path == old.path
+        assert new.method == old.method
+        assert new.absolute_uri == old.absolute_uri
+        assert new.raw == old.raw
+
+
+def test_dump_load_keeps_shared_objects(loaded_api):
+    for res in loaded_api.resources:
+        assert res.root is loaded_api
+        assert res.errors is loaded_api.errors
+        if res.parent:
+            assert res.parent in loaded_api.resources
+    trait_params = {}
+    for trait in loaded_api.traits:
+        for p in trait.query_params or []:
+            trait_params[id(p)] = p
+    inherited = [p for res in loaded_api.resources
+                 for p in res.query_params or []
+                 if id(p) in trait_params]
+    assert inherited
+
+
+def test_dump_load_resolves_recursive_refs():
+    api = parse(os.path.join(JSONREF, "jsonref_recursive.raml"))
+    loaded = serialize.loads(serialize.dumps(api))
+
+    schema = loaded.resources[1].body[0].schema
+    assert schema["properties"]["children"]["items"] is schema
+
+
+def test_load_not_serialized():
+    with pytest.raises(LoadRAMLError) as e:
+        load_parsed(io.BytesIO(b"#%RAML 0.8\ntitle: foo\n"))
+    assert e.value.args == ("Not a serialized RAML API.",)
+
+
+def test_load_truncated():
+    with pytest.raises(LoadRAMLError) as e:
+        load_parsed(io.BytesIO(b"RAML"))
+    assert "truncated" in e.value.args[0]
+
+
+def test_load_version_mismatch(api, monkeypatch):
+    data = serialize.dumps(api)
+    monkeypatch.setattr(serialize, "__version__", "0.0.1")
+    with pytest.raises(LoadRAMLError) as e:
+        serialize.loads(data)
+    assert "expected 0.0.1" in e.value.args[0]
+
+
+def test_dumps_module(api):
+    source = serialize.dumps_module(api, "github.raml")
+    assert "from github.raml" in source
+    namespace = {}
+    exec(compile(source, "api_spec.py", "exec"), namespace)
+    compiled = namespace["api"]
+    assert namespace["FINGERPRINT"] == api.fingerprint
+    assert "_DATA" not in namespace
+    assert compiled.title == api.title
+    assert len(compiled.resources) == len(api.resources)
+    # fingerprints come along and need not be computed again
+    assert compiled.__dict__["_fingerprint"] == api.fingerprint
+    assert compiled == api
+
+
+def test_dump_module(api):
+    buf = io.StringIO()
+    serialize.dump_module(api, buf)
+    assert buf.getvalue() == serialize.dumps_module(api)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+
+import pytest
+
+from ramlfications import parse, validate
+from ramlfications.errors import InvalidRAMLError
+from ramlfications.stats import ParseStats, timed
+
+from .base import EXAMPLES, JSONREF, VALIDATE
+
+
+def test_parse_stats():
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    config_file = os.path.join(EXAMPLES, "test-config.ini")
+    stats = ParseStats()
+    api = parse(raml_file, config_file, stats=stats)
+
+    assert set(stats.phases) == set([
+        "load", "includes", "create_root", "create_sec_schemes",
+        "create_traits", "create_resource_types", "create_resources"
+    ])
+    for wall, cpu in stats.phases.values():
+        assert wall >= 0 and cpu >= 0
+    assert stats.total[0] == pytest.approx(
+        sum(t[0] for t in stats.phases.values()))
+
+    nodes = (len(api.security_schemes) + len(api.traits) +
+             len(api.resource_types) + len(api.resources))
+    assert stats.counts["nodes"] == nodes
+    assert stats.counts["parameters"] > 0
+    assert stats.counts["bodies"] > 0
+    assert stats.counts["responses"] > 0
+
+    table = stats.format().splitlines()
+    assert table[0].split() == ["Phase", "Wall", "(ms)", "CPU", "(ms)"]
+    assert table[-2].startswith("total")
+    assert table[-1].startswith("nodes: {0}, ".format(nodes))
+
+
+def test_parse_without_stats():
+    raml_file = os.path.join(EXAMPLES, "complete-valid-example.raml")
+    api = parse(raml_file)
+    assert api.title == "Example Web API"
+
+
+def test_validate_stats_on_error():
+    raml_file = os.path.join(VALIDATE, "no-base-uri-no-title.raml")
+    stats = ParseStats()
+    with pytest.raises(InvalidRAMLError):
+        validate(raml_file, stats=stats)
+    assert "load" in stats.phases
+    assert "create_root" in stats.phases
+
+
+def test_nested_includes_counted_once():
+    raml_file = os.path.join(JSONREF, "jsonref_relative_local_includes.raml")
+    stats = ParseStats()
+    parse(raml_file, stats=stats)
+    assert "includes" in stats.phases
+    assert not any(stats._depth.values())
+
+
+def test_phase_exclude(mocker):
+    clock = iter([0.0, 1.0, 3.0, 10.0])
+    mocker.patch("ramlfications.stats.default_timer",
+                 side_effect=lambda: next(clock))
+    mocker.patch("ramlfications.stats.cpu_timer", return_value=0.0)
+    stats = ParseStats()
+    with stats.phase("outer", exclude="inner"):
+        with stats.phase("inner"):
+            pass
+    assert stats.phases["inner"] == [2.0, 0.0]
+    assert stats.phases["outer"] == [8.0, 0.0]
+
+
+def test_timed_without_stats():
+    with timed(None, "load"):
+        pass
@@ -2,7 +2,9 @@
 # Copyright (c) 2015 Spotify AB
 from __future__ import absolute_import, division, print_function
 
+import io
 import os
+import sys
 
 import pytest
 
@@ -84,3 +86,30 @@ def test_print_tree_light_vvv(api, capsys):
     out, err = capsys.readouterr()
 
     assert out == expected_result
+
+
+def test_print_tree_stream(api, capsys):
+    expected_result = tree_fixtures.tree_light
+    resources = tree._get_tree(api)
+    stream = io.StringIO()
+    tree._print_tree(api, resources, "light", 0, stream)
+
+    out, err = capsys.readouterr()
+
+    assert out == ""
+    assert stream.getvalue() == expected_result
+
+
+def test_tree_output(tmpdir, capsys):
+    raml_file = os.path.join(EXAMPLES, "simple-tree.raml")
+    config_file = os.path.join(EXAMPLES + "test-config.ini")
+    output = tmpdir.join("tree.txt")
+    stdout = sys.stdout
+    with io.open(output.strpath, "w") as f:
+        tree.tree(load_file(raml_file), None, f, 0, False, config_file)
+
+    out, err = capsys.readouterr()
+
+    assert sys.stdout is stdout
+    assert out == ""
+    assert output.read_text("utf-8") == tree_fixtures.tree_no_color
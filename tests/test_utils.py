@@ -9,9 +9,8 @@ import json
 import os
 import tempfile
 
-from mock import Mock, patch
+from mock import Mock
 import pytest
-import xmltodict
 
 from ramlfications import utils
 
@@ -40,147 +39,167 @@ def expected_data():
         return json.load(f)
 
 
-@pytest.fixture(scope="session")
-def parsed_xml(downloaded_xml):
-    with open(downloaded_xml, "r", encoding="UTF-8") as f:
-        data = f.read()
-        return xmltodict.parse(data)
+def _read(xml_file):
+    with open(xml_file, "rb") as f:
+        return f.read()
 
 
-def test_xml_to_dict(downloaded_xml):
-    with open(downloaded_xml, "r", encoding="UTF-8") as f:
-        data = f.read()
-        xml_data = utils._xml_to_dict(data)
-        assert xml_data is not None
-        assert isinstance(xml_data, dict)
+@pytest.fixture
+def output_file(tmpdir):
+    return str(tmpdir.join("mime_types.json"))
 
 
-def test_xml_to_dict_no_data(no_data_xml):
-    with pytest.raises(utils.MediaTypeError) as e:
-        with open(no_data_xml, "r", encoding="UTF-8") as f:
-            data = f.read()
-            utils._xml_to_dict(data)
+@pytest.fixture
+def iana(httpserver, downloaded_xml):
+    """Local stand-in for the IANA server."""
+    httpserver.serve_content(_read(downloaded_xml), headers={
+        "Content-Type": "application/xml",
+        "ETag": '"v1"',
+        "Last-Modified": "Wed, 15 Apr 2015 00:00:00 GMT",
+    })
+    return httpserver
 
-    msg = "Error parsing XML: "
-    assert msg in e.value.args[0]
 
+def test_parse_xml_stream(downloaded_xml, expected_data):
+    with open(downloaded_xml, "rb") as f:
+        result = utils._parse_xml_stream(f)
 
-def test_xml_to_dict_invalid(invalid_xml):
+    assert result == expected_data
+    assert len(result) == len(expected_data)
+
+
+def test_parse_xml_stream_no_data(no_data_xml):
     with pytest.raises(utils.MediaTypeError) as e:
-        with open(invalid_xml, "r", encoding="UTF-8") as f:
-            data = f.read()
-            utils._xml_to_dict(data)
+        with open(no_data_xml, "rb") as f:
+            utils._parse_xml_stream(f)
 
     msg = "Error parsing XML: "
     assert msg in e.value.args[0]
 
 
-def test_parse_xml_data(parsed_xml, expected_data):
-    result = utils._parse_xml_data(parsed_xml)
+def test_parse_xml_stream_invalid(invalid_xml):
+    with pytest.raises(utils.MediaTypeError) as e:
+        with open(invalid_xml, "rb") as f:
+            utils._parse_xml_stream(f)
 
-    assert result == expected_data
-    assert len(result) == len(expected_data)
+    msg = "Error parsing XML: "
+    assert msg in e.value.args[0]
 
 
-@pytest.fixture(scope="session")
-def incorrect_registry_count():
+def test_parse_xml_stream_incorrect_reg():
     xml_file = os.path.join(UPDATE, "unexpected_registry_count.xml")
-    with open(xml_file, "r", encoding="UTF-8") as f:
-        data = f.read()
-        return xmltodict.parse(data)
-
-
-def test_parse_xml_data_incorrect_reg(incorrect_registry_count):
     with pytest.raises(utils.MediaTypeError) as e:
-        utils._parse_xml_data(incorrect_registry_count)
+        with open(xml_file, "rb") as f:
+            utils._parse_xml_stream(f)
 
     msg = ("Expected 9 registries but parsed 2",)
     assert e.value.args == msg
 
 
-@pytest.fixture(scope="session")
-def no_registries():
+def test_parse_xml_stream_no_reg():
     xml_file = os.path.join(UPDATE, "no_registries.xml")
-    with open(xml_file, "r", encoding="UTF-8") as f:
-        data = f.read()
-        return xmltodict.parse(data)
-
-
-def test_parse_xml_data_no_reg(no_registries):
     with pytest.raises(utils.MediaTypeError) as e:
-        utils._parse_xml_data(no_registries)
+        with open(xml_file, "rb") as f:
+            utils._parse_xml_stream(f)
 
     msg = ("No registries found to parse.",)
     assert e.value.args == msg
 
 
-def test_requests_download_xml(downloaded_xml):
-    utils.requests = Mock()
-    with open(downloaded_xml, "r", encoding="UTF-8") as xml:
-        expected = xml.read()
-        utils.requests.get.return_value.text = expected
-        results = utils._requests_download(utils.IANA_URL)
+def test_requests_download(monkeypatch):
+    monkeypatch.setattr(utils, "requests", Mock())
+    response = utils.requests.get.return_value
+    response.status_code = 200
+    response.headers = {"ETag": '"v1"'}
+    status, etag, modified, stream = utils._requests_download(
+        utils.IANA_URL, {"If-None-Match": '"v0"'})
 
-        assert results == expected
+    assert (status, etag, modified) == (200, '"v1"', None)
+    assert stream is response.raw
+    utils.requests.get.assert_called_once_with(
+        utils.IANA_URL, headers={"If-None-Match": '"v0"'}, stream=True)
 
 
-def test_urllib_download(downloaded_xml):
-    utils.urllib = Mock()
-    with open(downloaded_xml, "r", encoding="UTF-8") as xml:
-        utils.urllib.urlopen.return_value = xml
-        results = utils._urllib_download(utils.IANA_URL)
+def test_urllib_download(iana, downloaded_xml):
+    status, etag, modified, stream = utils._urllib_download(iana.url)
+    try:
+        assert (status, etag) == (200, '"v1"')
+        assert modified == "Wed, 15 Apr 2015 00:00:00 GMT"
+        assert stream.read() == _read(downloaded_xml)
+    finally:
+        stream.close()
 
-    with open(downloaded_xml, "r", encoding="UTF-8") as xml:
-        assert results == xml.read()
 
-
-@patch("ramlfications.utils._parse_xml_data")
-@patch("ramlfications.utils._xml_to_dict")
-@patch("ramlfications.utils._save_updated_mime_types")
-def test_insecure_download_urllib_flag(_a, _b, _c, mocker, monkeypatch):
+def test_insecure_download_urllib_flag(mocker, monkeypatch):
     monkeypatch.setattr(utils, "SECURE_DOWNLOAD", False)
     monkeypatch.setattr(utils, "URLLIB", True)
-    utils.requests = Mock()
+    urllib_download = mocker.patch("ramlfications.utils._urllib_download")
+
+    utils.download_url(utils.IANA_URL)
+    urllib_download.assert_called_once_with(utils.IANA_URL, None)
 
-    mocker.patch("ramlfications.utils._urllib_download")
 
-    utils.update_mime_types()
-    utils._urllib_download.assert_called_once()
+def test_secure_download_requests_flag(mocker, monkeypatch):
+    monkeypatch.setattr(utils, "SECURE_DOWNLOAD", True)
+    monkeypatch.setattr(utils, "URLLIB", False)
+    requests_download = mocker.patch("ramlfications.utils._requests_download")
 
-    mocker.stopall()
+    utils.download_url(utils.IANA_URL)
+    requests_download.assert_called_once_with(utils.IANA_URL, None)
 
 
-@patch("ramlfications.utils._xml_to_dict")
-@patch("ramlfications.utils._parse_xml_data")
-@patch("ramlfications.utils._save_updated_mime_types")
-def test_secure_download_requests_flag(_a, _b_, _c, mocker, monkeypatch):
+@pytest.fixture
+def urllib_only(monkeypatch):
+    # requests may not be installed; the stand-in server is plain HTTP
     monkeypatch.setattr(utils, "SECURE_DOWNLOAD", True)
-    monkeypatch.setattr(utils, "URLLIB", False)
-    utils.urllib = Mock()
+    monkeypatch.setattr(utils, "URLLIB", True)
+
+
+def test_update_mime_types(urllib_only, iana, output_file, expected_data):
+    assert utils.update_mime_types(iana.url, output_file) is True
+
+    with open(output_file, "r", encoding="UTF-8") as f:
+        assert json.load(f) == expected_data
+    assert "If-None-Match" not in iana.requests[0].headers
+
+
+def test_update_mime_types_unchanged(urllib_only, iana, output_file):
+    utils.update_mime_types(iana.url, output_file)
+    mtime = os.path.getmtime(output_file)
+
+    iana.serve_content("", code=304)
+    assert utils.update_mime_types(iana.url, output_file) is False
+
+    headers = iana.requests[1].headers
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == "Wed, 15 Apr 2015 00:00:00 GMT"
+    assert os.path.getmtime(output_file) == mtime
+
 
-    mocker.patch("ramlfications.utils._requests_download")
+def test_update_mime_types_other_url(urllib_only, iana, output_file):
+    utils.update_mime_types(iana.url, output_file)
+    utils.update_mime_types(iana.url + "/other", output_file)
 
-    utils.update_mime_types()
-    utils._requests_download.assert_called_once()
+    assert "If-None-Match" not in iana.requests[1].headers
 
-    mocker.stopall()
 
+@pytest.mark.parametrize("xml_file,code", [
+    ("invalid_iana_download.xml", 200),
+    ("unexpected_registry_count.xml", 200),
+    ("iana_mime_media_types.xml", 503),
+])
+def test_update_mime_types_error(urllib_only, httpserver, output_file,
+                                 xml_file, code):
+    with open(output_file, "w") as f:
+        f.write("[]")
+    httpserver.serve_content(_read(os.path.join(UPDATE, xml_file)), code)
 
-@patch("ramlfications.utils._xml_to_dict")
-@patch("ramlfications.utils._parse_xml_data")
-@patch("ramlfications.utils._requests_download")
-@patch("ramlfications.utils._urllib_download")
-@patch("ramlfications.utils._save_updated_mime_types")
-def test_update_mime_types(_a, _b, _c, _d, _e, downloaded_xml):
-    utils.requests = Mock()
+    with pytest.raises(utils.MediaTypeError):
+        utils.update_mime_types(httpserver.url, output_file)
 
-    with open(downloaded_xml, "r", encoding="UTF-8") as raw_data:
-        utils.update_mime_types()
-        utils._requests_download.assert_called_once()
-        utils._requests_download.return_value = raw_data.read()
-        utils._xml_to_dict.assert_called_once()
-        utils._parse_xml_data.assert_called_once()
-        utils._save_updated_mime_types.assert_called_once()
+    with open(output_file, "r", encoding="UTF-8") as f:
+        assert f.read() == "[]"
+    assert os.listdir(os.path.dirname(output_file)) == ["mime_types.json"]
 
 
 def test_save_updated_mime_types():
@@ -3,11 +3,13 @@
 from __future__ import absolute_import, division, print_function
 
 import os
+import sys
+import threading
 
 import pytest
 
 from ramlfications import errors
-from ramlfications import validate
+from ramlfications import parse, validate
 
 from .base import VALIDATE
 
@@ -87,6 +89,24 @@ def test_undefined_base_uri_and_title():
     assert isinstance(e.value.errors[1], errors.InvalidRootNodeError)
 
 
+def test_max_errors_stops_early():
+    raml = load_raml("no-base-uri-no-title.raml")
+    config = load_config("valid-config.ini")
+    with raises as e:
+        validate(raml, config, max_errors=1)
+    assert len(e.value.errors) == 1
+    assert isinstance(e.value.errors[0], errors.InvalidRootNodeError)
+
+
+def test_max_errors_stops_before_end_of_parse():
+    raml = load_raml("invalid-string-type.raml")
+    config = load_config("valid-config.ini")
+    with raises as e:
+        validate(raml, config, max_errors=1)
+    assert len(e.value.errors) == 1
+    assert isinstance(e.value.errors[0], errors.InvalidParameterError)
+
+
 def test_invalid_base_uri_not_defined():
     raml = load_raml("no-base-uri.raml")
     config = load_config("valid-config.ini")
@@ -351,6 +371,32 @@ def test_invalid_string_type():
     assert _error_exists(e.value.errors, errors.InvalidParameterError, msg)
 
 
+def test_validate_while_parsing_without_validation():
+    raml = load_raml("invalid-string-type.raml")
+    done = threading.Event()
+
+    def parse_unvalidated():
+        while not done.is_set():
+            parse(raml, load_config("validation-off.ini"))
+
+    thread = threading.Thread(target=parse_unvalidated)
+    thread.daemon = True
+    # switch threads often, in the middle of parsing
+    interval = getattr(sys, "getswitchinterval", lambda: None)()
+    if interval is not None:
+        sys.setswitchinterval(1e-6)
+    thread.start()
+    try:
+        for _ in range(100):
+            with raises:
+                validate(raml, load_config("valid-config.ini"))
+    finally:
+        done.set()
+        thread.join(5)
+        if interval is not None:
+            sys.setswitchinterval(interval)
+
+
 #####
 # ResourceType, Trait, and Security Scheme validators
 #####